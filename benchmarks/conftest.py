@@ -0,0 +1,26 @@
+"""
+Benchmarks of reading and writing egrid files, run with
+
+    pytest benchmarks --max-cells 1e6
+
+The benchmarked sizes go from 1e4 cells up to --max-cells (at most 1e8).
+"""
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--max-cells",
+        type=float,
+        default=1e5,
+        help="Largest grid size (in cells) to benchmark",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    max_cells = config.getoption("--max-cells")
+    skip = pytest.mark.skip(reason="larger than --max-cells")
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and callspec.params.get("num_cells", 0) > max_cells:
+            item.add_marker(skip)
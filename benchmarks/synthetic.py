@@ -0,0 +1,123 @@
+"""
+Builders of synthetic egrids of any size for the benchmarks.
+
+Unlike the hypothesis strategies in tests/egrid_generator.py these build a
+single deterministic grid directly with numpy, so they scale to grids of
+1e8 cells.
+"""
+import numpy as np
+
+import eclio.egrid as eio
+from eclio.geometry import corners_to_zcorn
+
+#: The grid sizes (in cells) of the benchmarks.
+SIZES = [10**4, 10**5, 10**6, 10**7, 10**8]
+
+
+def grid_dimensions(num_cells: int, max_layers: int = 100):
+    """Dimensions (nx, ny, nz) with nx == ny and about num_cells cells."""
+    nz = max(1, min(max_layers, round(num_cells ** (1 / 3))))
+    nx = max(1, round((num_cells / nz) ** 0.5))
+    return nx, nx, nz
+
+
+def grid_head(dims, lgr_index=0) -> eio.GridHead:
+    nx, ny, nz = dims
+    return eio.GridHead(
+        eio.TypeOfGrid.CORNER_POINT,
+        nx,
+        ny,
+        nz,
+        lgr_index,
+        1,
+        1,
+        eio.CoordinateType.CARTESIAN,
+        (0, 0, 0),
+        (0, 0, 0),
+    )
+
+
+def geometry(dims, rng, cell_size=(50.0, 50.0, 2.0), depth=1000.0):
+    """
+    COORD, ZCORN and ACTNUM of a grid with vertical pillars and layers with
+    randomly perturbed depths, as in a typical reservoir model.
+    """
+    nx, ny, nz = dims
+    dx, dy, dz = cell_size
+    x, y = np.meshgrid(dx * np.arange(nx + 1), dy * np.arange(ny + 1))
+    coord = np.stack(
+        [x, y, np.full_like(x, depth), x, y, np.full_like(x, depth + dz * nz)],
+        axis=-1,
+    ).astype(np.float32)
+    # layer boundaries per pillar, with a smooth random thickness variation
+    thickness = dz * (1 + 0.5 * rng.random((nx + 1, ny + 1, 1), dtype=np.float32))
+    boundaries = depth + thickness * np.arange(nz + 1, dtype=np.float32)
+    corners = np.empty((nx, ny, nz, 2, 2, 2), dtype=np.float32)
+    for dk in range(2):
+        for dj in range(2):
+            for di in range(2):
+                corners[:, :, :, dk, dj, di] = boundaries[
+                    di : di + nx, dj : dj + ny, dk : dk + nz
+                ]
+    actnum = (rng.random(nx * ny * nz) > 0.1).astype(np.int32)
+    return coord.reshape(-1), corners_to_zcorn(corners), actnum
+
+
+def synthetic_egrid(
+    num_cells: int,
+    num_lgrs: int = 0,
+    num_nncs: int = 0,
+    lgr_dims=(10, 10, 10),
+    seed: int = 0,
+) -> eio.EGrid:
+    """
+    An egrid with about num_cells cells in the global grid.
+
+    Args:
+        num_cells: Approximate number of cells in the global grid.
+        num_lgrs: Number of LGRs, each refining one global cell into
+            lgr_dims cells.
+        num_nncs: Number of nncs between random global cells.
+        seed: Seed of the random perturbations.
+    """
+    rng = np.random.default_rng(seed)
+    dims = grid_dimensions(num_cells)
+    coord, zcorn, actnum = geometry(dims, rng)
+    global_grid = eio.GlobalGrid(
+        grid_head=grid_head(dims), coord=coord, zcorn=zcorn, actnum=actnum
+    )
+    total = int(np.prod(dims))
+    hosts = rng.choice(total, size=min(num_lgrs, total), replace=False) + 1
+    lgr_sections = []
+    for number, host in enumerate(hosts):
+        lgr_coord, lgr_zcorn, lgr_actnum = geometry(lgr_dims, rng)
+        lgr_sections.append(
+            eio.LGRSection(
+                name=f"LGR{number + 1}",
+                grid_head=grid_head(lgr_dims, number + 1),
+                coord=lgr_coord,
+                zcorn=lgr_zcorn,
+                actnum=lgr_actnum,
+                hostnum=np.full(int(np.prod(lgr_dims)), host, dtype=np.int32),
+            )
+        )
+    nnc_sections = []
+    if num_nncs > 0:
+        nnc_sections.append(
+            eio.NNCSection(
+                eio.NNCHead(num_nncs, 0),
+                rng.integers(1, total + 1, num_nncs, dtype=np.int32),
+                rng.integers(1, total + 1, num_nncs, dtype=np.int32),
+            )
+        )
+    head = eio.EGridHead(
+        eio.Filehead(
+            3,
+            2007,
+            0,
+            eio.TypeOfGrid.CORNER_POINT,
+            eio.RockModel.SINGLE_PERMEABILITY_POROSITY,
+            eio.GridFormat.IRREGULAR_CORNER_POINT,
+        )
+    )
+    return eio.EGrid(head, global_grid, lgr_sections, nnc_sections)
@@ -0,0 +1,69 @@
+import tracemalloc
+
+import pytest
+
+from eclio.egrid import EGrid
+
+from .synthetic import SIZES, synthetic_egrid
+
+FORMATS = ["egrid", "fegrid"]
+SUBSECTIONS = [(0, 0), (10, 1000)]
+
+
+def peak_allocated_mb(function, *args) -> float:
+    """
+    The peak memory allocated by one call of function in MB, as traced by
+    tracemalloc (which includes numpy array data). Run separately from the
+    timed rounds, as tracing slows down allocation.
+    """
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def record_throughput(benchmark, path, num_cells, function, *args):
+    mean = benchmark.stats.stats.mean
+    benchmark.extra_info["file_mb"] = path.stat().st_size / 2**20
+    benchmark.extra_info["mb_per_s"] = path.stat().st_size / 2**20 / mean
+    benchmark.extra_info["cells_per_s"] = num_cells / mean
+    benchmark.extra_info["peak_allocated_mb"] = peak_allocated_mb(function, *args)
+
+
+@pytest.fixture(scope="module")
+def grids():
+    cache = {}
+
+    def get(num_cells, num_lgrs, num_nncs):
+        key = (num_cells, num_lgrs, num_nncs)
+        if key not in cache:
+            cache.clear()
+            cache[key] = synthetic_egrid(num_cells, num_lgrs, num_nncs)
+        return cache[key]
+
+    return get
+
+
+@pytest.mark.parametrize("num_lgrs, num_nncs", SUBSECTIONS)
+@pytest.mark.parametrize("fileformat", FORMATS)
+@pytest.mark.parametrize("num_cells", SIZES)
+def test_write(benchmark, tmp_path, grids, num_cells, fileformat, num_lgrs, num_nncs):
+    grid = grids(num_cells, num_lgrs, num_nncs)
+    path = tmp_path / f"grid.{fileformat}"
+    benchmark.pedantic(grid.to_file, args=(path, fileformat), rounds=3)
+    record_throughput(benchmark, path, num_cells, grid.to_file, path, fileformat)
+
+
+@pytest.mark.parametrize("num_lgrs, num_nncs", SUBSECTIONS)
+@pytest.mark.parametrize("fileformat", FORMATS)
+@pytest.mark.parametrize("num_cells", SIZES)
+def test_read(benchmark, tmp_path, grids, num_cells, fileformat, num_lgrs, num_nncs):
+    grid = grids(num_cells, num_lgrs, num_nncs)
+    path = tmp_path / f"grid.{fileformat}"
+    grid.to_file(path, fileformat)
+    result = benchmark.pedantic(EGrid.from_file, args=(path, fileformat), rounds=3)
+    record_throughput(benchmark, path, num_cells, EGrid.from_file, path, fileformat)
+    assert result.global_grid.grid_head == grid.global_grid.grid_head
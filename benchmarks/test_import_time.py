@@ -0,0 +1,32 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+STATEMENTS = [
+    "import eclio",
+    "from eclio.ecl_output_file import Units",
+    "from eclio.egrid import EGrid",
+]
+
+
+def run_python(statement):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.fixture(scope="module")
+def startup_time():
+    """The fastest of five starts of python doing nothing."""
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        run_python("pass")
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("statement", STATEMENTS)
+def test_import_time(benchmark, startup_time, statement):
+    benchmark.pedantic(run_python, args=(statement,), rounds=5)
+    benchmark.extra_info["import_s"] = benchmark.stats.stats.min - startup_time
@@ -20,6 +20,13 @@ setup(
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     install_requires=["dataclasses>=0.6;python_version<'3.7'", "numpy", "ecl_data_io"],
+    extras_require={
+        "arrow": ["pyarrow"],
+        "zstd": ["zstandard"],
+        "lz4": ["lz4"],
+        "zarr": ["zarr>=2,<3"],
+    },
+    entry_points={"console_scripts": ["eclio = eclio.cli:main"]},
     platforms="any",
     classifiers=[
         "Development Status :: 1 - Planning",
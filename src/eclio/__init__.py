@@ -1,6 +1,43 @@
-import eclio.version
+"""
+eclio reads and writes output files of ecl simulators.
+
+The submodules are imported on first use, so that importing
+:mod:`eclio.ecl_output_file` for its enums does not import numpy and
+ecl_data_io. The names below are also available from the package itself
+(eg. ``eclio.probe``), importing their submodule when first accessed.
+"""
+import importlib
+import sys
 
 __author__ = "Equinor"
 __email__ = "fg_sib-scout@equinor.com"
 
-__version__ = eclio.version.version
+_LAZY_ATTRIBUTES = {
+    "DiskGridCache": "eclio.cache",
+    "GridCache": "eclio.cache",
+    "scan_directory": "eclio.catalog",
+    "EGridProbe": "eclio.egrid",
+    "probe": "eclio.egrid",
+    "patch": "eclio.patching",
+    "__version__": "eclio.version",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+    value = getattr(module, "version" if name == "__version__" else name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ (PEP 562) requires python 3.7
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+    del _name
@@ -0,0 +1,5 @@
+import sys
+
+from eclio.cli import main
+
+sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Conversion of egrid data to Apache Arrow tables.
+
+This module requires pyarrow, which is an optional dependency of eclio
+(``pip install eclio[arrow]``).
+
+The cell table has one row per cell of the global grid in natural order
+with columns:
+
+* i, j, k: zero based cell indices (int32),
+* active: whether actnum is non-zero (bool),
+* lgr: the name of the LGR refining the cell, or null (dictionary),
+* x, y, z: the cell centre (float64, optional),
+* volume: the cell volume (float64, optional).
+
+The columns are built one chunk of layers at a time, so each chunk is one
+record batch (and one parquet row group).
+"""
+from typing import Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .egrid import AmalgamationSection, EGrid
+from .geometry import corner_points, hexahedron_volumes, layer_chunks
+
+
+def cell_schema(centres: bool = False, volumes: bool = False) -> pa.Schema:
+    """The schema of the cell table, see :func:`cell_batches`."""
+    columns = [
+        ("i", pa.int32()),
+        ("j", pa.int32()),
+        ("k", pa.int32()),
+        ("active", pa.bool_()),
+        ("lgr", pa.dictionary(pa.int32(), pa.string())),
+    ]
+    if centres:
+        columns += [("x", pa.float64()), ("y", pa.float64()), ("z", pa.float64())]
+    if volumes:
+        columns.append(("volume", pa.float64()))
+    return pa.schema(columns)
+
+
+def cell_batches(
+    grid: EGrid,
+    centres: bool = False,
+    volumes: bool = False,
+    layers_per_chunk: Optional[int] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    The cell table of the global grid of the egrid as record batches of
+    whole layers.
+
+    Args:
+        grid: The egrid.
+        centres: Whether to include the x, y and z columns of cell centres.
+        volumes: Whether to include the cell volume column.
+        layers_per_chunk: Number of layers in each batch, see
+            :func:`eclio.geometry.layer_chunks`.
+    """
+    global_grid = grid.global_grid
+    dims = global_grid.grid_head.dimensions
+    nx, ny, _ = dims
+    schema = cell_schema(centres, volumes)
+    lgr_names = pa.array([lgr.name for lgr in grid.lgr_sections], pa.string())
+    host_lgr = grid.lgr_tree.host_lgr()
+    actnum = global_grid.actnum
+    i = np.tile(np.arange(nx, dtype=np.int32), ny)
+    j = np.repeat(np.arange(ny, dtype=np.int32), nx)
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        start, stop = k_start * nx * ny, k_stop * nx * ny
+        num_layers = k_stop - k_start
+        if actnum is None:
+            active = np.ones(stop - start, dtype=bool)
+        else:
+            active = actnum[start:stop] != 0
+        lgr = host_lgr[start:stop].astype(np.int32)
+        columns = [
+            pa.array(np.tile(i, num_layers)),
+            pa.array(np.tile(j, num_layers)),
+            pa.array(np.repeat(np.arange(k_start, k_stop, dtype=np.int32), nx * ny)),
+            pa.array(active),
+            pa.DictionaryArray.from_arrays(
+                pa.array(lgr, mask=lgr < 0), lgr_names, safe=False
+            ),
+        ]
+        if centres or volumes:
+            points = corner_points(
+                global_grid.coord, global_grid.zcorn, dims, k_start, k_stop
+            )
+        if centres:
+            # (nx,ny,nk,3) to natural order, ie. (nk,ny,nx,3)
+            centre = points.mean(axis=(3, 4, 5)).transpose((2, 1, 0, 3))
+            centre = np.ascontiguousarray(centre).reshape((-1, 3))
+            columns += [pa.array(centre[:, axis]) for axis in range(3)]
+        if volumes:
+            volume = hexahedron_volumes(points).transpose((2, 1, 0)).reshape(-1)
+            columns.append(pa.array(volume))
+        yield pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def to_arrow(
+    grid: EGrid,
+    centres: bool = False,
+    volumes: bool = False,
+    layers_per_chunk: Optional[int] = None,
+) -> pa.Table:
+    """The cell table of the egrid, see :func:`cell_batches`."""
+    return pa.Table.from_batches(
+        cell_batches(grid, centres, volumes, layers_per_chunk),
+        schema=cell_schema(centres, volumes),
+    )
+
+
+def to_parquet(
+    grid: EGrid,
+    path,
+    centres: bool = False,
+    volumes: bool = False,
+    layers_per_chunk: Optional[int] = None,
+    **kwargs,
+):
+    """
+    Write the cell table of the egrid to a parquet file, one row group per
+    record batch of :func:`cell_batches`.
+
+    Args:
+        kwargs: Passed on to pyarrow.parquet.ParquetWriter.
+    """
+    with pq.ParquetWriter(path, cell_schema(centres, volumes), **kwargs) as writer:
+        for batch in cell_batches(grid, centres, volumes, layers_per_chunk):
+            writer.write_batch(batch)
+
+
+NNC_SCHEMA = pa.schema(
+    [
+        ("kind", pa.dictionary(pa.int8(), pa.string())),
+        ("grid1", pa.int32()),
+        ("cell1", pa.int32()),
+        ("grid2", pa.int32()),
+        ("cell2", pa.int32()),
+    ]
+)
+
+_NNC_KINDS = pa.array(["nnc", "global_lgr", "amalgamation"], pa.string())
+
+
+def _nnc_batch(kind: int, grid1: int, cell1, grid2: int, cell2) -> pa.RecordBatch:
+    size = len(cell1)
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.DictionaryArray.from_arrays(
+                pa.array(np.full(size, kind, dtype=np.int8)), _NNC_KINDS
+            ),
+            pa.array(np.full(size, grid1, dtype=np.int32)),
+            pa.array(np.asarray(cell1, dtype=np.int32)),
+            pa.array(np.full(size, grid2, dtype=np.int32)),
+            pa.array(np.asarray(cell2, dtype=np.int32)),
+        ],
+        schema=NNC_SCHEMA,
+    )
+
+
+def nnc_to_arrow(grid: EGrid) -> pa.Table:
+    """
+    The non-neighbour connections of the egrid as a table with one row per
+    connection between cell1 in grid1 and cell2 in grid2.
+
+    Grids are numbered as in the file (0 is the global grid and LGRs are
+    numbered from 1) and cells are the one based natural index within the
+    grid, as in the file. The kind column is "nnc" for connections within a
+    grid (NNC1 and NNC2), "global_lgr" for connections between an LGR and the
+    global grid (NNCL and NNCG) and "amalgamation" for connections between
+    amalgamated LGRs (NNA1 and NNA2).
+    """
+    batches = []
+    for section in grid.nnc_sections:
+        if isinstance(section, AmalgamationSection):
+            lgr1, lgr2 = section.lgr_idxs
+            batches.append(_nnc_batch(2, lgr1, section.nna1, lgr2, section.nna2))
+            continue
+        identifier = section.nnchead.grid_identifier
+        batches.append(
+            _nnc_batch(
+                0, identifier, section.upstream_nnc, identifier, section.downstream_nnc
+            )
+        )
+        if section.nncl is not None and section.nncg is not None:
+            batches.append(_nnc_batch(1, identifier, section.nncl, 0, section.nncg))
+    return pa.Table.from_batches(batches, schema=NNC_SCHEMA)
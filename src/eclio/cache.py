@@ -0,0 +1,313 @@
+"""
+Caching of decoded egrid files.
+
+:class:`GridCache` keeps recently read grids in memory, for processes which
+read the same files repeatedly. :class:`DiskGridCache` keeps the keywords of
+egrid, fegrid and egridz files as native endian .npy files in a cache
+directory, so that later reads can memory map the arrays instead of parsing
+(or decompressing) the file again::
+
+    cache = DiskGridCache("/tmp/eclio-cache", max_bytes=2**30)
+    grid = EGrid.from_file("CASE.FEGRID", cache=cache)
+
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from ecl_data_io import MESS, Format, lazy_read
+
+from .egrid import EGrid, EGridReader
+from .egridz import EGridzArchive, is_egridz
+from .geometry import Box
+
+#: Version of the layout of cache entries, part of the cache key.
+CACHE_LAYOUT_VERSION = 1
+
+_METADATA_FILE = "keywords.json"
+
+
+def default_cache_directory() -> Path:
+    """
+    The cache directory given by the ECLIO_CACHE_DIR environment variable,
+    defaulting to ~/.cache/eclio.
+    """
+    directory = os.environ.get("ECLIO_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    return Path.home() / ".cache" / "eclio"
+
+
+@contextmanager
+def _file_entries(path, fileformat: Optional[str]):
+    """The keyword entries of the egrid file at path, fileformat as in
+    :meth:`eclio.egrid.EGrid.from_file`."""
+    if fileformat == "egridz" or (fileformat is None and is_egridz(path)):
+        with EGridzArchive(path) as archive:
+            yield archive.entries()
+        return
+    if fileformat is None:
+        yield lazy_read(path)
+    elif fileformat == "egrid":
+        yield lazy_read(path, Format.UNFORMATTED)
+    elif fileformat == "fegrid":
+        yield lazy_read(path, Format.FORMATTED)
+    else:
+        raise ValueError(f"Unrecognized egrid file format {fileformat}")
+
+
+def _directory_size(directory: Path) -> int:
+    return sum(f.stat().st_size for f in directory.iterdir())
+
+
+class DiskGridCache:
+    """
+    On-disk cache of egrid, fegrid and egridz files, keyed by the absolute
+    path, modification time and size of the file.
+
+    Each cache entry is a directory of one .npy file per keyword and a json
+    file listing the keywords. Entries are evicted least recently used first
+    when the total size exceeds max_bytes.
+
+    Args:
+        directory: The directory to store the cache in, defaults to
+            :func:`default_cache_directory`.
+        max_bytes: The maximum total size of the cache entries.
+        mmap: Whether to memory map the cached arrays. The arrays of grids
+            read from memory mapped entries are read-only.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike, None] = None,
+        max_bytes: int = 2**32,
+        mmap: bool = True,
+    ):
+        if directory is None:
+            directory = default_cache_directory()
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.mmap = mmap
+
+    def key(self, path: Union[str, os.PathLike]) -> str:
+        """The cache key of the given file in its current state."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        identity = f"{CACHE_LAYOUT_VERSION}\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def load(
+        self,
+        path: Union[str, os.PathLike],
+        fileformat: Optional[str] = None,
+        box: Optional[Box] = None,
+        **reader_options,
+    ) -> EGrid:
+        """
+        Read the egrid file at path through the cache.
+
+        Args:
+            path: Path to the egrid file.
+            fileformat: "egrid", "fegrid", "egridz" or None to guess.
+            box: See :meth:`eclio.egrid.EGrid.from_file`.
+            reader_options: The on_keyword, progress and cancel arguments of
+                :meth:`eclio.egrid.EGrid.from_file`, for reading the grid
+                from the cache entry.
+        Returns:
+            The EGrid with the contents of the file.
+        """
+        if not isinstance(path, (str, os.PathLike)):
+            raise ValueError(f"Can only cache egrid files given by path, got {path}")
+        entry = self.directory / self.key(path)
+        if entry.is_dir():
+            os.utime(entry)
+        else:
+            self._store(entry, path, fileformat)
+            self.evict(keep=entry)
+        return EGridReader(
+            path, box=box, keywords=self._keywords(entry), **reader_options
+        ).read()
+
+    def _store(self, entry: Path, path, fileformat: Optional[str]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp-"))
+        try:
+            keywords: List[Tuple[str, Any]] = []
+            with _file_entries(path, fileformat) as file_entries:
+                for i, file_entry in enumerate(file_entries):
+                    array = file_entry.read_array()
+                    if array is MESS:
+                        keywords.append((file_entry.read_keyword(), None))
+                        continue
+                    array = np.asarray(array)
+                    np.save(
+                        tmp / f"{i}.npy",
+                        array.astype(array.dtype.newbyteorder("="), copy=False),
+                        allow_pickle=False,
+                    )
+                    keywords.append((file_entry.read_keyword(), f"{i}.npy"))
+            with open(tmp / _METADATA_FILE, "w") as metadata:
+                json.dump({"source": str(path), "keywords": keywords}, metadata)
+            try:
+                os.rename(tmp, entry)
+            except OSError:
+                # Another process stored the same entry concurrently
+                if not entry.is_dir():
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def _keywords(self, entry: Path) -> Iterator[Tuple[str, Any]]:
+        with open(entry / _METADATA_FILE) as metadata:
+            keywords = json.load(metadata)["keywords"]
+        mmap_mode = "r" if self.mmap else None
+        for keyword, filename in keywords:
+            if filename is None:
+                yield keyword, MESS
+            else:
+                yield keyword, np.load(
+                    entry / filename, mmap_mode=mmap_mode, allow_pickle=False
+                )
+
+    def entries(self) -> List[Path]:
+        """The directories of the cache entries, least recently used first."""
+        if not self.directory.is_dir():
+            return []
+        entries = [
+            entry
+            for entry in self.directory.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+        return sorted(entries, key=lambda entry: entry.stat().st_mtime)
+
+    def evict(self, keep: Optional[Path] = None):
+        """
+        Remove least recently used entries until within max_bytes.
+
+        Args:
+            keep: An entry which should not be removed.
+        """
+        entries = [entry for entry in self.entries() if entry != keep]
+        sizes = [_directory_size(entry) for entry in entries]
+        total = sum(sizes)
+        if keep is not None:
+            total += _directory_size(keep)
+        for entry, size in zip(entries, sizes):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove all entries of the cache."""
+        for entry in self.entries():
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def egrid_arrays(grid: EGrid) -> Iterator[np.ndarray]:
+    """The arrays of the sections of the given EGrid."""
+    sections = [grid.global_grid] + grid.lgr_sections + grid.nnc_sections
+    for section in sections:
+        for field in fields(section):
+            value = getattr(section, field.name)
+            if isinstance(value, np.ndarray):
+                yield value
+
+
+class GridCache:
+    """
+    In-memory least recently used cache of egrid files, keyed by path,
+    modification time and size of the file.
+
+    The arrays of cached grids are made read-only as the grids are shared
+    between callers. Grids are evicted least recently used first when the
+    total size of their arrays exceeds max_bytes. A grid larger than max_bytes
+    is returned without being cached.
+
+    The cache can be shared between threads.
+
+    Args:
+        max_bytes: The maximum total size of the arrays of the cached grids.
+        disk_cache: Optional :class:`DiskGridCache` to read files through on
+            a cache miss.
+    """
+
+    def __init__(self, max_bytes: int = 2**30, disk_cache: DiskGridCache = None):
+        self.max_bytes = max_bytes
+        self.disk_cache = disk_cache
+        self.nbytes = 0
+        self._grids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._grids)
+
+    def load(
+        self,
+        path: Union[str, os.PathLike],
+        fileformat: Optional[str] = None,
+        box: Optional[Box] = None,
+        **reader_options,
+    ) -> EGrid:
+        """
+        Read the egrid file at path through the cache.
+
+        Args:
+            path: Path to the egrid file.
+            fileformat: "egrid", "fegrid", "egridz" or None to guess.
+            box: See :meth:`eclio.egrid.EGrid.from_file`.
+            reader_options: The on_keyword, progress and cancel arguments of
+                :meth:`eclio.egrid.EGrid.from_file`, used when the grid is
+                not in the cache.
+        Returns:
+            The EGrid with the contents of the file, its arrays are read-only.
+        """
+        if not isinstance(path, (str, os.PathLike)):
+            raise ValueError(f"Can only cache egrid files given by path, got {path}")
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        if box is not None:
+            box = tuple(tuple(int(i) for i in axis) for axis in box)
+        key = (resolved, fileformat, box)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._grids.get(key)
+            if cached is not None and cached[0] == version:
+                self._grids.move_to_end(key)
+                return cached[1]
+
+        if self.disk_cache is not None:
+            grid = self.disk_cache.load(path, fileformat, box=box, **reader_options)
+        else:
+            grid = EGrid.from_file(path, fileformat, box=box, **reader_options)
+        nbytes = 0
+        for array in egrid_arrays(grid):
+            array.flags.writeable = False
+            nbytes += array.nbytes
+
+        with self._lock:
+            previous = self._grids.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[2]
+            if nbytes <= self.max_bytes:
+                self._grids[key] = (version, grid, nbytes)
+                self.nbytes += nbytes
+                while self.nbytes > self.max_bytes:
+                    _, (_, _, evicted) = self._grids.popitem(last=False)
+                    self.nbytes -= evicted
+        return grid
+
+    def clear(self):
+        """Remove all grids from the cache."""
+        with self._lock:
+            self._grids.clear()
+            self.nbytes = 0
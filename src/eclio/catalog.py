@@ -0,0 +1,177 @@
+"""
+Catalogs of the egrid files in a directory tree.
+
+:func:`scan_directory` probes (see :func:`eclio.egrid.probe`) every EGRID
+and FEGRID file below a directory in parallel and returns a table with one
+row per file::
+
+    table = scan_directory("/project", workers=16, cache_path="catalog.json")
+    large = table["path"][table["nx"] * table["ny"] * table["nz"] > 10**7]
+
+The table is a dictionary of equal length numpy arrays, which can be
+converted with ``pyarrow.table(table)`` or ``pandas.DataFrame(table)``.
+"""
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .egrid import probe
+
+#: Version of the layout of catalog cache files.
+CATALOG_CACHE_VERSION = 1
+
+#: Number of probed files between saves of the cache during a scan.
+CACHE_SAVE_INTERVAL = 1000
+
+#: The columns of the catalog table and their types. String columns are
+#: empty when the value is not in the file, and integer columns are -1 for
+#: files that could not be probed, which have the reason in "error".
+CATALOG_COLUMNS = {
+    "path": str,
+    "format": str,
+    "size": np.int64,
+    "mtime_ns": np.int64,
+    "nx": np.int64,
+    "ny": np.int64,
+    "nz": np.int64,
+    "type_of_grid": str,
+    "mapunits": str,
+    "gridunit": str,
+    "num_lgrs": np.int64,
+    "num_nncs": np.int64,
+    "num_amalgamations": np.int64,
+    "error": str,
+}
+
+_EXTENSIONS = {".egrid": "egrid", ".fegrid": "fegrid"}
+
+
+def _grid_files(root) -> Iterator[Tuple[str, str, int, int]]:
+    """The path, format, size and mtime_ns of each egrid file below root."""
+    directories = [os.path.abspath(root)]
+    while directories:
+        directory = directories.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+                    continue
+                fileformat = _EXTENSIONS.get(os.path.splitext(entry.name)[1].lower())
+                if fileformat is None or not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, fileformat, stat.st_size, stat.st_mtime_ns
+
+
+def _probe_row(path: str, fileformat: str, size: int, mtime_ns: int) -> Dict[str, Any]:
+    row = {name: "" if kind is str else -1 for name, kind in CATALOG_COLUMNS.items()}
+    row.update(path=path, format=fileformat, size=size, mtime_ns=mtime_ns)
+    try:
+        result = probe(path, fileformat)
+    except (OSError, ValueError, NotImplementedError) as err:
+        row["error"] = f"{type(err).__name__}: {err}"
+        return row
+    egrid_head = result.egrid_head
+    row.update(
+        zip(("nx", "ny", "nz"), (int(d) for d in result.grid_head.dimensions)),
+        type_of_grid=result.grid_head.type_of_grid.name,
+        num_lgrs=result.num_lgrs,
+        num_nncs=result.num_nncs,
+        num_amalgamations=result.num_amalgamations,
+    )
+    if egrid_head.mapunits is not None:
+        row["mapunits"] = egrid_head.mapunits.name
+    if egrid_head.gridunit is not None:
+        row["gridunit"] = egrid_head.gridunit.unit.name
+    return row
+
+
+def _load_cache(cache_path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as stream:
+            cache = json.load(stream)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != CATALOG_CACHE_VERSION:
+        return {}
+    return cache["files"]
+
+
+def _save_cache(cache_path, rows: List[Dict[str, Any]]):
+    directory = os.path.dirname(os.path.abspath(cache_path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as stream:
+            json.dump(
+                {
+                    "version": CATALOG_CACHE_VERSION,
+                    "files": {row["path"]: row for row in rows},
+                },
+                stream,
+            )
+        os.replace(temporary, cache_path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+def scan_directory(
+    root, workers: Optional[int] = None, cache_path=None
+) -> Dict[str, np.ndarray]:
+    """
+    Probe every EGRID and FEGRID file (by case insensitive extension) below
+    root.
+
+    Args:
+        root: The directory to scan.
+        workers: Number of threads probing files, defaults to the
+            ThreadPoolExecutor default.
+        cache_path: A json file of the rows of a previous scan. Only files
+            which are new, or whose size or modification time changed, are
+            probed, and the file is updated with the result of the scan. The
+            file is also saved every :data:`CACHE_SAVE_INTERVAL` probed files
+            and when the scan fails, so an interrupted scan keeps the rows
+            probed so far.
+    Returns:
+        The columns of :data:`CATALOG_COLUMNS`, with one row per file in
+        order of path.
+    """
+    cached = {} if cache_path is None else _load_cache(cache_path)
+    rows = []
+    to_probe = []
+    for path, fileformat, size, mtime_ns in _grid_files(root):
+        row = cached.get(path)
+        if row is not None and (row["size"], row["mtime_ns"]) == (size, mtime_ns):
+            rows.append(row)
+        else:
+            to_probe.append((path, fileformat, size, mtime_ns))
+    try:
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [executor.submit(_probe_row, *args) for args in to_probe]
+            try:
+                for probed, future in enumerate(as_completed(futures), start=1):
+                    rows.append(future.result())
+                    if cache_path is not None and probed % CACHE_SAVE_INTERVAL == 0:
+                        _save_cache(cache_path, rows)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        if cache_path is not None:
+            _save_cache(cache_path, rows)
+    rows.sort(key=lambda row: row["path"])
+    return {
+        name: np.array([row[name] for row in rows], dtype=kind)
+        for name, kind in CATALOG_COLUMNS.items()
+    }
@@ -0,0 +1,221 @@
+"""
+The eclio command line tool::
+
+    eclio info CASE.EGRID
+    eclio convert CASE.EGRID CASE.FEGRID
+    eclio slice CASE.EGRID PART.EGRID --i 10:20 --k 0:5
+    eclio stats CASE.EGRID
+
+"""
+import argparse
+import json
+import os
+import sys
+from contextlib import closing
+from typing import Any, Iterator, List, Optional, Tuple
+
+import numpy as np
+from ecl_data_io import Format, lazy_read, write
+
+from .egrid import EGrid, global_grid_statistics, probe
+from .egridz import EGridzArchive, is_egridz, write_egridz
+
+#: The formats of convert and slice, by file extension.
+FORMATS = {
+    ".egrid": "egrid",
+    ".fegrid": "fegrid",
+    ".egridz": "egridz",
+    ".grdecl": "grdecl",
+}
+
+_ECL_FORMATS = {"egrid": Format.UNFORMATTED, "fegrid": Format.FORMATTED}
+
+
+def _format(path: str, fileformat: Optional[str]) -> Optional[str]:
+    if fileformat is not None:
+        return fileformat
+    return FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def _output_format(path: str, fileformat: Optional[str]) -> str:
+    fileformat = _format(path, fileformat)
+    if fileformat is None:
+        raise ValueError(
+            f"Cannot tell the output format from {path}, use --to with one of"
+            f" {sorted(set(FORMATS.values()))}"
+        )
+    return fileformat
+
+
+def _write(grid: EGrid, path: str, fileformat: str, compression: str):
+    if fileformat == "grdecl":
+        from .grdecl import write_grdecl
+
+        write_grdecl(grid, path)
+    else:
+        grid.to_file(path, fileformat, compression=compression)
+
+
+def info(args) -> int:
+    result = probe(args.path, args.input_format)
+    head = result.egrid_head
+    summary = {
+        "path": args.path,
+        "size": os.path.getsize(args.path),
+        "dimensions": [int(d) for d in result.grid_head.dimensions],
+        "type_of_grid": result.grid_head.type_of_grid.name,
+        "mapunits": None if head.mapunits is None else head.mapunits.name,
+        "gridunit": None if head.gridunit is None else head.gridunit.unit.name,
+        "mapaxes": None if head.mapaxes is None else list(head.mapaxes.to_ecl()),
+        "num_lgrs": result.num_lgrs,
+        "num_nncs": result.num_nncs,
+        "num_amalgamations": result.num_amalgamations,
+    }
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        for key, value in summary.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+def _read_keywords(path: str, fileformat: Optional[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    The keyword, array pairs of the egrid file, reading each array only when
+    the pair is reached.
+    """
+    if fileformat == "egridz" or (fileformat is None and is_egridz(path)):
+        with EGridzArchive(path) as archive:
+            for entry in archive.entries():
+                yield entry.read_keyword(), entry.read_array()
+    else:
+        for entry in lazy_read(path, _ECL_FORMATS.get(fileformat)):
+            yield entry.read_keyword(), entry.read_array()
+
+
+def convert(args) -> int:
+    input_format = _format(args.source, args.input_format)
+    output_format = _output_format(args.destination, args.output_format)
+    if input_format not in (None, "egridz", *_ECL_FORMATS):
+        raise ValueError(f"Unrecognized egrid file format {input_format}")
+    # Copy one keyword at a time, only one array is in memory at once
+    with closing(_read_keywords(args.source, input_format)) as keywords:
+        if output_format == "grdecl":
+            from .grdecl import write_grdecl_keywords
+
+            write_grdecl_keywords(keywords, args.destination)
+        elif output_format == "egridz":
+            write_egridz(args.destination, keywords, args.compression)
+        else:
+            write(args.destination, keywords, _ECL_FORMATS[output_format])
+    return 0
+
+
+def parse_range(value: str) -> Tuple[int, int]:
+    """Parse a zero based start:stop range of cell indices."""
+    try:
+        start, stop = (int(v) for v in value.split(":"))
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(
+            f"Expected a range start:stop, got {value}"
+        ) from err
+    return start, stop
+
+
+def slice_grid(args) -> int:
+    input_format = _format(args.source, args.input_format)
+    output_format = _output_format(args.destination, args.output_format)
+    dims = probe(args.source, input_format).grid_head.dimensions
+    box = tuple(
+        (0, n) if value is None else value
+        for value, n in zip((args.i, args.j, args.k), dims)
+    )
+    grid = EGrid.from_file(args.source, input_format, box=box)
+    _write(grid, args.destination, output_format, args.compression)
+    return 0
+
+
+def stats(args) -> int:
+    statistics = global_grid_statistics(args.path, args.input_format)
+    lower, upper = statistics.bounds
+    summary = {
+        "num_cells": int(np.prod(statistics.grid_head.dimensions)),
+        "num_active": statistics.num_active,
+        "bounds": [lower.tolist(), upper.tolist()],
+    }
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        for key, value in summary.items():
+            print(f"{key}: {value}")
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    result = argparse.ArgumentParser(
+        prog="eclio", description="Inspect and convert egrid files."
+    )
+    commands = result.add_subparsers(dest="command")
+    commands.required = True
+    formats = sorted(set(FORMATS.values()))
+
+    def add_input(command, name):
+        command.add_argument(name)
+        command.add_argument(
+            "--from",
+            dest="input_format",
+            choices=["egrid", "fegrid", "egridz"],
+            help="Format of the input file, guessed by default",
+        )
+
+    def add_output(command):
+        command.add_argument("destination")
+        command.add_argument(
+            "--to",
+            dest="output_format",
+            choices=formats,
+            help="Format of the output file, given by its extension by default",
+        )
+        command.add_argument(
+            "--compression",
+            default="zlib",
+            help="Compression of egridz output files",
+        )
+
+    command = commands.add_parser("info", help="Print the headers of an egrid")
+    add_input(command, "path")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(run=info)
+
+    command = commands.add_parser("convert", help="Convert between grid formats")
+    add_input(command, "source")
+    add_output(command)
+    command.set_defaults(run=convert)
+
+    command = commands.add_parser("slice", help="Write a box of the global grid")
+    add_input(command, "source")
+    add_output(command)
+    for axis in "ijk":
+        command.add_argument(
+            f"--{axis}",
+            type=parse_range,
+            help=f"Zero based start:stop range of {axis} indices, default all",
+        )
+    command.set_defaults(run=slice_grid)
+
+    command = commands.add_parser(
+        "stats", help="Print the number of active cells and the bounding box"
+    )
+    add_input(command, "path")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(run=stats)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (OSError, ValueError, NotImplementedError) as err:
+        print(f"eclio {args.command}: {err}", file=sys.stderr)
+        return 1
@@ -0,0 +1,215 @@
+"""
+Grid coarsening as described by the CORSNUM keyword of the global grid.
+
+CORSNUM gives, for each cell of the global grid, the (1-based) number of the
+coarse cell it is part of, or 0 if the cell is not coarsened. Each coarse
+cell is a box of cells in the global grid.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .geometry import pillars, zcorn_corner_view
+
+AGGREGATIONS = ("sum", "mean", "pv_weighted")
+
+
+def coarsen_properties(
+    values: np.ndarray,
+    corsnum: np.ndarray,
+    actnum: Optional[np.ndarray] = None,
+    how: str = "mean",
+    pore_volume: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Aggregate per cell values of the global grid to the coarse cells.
+
+    Args:
+        values: Array of one value per global cell (natural order).
+        corsnum: The CORSNUM array of the global grid.
+        actnum: The ACTNUM array of the global grid, only cells with non-zero
+            actnum contribute. Defaults to all cells being active.
+        how: One of "sum", "mean" or "pv_weighted", the latter being the mean
+            weighted by pore_volume.
+        pore_volume: The pore volume of each cell, required for "pv_weighted".
+    Returns:
+        float64 array where element c-1 is the aggregated value of coarse cell
+        c. Coarse cells without active cells get 0 for "sum" and nan otherwise.
+    """
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation {how}, expected one of {AGGREGATIONS}")
+    corsnum = np.asarray(corsnum).reshape(-1)
+    values = np.asarray(values, dtype=np.float64).reshape(-1)
+    if values.size != corsnum.size:
+        raise ValueError(
+            f"Number of values {values.size} does not match corsnum {corsnum.size}"
+        )
+    included = corsnum > 0
+    if actnum is not None:
+        included &= np.asarray(actnum).reshape(-1) > 0
+    groups = corsnum[included]
+    values = values[included]
+    num_coarse = int(corsnum.max(initial=0))
+    minlength = num_coarse + 1
+
+    if how == "sum":
+        return np.bincount(groups, weights=values, minlength=minlength)[1:]
+
+    if how == "mean":
+        weights = np.ones(values.shape)
+    else:
+        if pore_volume is None:
+            raise ValueError("pv_weighted aggregation requires pore_volume")
+        pore_volume = np.asarray(pore_volume, dtype=np.float64).reshape(-1)
+        if pore_volume.size != corsnum.size:
+            raise ValueError(
+                f"Size of pore_volume {pore_volume.size} does not match"
+                f" corsnum {corsnum.size}"
+            )
+        weights = pore_volume[included]
+    totals = np.bincount(groups, weights=weights * values, minlength=minlength)[1:]
+    weight_sums = np.bincount(groups, weights=weights, minlength=minlength)[1:]
+    return np.divide(
+        totals,
+        weight_sums,
+        out=np.full(num_coarse, np.nan),
+        where=weight_sums != 0,
+    )
+
+
+def coarse_boxes(corsnum: np.ndarray, dims: Tuple[int, int, int]) -> np.ndarray:
+    """The box of global cells of each coarse cell.
+
+    Args:
+        corsnum: The CORSNUM array of the global grid.
+        dims: The (nx,ny,nz) dimensions of the global grid.
+    Returns:
+        int array of shape (num_coarse, 3, 2) where ``[c-1, axis]`` is the
+        zero based, end exclusive, range of cells in the given axis of coarse
+        cell c.
+    """
+    corsnum = np.asarray(corsnum).reshape(-1)
+    nx, ny, nz = dims
+    if corsnum.size != nx * ny * nz:
+        raise ValueError(f"Size of corsnum {corsnum.size} does not match {dims}")
+    cells = np.flatnonzero(corsnum > 0)
+    order = np.argsort(corsnum[cells], kind="stable")
+    cells = cells[order]
+    groups = corsnum[cells]
+    num_coarse = int(corsnum.max(initial=0))
+    if len(groups) == 0:
+        return np.zeros((0, 3, 2), dtype=np.int64)
+    if not np.array_equal(np.unique(groups), np.arange(1, num_coarse + 1)):
+        raise ValueError("CORSNUM does not number coarse cells consecutively")
+    starts = np.flatnonzero(np.diff(groups, prepend=0))
+    indices = np.stack([cells % nx, (cells // nx) % ny, cells // (nx * ny)], axis=1)
+    result = np.empty((num_coarse, 3, 2), dtype=np.int64)
+    result[:, :, 0] = np.minimum.reduceat(indices, starts, axis=0)
+    result[:, :, 1] = np.maximum.reduceat(indices, starts, axis=0) + 1
+    box_size = np.prod(result[:, :, 1] - result[:, :, 0], axis=1)
+    if not np.array_equal(box_size, np.diff(np.append(starts, len(cells)))):
+        raise ValueError("Coarse cells in CORSNUM are not boxes")
+    return result
+
+
+def _coarse_partition(corsnum: np.ndarray, dims: Tuple[int, int, int]):
+    """
+    The coarse dimensions, the cell ranges along each axis, the boxes and the
+    coarse natural index of each coarse cell, see :func:`coarsened_geometry`.
+    """
+    if np.any(corsnum <= 0):
+        raise ValueError("Coarsened geometry requires all cells to be coarsened")
+    boxes = coarse_boxes(corsnum, dims)
+    cuts = []
+    positions = []
+    for axis in range(3):
+        ranges = np.unique(boxes[:, axis, :], axis=0)
+        if ranges[0, 0] != 0 or np.any(ranges[1:, 0] != ranges[:-1, 1]):
+            raise ValueError("Coarse cells do not partition the grid")
+        cuts.append(ranges)
+        positions.append(np.searchsorted(ranges[:, 0], boxes[:, axis, 0]))
+    coarse_dims = tuple(len(ranges) for ranges in cuts)
+    cnx, cny, cnz = coarse_dims
+    natural = positions[0] + cnx * (positions[1] + cny * positions[2])
+    if len(boxes) != cnx * cny * cnz or not np.array_equal(
+        np.sort(natural), np.arange(len(boxes))
+    ):
+        raise ValueError("Coarse cells do not form a regular coarse grid")
+    return coarse_dims, cuts, boxes, natural
+
+
+def coarse_natural_index(corsnum: np.ndarray, dims: Tuple[int, int, int]) -> np.ndarray:
+    """The natural index of each coarse cell in the coarsened grid.
+
+    Args:
+        corsnum: The CORSNUM array of the global grid.
+        dims: The (nx,ny,nz) dimensions of the global grid.
+    Returns:
+        int array where element c-1 is the natural index of coarse cell c
+        in the grid given by :func:`coarsened_geometry`, so
+        ``natural_values[index] = coarsen_properties(...)`` puts coarse
+        properties in the order of the coarsened grid.
+    """
+    corsnum = np.asarray(corsnum).reshape(-1)
+    return _coarse_partition(corsnum, dims)[3]
+
+
+def coarsened_geometry(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    actnum: Optional[np.ndarray],
+    corsnum: np.ndarray,
+    dims: Tuple[int, int, int],
+) -> Tuple[Tuple[int, int, int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """The corner point geometry of the coarsened grid.
+
+    This requires that the coarse cells partition the grid into a tensor
+    product, ie. that all cells are coarsened and the cell ranges of the coarse
+    cells in each axis form a partition of that axis. Uncoarsened cells
+    (CORSNUM 0) are not supported.
+
+    The cells of the coarsened grid are in natural order, which is not the
+    order of the CORSNUM numbers (nor of :func:`coarsen_properties`) unless
+    CORSNUM numbers the coarse cells in natural order.
+
+    Returns:
+        Tuple of dimensions, coord, zcorn and actnum of the coarse grid, and
+        the natural index of each coarse cell (see
+        :func:`coarse_natural_index`). A coarse cell is active if any of its
+        cells are active.
+    """
+    corsnum = np.asarray(corsnum).reshape(-1)
+    coarse_dims, cuts, boxes, natural = _coarse_partition(corsnum, dims)
+    cnx, cny, cnz = coarse_dims
+
+    pillar_i = np.append(cuts[0][:, 0], dims[0])
+    pillar_j = np.append(cuts[1][:, 0], dims[1])
+    coarse_coord = pillars(coord, dims)[np.ix_(pillar_i, pillar_j)]
+    coarse_coord = coarse_coord.transpose((1, 0, 2)).reshape(-1)
+
+    # Each corner of a coarse cell is the same corner of the fine cell at
+    # that corner of the box, in coarse natural order.
+    natural_boxes = boxes[np.argsort(natural)]
+    fine_corners = zcorn_corner_view(zcorn, dims)
+    coarse_corners = np.empty((cnx, cny, cnz, 2, 2, 2), dtype=zcorn.dtype)
+    for dk in range(2):
+        for dj in range(2):
+            for di in range(2):
+                i = natural_boxes[:, 0, di] - di
+                j = natural_boxes[:, 1, dj] - dj
+                k = natural_boxes[:, 2, dk] - dk
+                coarse_corners[..., dk, dj, di] = (
+                    fine_corners[i, j, k, dk, dj, di]
+                    .reshape((cnz, cny, cnx))
+                    .transpose((2, 1, 0))
+                )
+    coarse_zcorn = np.empty(8 * len(boxes), dtype=zcorn.dtype)
+    zcorn_corner_view(coarse_zcorn, coarse_dims)[...] = coarse_corners
+
+    if actnum is None:
+        coarse_actnum = np.ones(len(boxes), dtype=np.int32)
+    else:
+        active = np.asarray(actnum).reshape(-1) > 0
+        coarse_actnum = (
+            np.bincount(natural[corsnum - 1], weights=active, minlength=len(boxes)) > 0
+        ).astype(np.int32)
+    return coarse_dims, coarse_coord, coarse_zcorn, coarse_actnum, natural
@@ -51,7 +51,9 @@ The corner point geometry is made up of nx*ny*nz cells in three corresponding
 dimensions.
 
 The values in COORD, ZCORN and ACTNUM are stored flattened in F-order and
-have dimensions (nx+1,ny+1,6), (nx,2,ny,2,nz,2), and (nx,ny,nz) respectively.
+have dimensions (6,nx+1,ny+1), (2,nx,2,ny,2,nz), and (nx,ny,nz) respectively.
+See :func:`eclio.geometry.zcorn_to_corners` for converting ZCORN to an array
+of eight corners per cell.
 
 COORD and ZCORN descibe the position of corners in the corner point geometry.
 There is a straight line from the bottom to the top of the grid on which the
@@ -60,11 +62,11 @@ these corner lines, hence, it contains six floats for each corner line.
 
 ZCORN has 8 values for each grid, which describes the z-value (height) at
 which that cells corners intersect with the corresponding corner line. The
-order of corners is  "left" before "right" in the second dimension of
-ZCORN, "near"  before "far" in the fourth dimension , and "upper" before
-"bottom" in the last dimension. Note that this orientation assumes,
-increasing first dimension as to the "right", increasing second dimension
-towards "far", and increasing third dimension as towards "bottom".
+order of corners is  "left" before "right" in the first dimension of
+ZCORN, "near"  before "far" in the third dimension , and "upper" before
+"bottom" in the fifth dimension. Note that this orientation assumes,
+increasing i as to the "right", increasing j towards "far", and increasing k
+as towards "bottom".
 
 The topology is such that, assuming no gaps between cells, the (i,j,k)th
 cell and the (i+1,j+1,k+1)th cell share the upper near left corner of the
@@ -80,7 +82,12 @@ simulations, 0 means inactive, 1 means active, 2 means rock volume only,
 
 
 """
-from dataclasses import dataclass
+import io
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from enum import Enum, unique
 from itertools import chain
 from typing import (
@@ -99,14 +106,50 @@ from typing import (
 import numpy as np
 from ecl_data_io import Format, lazy_read, write
 
+from .coarsening import coarse_natural_index, coarsen_properties, coarsened_geometry
 from .ecl_output_file import (
     CoordinateType,
     GdOrient,
+    GridRelative,
     GridUnit,
     MapAxes,
     TypeOfGrid,
     Units,
 )
+from .egridz import EGridzArchive, encoded_value, is_egridz, write_egridz
+from .fingerprint import Fingerprinted, content_hash
+from .geometry import (
+    CHUNK_CELLS,
+    Box,
+    FaceGeometry,
+    cell_centres,
+    cell_volumes,
+    cells_box,
+    check_box,
+    coord_box,
+    coord_to_map_coordinates,
+    corners_to_zcorn,
+    face_geometry,
+    find_layer_gaps,
+    find_pinchouts,
+    grid_bounds,
+    layer_chunks,
+    layer_depth_stats,
+    pillar_bounds,
+    pillar_depth_range,
+    to_local_coordinates,
+    zcorn_box,
+    zcorn_corner_view,
+    zcorn_to_corners,
+)
+from .profiling import KeywordEvent, array_size
+from .progress import (
+    CancellationToken,
+    Cancelled,
+    Progress,
+    ProgressTracker,
+    file_size,
+)
 
 
 class EGridFileFormatError(ValueError):
@@ -234,6 +277,11 @@ class GridHead:
             lgr_end=(values[30], values[31], values[32]),
         )
 
+    @property
+    def dimensions(self) -> Tuple[int, int, int]:
+        """The number of cells (nx, ny, nz) in each direction."""
+        return (self.num_x, self.num_y, self.num_z)
+
     def to_ecl(self) -> np.ndarray:
         # The data is expected to consist of
         # 100 integers, but only a subset is used.
@@ -251,8 +299,160 @@ class GridHead:
         return result
 
 
+def _box_grid_head(grid_head: GridHead, box: Box) -> GridHead:
+    """The GridHead of the given box of a grid with the given GridHead."""
+    (i0, i1), (j0, j1), (k0, k1) = box
+    return replace(grid_head, num_x=i1 - i0, num_y=j1 - j0, num_z=k1 - k0)
+
+
+def _box_boxorig(
+    boxorig: Optional[Tuple[int, int, int]], box: Box
+) -> Optional[Tuple[int, int, int]]:
+    """
+    The BOXORIG of the given box of a grid with the given BOXORIG. BOXORIG
+    is the one based (i,j,k) of the first cell of a grid in its parent grid,
+    (1,1,1) when not given.
+    """
+    offset = tuple(start for start, _ in box)
+    if boxorig is None:
+        if not any(offset):
+            return None
+        boxorig = (1, 1, 1)
+    return tuple(int(o) + d for o, d in zip(boxorig, offset))
+
+
+class CornerPointGrid:
+    """
+    Methods shared by the sections containing a corner point geometry, ie.
+    :class:`GlobalGrid` and :class:`LGRSection`, which both have the
+    grid_head, coord, zcorn, actnum and coord_sys attributes.
+    """
+
+    def world_coord(self, mapaxes: Optional[MapAxes] = None) -> np.ndarray:
+        """
+        The COORD array transformed to map coordinates. The result is cached,
+        keyed by the mapaxes used, and returned read-only so that the cached
+        value can be shared between callers.
+
+        Args:
+            mapaxes: The local coordinate system of coord, defaults to
+                coord_sys. If neither is given, coord is returned as is.
+        Returns:
+            Read-only float64 array with the same layout as coord.
+        """
+        if mapaxes is None:
+            mapaxes = self.coord_sys
+        key = None if mapaxes is None else tuple(mapaxes.to_ecl())
+        cached = getattr(self, "_world_coord_cache", None)
+        if cached is not None and cached[0] == key and cached[1] is self.coord:
+            return cached[2]
+        if mapaxes is None:
+            result = self.coord.astype(np.float64)
+        else:
+            result = coord_to_map_coordinates(self.coord, mapaxes)
+        result.flags.writeable = False
+        self._world_coord_cache = (key, self.coord, result)
+        return result
+
+    def zcorn_view(self) -> np.ndarray:
+        """
+        A view of zcorn with shape (nx,ny,nz,2,2,2), see
+        :func:`eclio.geometry.zcorn_corner_view`.
+        """
+        return zcorn_corner_view(self.zcorn, self.grid_head.dimensions)
+
+    def zcorn_corners(self) -> np.ndarray:
+        """
+        The zcorn values as an array with shape (nx,ny,nz,8), see
+        :func:`eclio.geometry.zcorn_to_corners`.
+        """
+        return zcorn_to_corners(self.zcorn, self.grid_head.dimensions)
+
+    def set_zcorn_corners(self, corners: np.ndarray):
+        """
+        Set zcorn from an array of corners with shape (nx,ny,nz,8), the
+        inverse of zcorn_corners.
+        """
+        dims = self.grid_head.dimensions
+        corners = np.asarray(corners, dtype=np.float32)
+        if corners.shape[0:3] != dims or corners.size != 8 * np.prod(dims):
+            raise ValueError(
+                f"Corners of shape {corners.shape} does not match dimensions {dims}"
+            )
+        self.zcorn = corners_to_zcorn(corners)
+
+    def find_pinchouts(self, tol: float = 0.0) -> np.ndarray:
+        """
+        Indices of cells with thickness at most tol at all pillars, see
+        :func:`eclio.geometry.find_pinchouts`.
+        """
+        return find_pinchouts(self.zcorn, self.grid_head.dimensions, tol)
+
+    def find_layer_gaps(self, tol: float = 0.0) -> np.ndarray:
+        """
+        Indices of cells with a gap or overlap larger than tol to the cell
+        below, see :func:`eclio.geometry.find_layer_gaps`.
+        """
+        return find_layer_gaps(self.zcorn, self.grid_head.dimensions, tol)
+
+    def cell_centres(self) -> np.ndarray:
+        """
+        The centre of each cell as an array of shape (nx,ny,nz,3), see
+        :func:`eclio.geometry.cell_centres`.
+        """
+        return cell_centres(self.coord, self.zcorn, self.grid_head.dimensions)
+
+    def cell_volumes(self) -> np.ndarray:
+        """
+        The volume of each cell as an array of shape (nx,ny,nz), see
+        :func:`eclio.geometry.cell_volumes`.
+        """
+        return cell_volumes(self.coord, self.zcorn, self.grid_head.dimensions)
+
+    def bounds(self, layers_per_chunk: int = None) -> np.ndarray:
+        """
+        The minimum and maximum (x,y,z) of the corners as an array of shape
+        (2,3), see :func:`eclio.geometry.grid_bounds`.
+        """
+        return grid_bounds(
+            self.coord, self.zcorn, self.grid_head.dimensions, layers_per_chunk
+        )
+
+    def layer_depth_stats(
+        self, active_only: bool = False, layers_per_chunk: int = None
+    ) -> np.ndarray:
+        """
+        The minimum, mean and maximum depth of each layer as an array of shape
+        (nz,3), see :func:`eclio.geometry.layer_depth_stats`.
+
+        Args:
+            active_only: Only include the cells where actnum is non-zero.
+        """
+        return layer_depth_stats(
+            self.zcorn,
+            self.grid_head.dimensions,
+            self.actnum if active_only else None,
+            layers_per_chunk,
+        )
+
+    def face_geometry(
+        self, layers_per_chunk: int = None, workers: int = None
+    ) -> FaceGeometry:
+        """
+        The face areas and centre to face distances of neighbouring cells,
+        see :func:`eclio.geometry.face_geometry`.
+        """
+        return face_geometry(
+            self.coord,
+            self.zcorn,
+            self.grid_head.dimensions,
+            layers_per_chunk=layers_per_chunk,
+            workers=workers,
+        )
+
+
 @dataclass
-class LGRSection:
+class LGRSection(CornerPointGrid, Fingerprinted):
     """
     An Egrid file can contain multiple LGR (Local Grid Refinement) sections
     which define a subgrid with finer layout. The section contains one corner point
@@ -330,7 +530,7 @@ class LGRSection:
 
 
 @dataclass
-class GlobalGrid:
+class GlobalGrid(CornerPointGrid, Fingerprinted):
     """
     The global grid contains the corner point layout of the grid without
     refinements, and the sectioning into grid coarsening through the optional
@@ -358,6 +558,86 @@ class GlobalGrid:
             and np.array_equal(self.corsnum, other.corsnum)
         )
 
+    def subgrid(self, box: Box) -> "GlobalGrid":
+        """
+        The global grid of a box of cells.
+
+        Args:
+            box: ((i0,i1),(j0,j1),(k0,k1)), zero based and end exclusive cell
+                index ranges of the box.
+        Returns:
+            GlobalGrid containing the box.
+        """
+        dims = self.grid_head.dimensions
+        box = check_box(box, dims)
+        num_cells = dims[0] * dims[1] * dims[2]
+        if self.corsnum is not None and self.corsnum.size != num_cells:
+            raise ValueError(
+                f"CORSNUM has size {self.corsnum.size} expected {num_cells}"
+            )
+        return GlobalGrid(
+            grid_head=_box_grid_head(self.grid_head, box),
+            coord=coord_box(self.coord, dims, box),
+            zcorn=zcorn_box(self.zcorn, dims, box),
+            actnum=None if self.actnum is None else cells_box(self.actnum, dims, box),
+            coord_sys=self.coord_sys,
+            boxorig=_box_boxorig(self.boxorig, box),
+            corsnum=(
+                None if self.corsnum is None else cells_box(self.corsnum, dims, box)
+            ),
+        )
+
+    def coarsen_properties(
+        self,
+        values: np.ndarray,
+        how: str = "mean",
+        pore_volume: Optional[np.ndarray] = None,
+        natural_order: bool = False,
+    ) -> np.ndarray:
+        """
+        Aggregate values of active cells to the coarse cells given by corsnum,
+        see :func:`eclio.coarsening.coarsen_properties`.
+
+        Args:
+            natural_order: Return the values in the cell order of
+                :meth:`coarsened_grid` instead of in order of CORSNUM.
+        """
+        if self.corsnum is None:
+            raise ValueError("Global grid has no CORSNUM")
+        result = coarsen_properties(
+            values, self.corsnum, self.actnum, how=how, pore_volume=pore_volume
+        )
+        if natural_order:
+            reordered = np.empty_like(result)
+            reordered[
+                coarse_natural_index(self.corsnum, self.grid_head.dimensions)
+            ] = result
+            return reordered
+        return result
+
+    def coarsened_grid(self) -> "GlobalGrid":
+        """
+        The global grid where each coarse cell given by corsnum is one cell,
+        see :func:`eclio.coarsening.coarsened_geometry`. The cells are in
+        natural order, use ``coarsen_properties(..., natural_order=True)``
+        for properties of the cells of the coarsened grid.
+        """
+        if self.corsnum is None:
+            raise ValueError("Global grid has no CORSNUM")
+        dims, coord, zcorn, actnum, _ = coarsened_geometry(
+            self.coord, self.zcorn, self.actnum, self.corsnum, self.grid_head.dimensions
+        )
+        return GlobalGrid(
+            grid_head=replace(
+                self.grid_head, num_x=dims[0], num_y=dims[1], num_z=dims[2]
+            ),
+            coord=coord,
+            zcorn=zcorn,
+            actnum=actnum,
+            coord_sys=self.coord_sys,
+            boxorig=self.boxorig,
+        )
+
     def to_ecl(self) -> List[Tuple[str, Any]]:
         result_dict = {
             "GRIDHEAD": self.grid_head.to_ecl(),
@@ -413,7 +693,7 @@ class NNCHead:
 
 
 @dataclass
-class NNCSection:
+class NNCSection(Fingerprinted):
     """The NNCSection's describe non-neighboor connections in the grid.
 
     See, for instance, OPM user manual 2021-4 Rev. 1 Table D1.1 and 6.3.5.
@@ -460,7 +740,7 @@ class NNCSection:
 
 
 @dataclass
-class AmalgamationSection:
+class AmalgamationSection(Fingerprinted):
     """The AmalgamationSection's describe the amalgamation of two LGR's.
 
     See, for instance, OPM user manual 2021-4 Rev. 1 Table D1.1 and 6.3.5.
@@ -519,6 +799,100 @@ class EGridHead:
         return result
 
 
+class LGRTree:
+    """
+    Index of the LGR sections of an egrid for fast lookup by name and by
+    host cell.
+
+    LGRs can be nested, the parent of an LGR is given by the LGRPARNT keyword
+    (:attr:`LGRSection.parent`), where no parent means the global grid. The
+    HOSTNUM of an LGR gives the (1-based) index of the cell in the parent grid
+    which contains each cell of the LGR.
+
+    Args:
+        global_grid: The global grid.
+        lgr_sections: The LGR sections, LGRs are identified by their index in
+            this list.
+    """
+
+    def __init__(self, global_grid: GlobalGrid, lgr_sections: Sequence[LGRSection]):
+        self.global_grid = global_grid
+        self.lgr_sections = list(lgr_sections)
+        self._indices: Dict[str, int] = {}
+        for index, lgr in enumerate(self.lgr_sections):
+            if lgr.name in self._indices:
+                raise ValueError(f"Duplicate LGR name {lgr.name}")
+            self._indices[lgr.name] = index
+        self._children: Dict[Optional[str], List[str]] = {None: []}
+        for lgr in self.lgr_sections:
+            self._children.setdefault(lgr.name, [])
+        for lgr in self.lgr_sections:
+            parent = self.parent(lgr.name)
+            if parent is not None and parent not in self._indices:
+                raise ValueError(f"LGR {lgr.name} has unknown parent {parent}")
+            self._children[parent].append(lgr.name)
+        self._host_lgr: Dict[Optional[str], np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.lgr_sections)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indices
+
+    def __getitem__(self, name: str) -> LGRSection:
+        return self.lgr_sections[self._indices[name]]
+
+    def index(self, name: str) -> int:
+        """The index of the LGR with the given name in lgr_sections."""
+        return self._indices[name]
+
+    def parent(self, name: str) -> Optional[str]:
+        """The name of the parent of the given LGR, None for the global grid."""
+        parent = self[name].parent
+        if parent is None or not parent.strip():
+            return None
+        return parent
+
+    def children(self, name: Optional[str] = None) -> List[str]:
+        """The names of the LGRs refining the given LGR (or global grid if None)."""
+        return list(self._children[name])
+
+    def ancestors(self, name: str) -> List[str]:
+        """The names of the parents of the given LGR, closest first."""
+        result = []
+        parent = self.parent(name)
+        while parent is not None:
+            if parent in result:
+                raise ValueError(f"Cycle in LGR parents of {name}")
+            result.append(parent)
+            parent = self.parent(parent)
+        return result
+
+    def host_lgr(self, name: Optional[str] = None) -> np.ndarray:
+        """
+        Args:
+            name: The name of an LGR, or None for the global grid.
+        Returns:
+            For each cell in the given grid (by natural index), the index of
+            the child LGR refining that cell, or -1 for cells which are not
+            refined.
+        """
+        if name not in self._host_lgr:
+            grid = self.global_grid if name is None else self[name]
+            nx, ny, nz = grid.grid_head.dimensions
+            host_lgr = np.full(nx * ny * nz, -1, dtype=np.int64)
+            for child in self._children[name]:
+                hostnum = self[child].hostnum
+                if hostnum is None:
+                    continue
+                hosts = np.asarray(hostnum, dtype=np.int64) - 1
+                hosts = hosts[(hosts >= 0) & (hosts < len(host_lgr))]
+                host_lgr[hosts] = self._indices[child]
+            host_lgr.flags.writeable = False
+            self._host_lgr[name] = host_lgr
+        return self._host_lgr[name]
+
+
 @dataclass
 class EGrid:
     """Contains all the data of an EGRID file.
@@ -543,48 +917,367 @@ class EGrid:
     # of the file.
     nnc_sections: List[Union[NNCSection, AmalgamationSection]]
 
+    def fingerprint(self, refresh: bool = False) -> int:
+        """
+        A stable content hash of the egrid, combined from the cached
+        fingerprints of each section, see
+        :meth:`eclio.fingerprint.Fingerprinted.fingerprint`. Equal egrids
+        have equal fingerprints, so after the first call, comparing
+        fingerprints is a cheap way to tell egrids apart.
+
+        Args:
+            refresh: Whether to recompute cached section fingerprints, needed
+                if arrays have been modified in place.
+        """
+        sections = [self.global_grid] + self.lgr_sections + self.nnc_sections
+        return content_hash(
+            [self.egrid_head, len(self.lgr_sections)]
+            + [section.fingerprint(refresh) for section in sections]
+        )
+
+    @property
+    def lgr_tree(self) -> LGRTree:
+        """
+        The :class:`LGRTree` of lgr_sections, cached for as long as the
+        global grid and lgr sections are the same objects.
+        """
+        key = (id(self.global_grid),) + tuple(id(lgr) for lgr in self.lgr_sections)
+        cached = getattr(self, "_lgr_tree_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, LGRTree(self.global_grid, self.lgr_sections))
+            self._lgr_tree_cache = cached
+        return cached[1]
+
+    def grid_mapaxes(self) -> MapAxes:
+        """
+        The map axes which transforms the coordinates of the global grid
+        to map coordinates. This is the identity when the grid is given
+        as map relative (see :class:`GridRelative`) or no MAPAXES is given.
+        """
+        gridunit = self.egrid_head.gridunit
+        if gridunit is not None and gridunit.grid_relative == GridRelative.MAP:
+            return MapAxes()
+        if self.egrid_head.mapaxes is None:
+            return MapAxes()
+        return self.egrid_head.mapaxes
+
+    def world_coord(self) -> np.ndarray:
+        """
+        The COORD of the global grid transformed to map coordinates
+        by the MAPAXES of the file, see :meth:`GlobalGrid.world_coord`.
+        """
+        return self.global_grid.world_coord(self.grid_mapaxes())
+
+    def local_coordinates(self, points: np.ndarray) -> np.ndarray:
+        """
+        The inverse of the transform applied by world_coord.
+
+        Args:
+            points: Array with shape (..., n), n >= 2, of map coordinates.
+        Returns:
+            float64 array of the points in the coordinate system of COORD.
+        """
+        return to_local_coordinates(points, self.grid_mapaxes())
+
+    def validate(self, level: str = "indices"):
+        """
+        Check that the sections of the egrid are consistent, see
+        :mod:`eclio.validation`.
+
+        Args:
+            level (str): "sizes", "indices" or "full", the checks of each
+                level include those of the previous levels.
+        Raises:
+            eclio.validation.EGridValidationError: listing the problems found.
+        """
+        from .validation import EGridValidationError, validation_problems
+
+        problems = validation_problems(self, level)
+        if problems:
+            raise EGridValidationError(problems)
+
     @classmethod
-    def from_file(cls, filelike, fileformat: str = None):
+    def from_file(
+        cls,
+        filelike,
+        fileformat: str = None,
+        box: Box = None,
+        cache=None,
+        on_keyword: Callable = None,
+        progress: Callable = None,
+        cancel: CancellationToken = None,
+    ):
         """
         Read an egrid file
         Args:
             filelike (str,Path,stream): The egrid file to be read.
-            file_format (None or str): The format of the file (either "egrid"
-                or "fegrid") None means guess.
+            file_format (None or str): The format of the file (either "egrid",
+                "fegrid" or "egridz", see :mod:`eclio.egridz`) None means
+                guess.
+            box (None or Box): Only read the ((i0,i1),(j0,j1),(k0,k1)) box
+                of cells of the global grid, see :meth:`GlobalGrid.subgrid`.
+                The resulting EGrid has no lgr or nnc sections.
+            cache (None, eclio.cache.GridCache or eclio.cache.DiskGridCache):
+                Read the file through the given cache, filelike must then be a
+                path. on_keyword, progress and cancel apply to reading the
+                file (or disk cache entry) and are not used for grids found
+                in an in-memory cache.
+            on_keyword (None or Callable[[eclio.profiling.KeywordEvent], None]):
+                Called for each keyword read, see
+                :class:`eclio.profiling.ReadProfile`.
+            progress (None or Callable[[eclio.progress.Progress], None]):
+                Called between keywords, and between chunks of the global
+                grid arrays, with the progress of the read, see
+                :class:`EGridReader`.
+            cancel (None or eclio.progress.CancellationToken): Token checked
+                at the same points as progress is reported, raising
+                :class:`eclio.progress.Cancelled` when cancelled.
         Returns:
             EGrid with the contents of the file.
         """
-        file_format = None
-        if fileformat == "egrid":
-            file_format = Format.UNFORMATTED
-        elif fileformat == "fegrid":
-            file_format = Format.FORMATTED
-        elif fileformat is not None:
-            raise ValueError(f"Unrecognized egrid file format {fileformat}")
-        return EGridReader(filelike, file_format=file_format).read()
+        if cache is not None:
+            return cache.load(
+                filelike,
+                fileformat,
+                box=box,
+                on_keyword=on_keyword,
+                progress=progress,
+                cancel=cancel,
+            )
+        with _open_reader(
+            filelike,
+            fileformat,
+            box=box,
+            on_keyword=on_keyword,
+            progress=progress,
+            cancel=cancel,
+        ) as reader:
+            return reader.read()
+
+    @classmethod
+    def from_zarr(cls, store, box: Box = None, **kwargs):
+        """
+        Read an egrid from a zarr group, see :func:`eclio.zarr_io.from_zarr`.
+        Requires zarr.
+        """
+        from .zarr_io import from_zarr
 
-    def to_file(self, filelike, fileformat: str = "egrid"):
+        return from_zarr(store, box=box, **kwargs)
+
+    def to_zarr(self, store, **kwargs):
+        """
+        Write the egrid to a zarr group, see :func:`eclio.zarr_io.to_zarr`.
+        Requires zarr.
+        """
+        from .zarr_io import to_zarr
+
+        to_zarr(self, store, **kwargs)
+
+    def to_arrow(
+        self,
+        centres: bool = False,
+        volumes: bool = False,
+        layers_per_chunk: int = None,
+    ):
+        """
+        The cells of the global grid as a pyarrow Table, see
+        :func:`eclio.arrow.cell_batches`. Requires pyarrow.
+        """
+        from .arrow import to_arrow
+
+        return to_arrow(self, centres, volumes, layers_per_chunk)
+
+    def to_parquet(
+        self,
+        path,
+        centres: bool = False,
+        volumes: bool = False,
+        layers_per_chunk: int = None,
+        **kwargs,
+    ):
+        """
+        Write the cells of the global grid to a parquet file, see
+        :func:`eclio.arrow.to_parquet`. Requires pyarrow.
+        """
+        from .arrow import to_parquet
+
+        to_parquet(self, path, centres, volumes, layers_per_chunk, **kwargs)
+
+    def nnc_to_arrow(self):
+        """
+        The non-neighbour connections of nnc_sections as a pyarrow Table, see
+        :func:`eclio.arrow.nnc_to_arrow`. Requires pyarrow.
+        """
+        from .arrow import nnc_to_arrow
+
+        return nnc_to_arrow(self)
+
+    def to_file(
+        self,
+        filelike,
+        fileformat: str = "egrid",
+        compression: str = "zlib",
+        progress: Callable = None,
+        cancel: CancellationToken = None,
+    ):
         """
         write the EGrid to file.
         Args:
             filelike (str,Path,stream): The egrid file to write to.
-            file_format (ecl_data_io.Format): The format of the file.
+            file_format (ecl_data_io.Format): The format of the file, "egrid",
+                "fegrid" or "egridz".
+            compression (str): The compression of "egridz" files, see
+                :func:`eclio.egridz.write_egridz`.
+            progress (None or Callable[[eclio.progress.Progress], None]):
+                Called between keywords (and compressed chunks of egridz
+                files) with the bytes of array data and sections written.
+            cancel (None or eclio.progress.CancellationToken): Token checked
+                at the same points as progress is reported, raising
+                :class:`eclio.progress.Cancelled` when cancelled. A partially
+                written file given by path is removed.
         """
         file_format = None
         if fileformat == "egrid":
             file_format = Format.UNFORMATTED
         elif fileformat == "fegrid":
             file_format = Format.FORMATTED
-        elif fileformat is not None:
+        elif fileformat != "egridz" and fileformat is not None:
             raise ValueError(f"Unrecognized egrid file format {fileformat}")
-        contents = []
-        contents += self.egrid_head.to_ecl()
-        contents += self.global_grid.to_ecl()
-        for lgr in self.lgr_sections:
-            contents += lgr.to_ecl()
-        for nnc in self.nnc_sections:
-            contents += nnc.to_ecl()
-        write(filelike, contents, file_format)
+        sections = [self.egrid_head.to_ecl(), self.global_grid.to_ecl()]
+        sections += [lgr.to_ecl() for lgr in self.lgr_sections]
+        sections += [nnc.to_ecl() for nnc in self.nnc_sections]
+        if fileformat == "egridz":
+            # Progress of egridz files counts the bytes of the encoded arrays
+            sections = [
+                [(keyword, encoded_value(value)) for keyword, value in section]
+                for section in sections
+            ]
+        contents = [keyword for section in sections for keyword in section]
+        tracker = None
+        if progress is not None or cancel is not None:
+            section_ends = np.cumsum(
+                [sum(array_size(v)[1] for _, v in section) for section in sections]
+            ).tolist()
+            tracker = ProgressTracker(
+                progress, cancel, section_ends[-1], section_ends=section_ends
+            )
+        try:
+            if fileformat == "egridz":
+                write_egridz(filelike, contents, compression, tracker=tracker)
+            elif tracker is None:
+                write(filelike, contents, file_format)
+            else:
+                write(filelike, _tracked_contents(contents, tracker), file_format)
+        except Cancelled:
+            if isinstance(filelike, (str, os.PathLike)):
+                os.remove(filelike)
+            raise
+        if tracker is not None:
+            tracker.finish()
+
+
+def _tracked_contents(contents, tracker: ProgressTracker):
+    """Keyword, array pairs reporting progress as each pair is taken."""
+    for keyword, value in contents:
+        tracker.check()
+        yield keyword, value
+        tracker.advance(array_size(value)[1])
+
+
+@contextmanager
+def _open_reader(filelike, fileformat: Optional[str], **kwargs):
+    """
+    An EGridReader of the given file, with fileformat as in
+    :meth:`EGrid.from_file`, closing egridz archives on exit.
+    """
+    if fileformat == "egridz" or (fileformat is None and is_egridz(filelike)):
+        with EGridzArchive(filelike) as archive:
+            yield EGridReader(filelike, keywords=archive.entries(), **kwargs)
+        return
+    file_format = None
+    if fileformat == "egrid":
+        file_format = Format.UNFORMATTED
+    elif fileformat == "fegrid":
+        file_format = Format.FORMATTED
+    elif fileformat is not None:
+        raise ValueError(f"Unrecognized egrid file format {fileformat}")
+    yield EGridReader(filelike, file_format=file_format, **kwargs)
+
+
+@dataclass
+class EGridProbe:
+    """
+    The headers of an egrid file and the number of its subsections, see
+    :func:`probe`.
+
+    Args:
+        egrid_head: The header section of the file.
+        grid_head: The GRIDHEAD of the global grid.
+        num_lgrs: The number of LGR sections.
+        num_nncs: The number of NNC sections (NNCHEAD keywords).
+        num_amalgamations: The number of amalgamation sections (NNCHEADA
+            keywords).
+    """
+
+    egrid_head: EGridHead
+    grid_head: GridHead
+    num_lgrs: int
+    num_nncs: int
+    num_amalgamations: int
+
+
+def probe(filelike, fileformat: str = None) -> EGridProbe:
+    """
+    Read only the headers of an egrid file, and count its subsections by
+    their keywords without reading the arrays. Much faster than
+    :meth:`EGrid.from_file` for unformatted files, where arrays are skipped
+    with seek.
+
+    Args:
+        filelike (str,Path,stream): The egrid file to be probed.
+        fileformat (None or str): The format of the file, see
+            :meth:`EGrid.from_file`.
+    """
+    with _open_reader(filelike, fileformat) as reader:
+        return reader.probe()
+
+
+@dataclass
+class GlobalGridStatistics:
+    """
+    Statistics of the global grid of an egrid file, see
+    :func:`global_grid_statistics`.
+
+    Args:
+        grid_head: The GRIDHEAD of the global grid.
+        num_active: The number of active cells, all cells if the file has no
+            ACTNUM.
+        bounds: The minimum and maximum (x,y,z) of the corners as an array
+            of shape (2,3), see :meth:`CornerPointGrid.bounds`.
+    """
+
+    grid_head: GridHead
+    num_active: int
+    bounds: np.ndarray
+
+
+def global_grid_statistics(
+    filelike, fileformat: str = None, layers_per_chunk: int = None
+) -> GlobalGridStatistics:
+    """
+    The number of active cells and the bounding box of the global grid of an
+    egrid file, read one chunk of layers of ZCORN at a time for unformatted
+    and egridz files, and without reading the lgr and nnc sections.
+
+    Args:
+        filelike (str,Path,stream): The egrid file to be read.
+        fileformat (None or str): The format of the file, see
+            :meth:`EGrid.from_file`.
+        layers_per_chunk: The number of layers of ZCORN read at a time, see
+            :func:`eclio.geometry.layer_chunks`.
+    """
+    with _open_reader(filelike, fileformat) as reader:
+        return reader.global_grid_statistics(layers_per_chunk)
 
 
 keyword_translation = {
@@ -615,6 +1308,139 @@ keyword_translation = {
 }
 
 
+def _decode_string(value) -> str:
+    """
+    CHAR values are read as bytes from unformatted files and as str from
+    formatted files.
+    """
+    if hasattr(value, "decode"):
+        return value.decode("ascii")
+    return str(value)
+
+
+# Unformatted arrays are split into records of (at most) 1000 items, each
+# record surrounded by 4 byte record markers.
+_RECORD_LENGTH = 1000
+_RANGE_READ_TYPES = {b"REAL": ">f4", b"INTE": ">i4"}
+
+
+def _read_ranges(entry, ranges: Sequence[Tuple[int, int]]) -> Optional[np.ndarray]:
+    """
+    Reads the items in the given [start, stop) ranges of an unformatted
+    array entry without reading the rest of the array.
+
+    Returns:
+        The concatenated items of the ranges, or None if the entry
+        does not support reading ranges (formatted files, unsupported
+        types, or arrays split over several headers). Entries which
+        implement read_ranges themselves, such as those of egridz files,
+        are delegated to.
+    """
+    if hasattr(entry, "read_ranges"):
+        return entry.read_ranges(ranges)
+    stream = getattr(entry, "stream", None)
+    if stream is None or isinstance(stream, io.TextIOBase):
+        return None
+    entry_type = entry.read_type()
+    if entry_type not in _RANGE_READ_TYPES:
+        return None
+    length = entry.read_length()
+    if length >= 2**31:
+        return None
+    dtype = np.dtype(_RANGE_READ_TYPES[entry_type])
+    # keyword header record: marker, 8 char keyword, length, type, marker
+    data_start = entry.start + 24
+    words_per_record = _RECORD_LENGTH + 2
+    chunks = []
+    for start, stop in ranges:
+        first_record = start // _RECORD_LENGTH
+        last_record = (stop - 1) // _RECORD_LENGTH
+        last_record_length = min(_RECORD_LENGTH, length - last_record * _RECORD_LENGTH)
+        num_words = (last_record - first_record) * words_per_record + (
+            last_record_length + 1
+        )
+        stream.seek(data_start + first_record * words_per_record * 4)
+        buffer = stream.read(num_words * 4)
+        if len(buffer) != num_words * 4:
+            raise EGridFileFormatError(
+                f"Unexpected end of file in {entry.read_keyword()}"
+            )
+        words = np.frombuffer(buffer, dtype=dtype)
+        position = np.arange(num_words) % words_per_record
+        items = words[(position != 0) & (position != words_per_record - 1)]
+        offset = start - first_record * _RECORD_LENGTH
+        chunks.append(items[offset : offset + stop - start])
+    return np.concatenate(chunks)
+
+
+def _read_zcorn_box(entry, dims: Tuple[int, int, int], box: Box) -> np.ndarray:
+    """Reads the ZCORN values in the given box from the ZCORN entry."""
+    nx, ny, _ = dims
+    (i0, i1), (j0, j1), (k0, k1) = box
+    row = 2 * nx
+    layer = row * 2 * ny
+    values = _read_ranges(
+        entry,
+        [
+            (c * layer + 2 * j0 * row, c * layer + 2 * j1 * row)
+            for c in range(2 * k0, 2 * k1)
+        ],
+    )
+    if values is None:
+        return zcorn_box(entry.read_array(), dims, box)
+    values = values.reshape((2 * (k1 - k0), 2 * (j1 - j0), row))
+    return values[:, :, 2 * i0 : 2 * i1].astype(np.float32).reshape(-1)
+
+
+def _zcorn_layer_corners(
+    entry, dims: Tuple[int, int, int], layers_per_chunk: int = None
+) -> Iterable[np.ndarray]:
+    """
+    The corners (see :func:`eclio.geometry.zcorn_corner_view`) of each chunk
+    of layers of the ZCORN entry, reading one chunk at a time if the entry
+    supports reading ranges and the whole array otherwise.
+    """
+    nx, ny, _ = dims
+    layer = 8 * nx * ny
+    zcorn = None
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        if zcorn is None:
+            values = _read_ranges(entry, [(k_start * layer, k_stop * layer)])
+            if values is not None:
+                yield zcorn_corner_view(values, (nx, ny, k_stop - k_start))
+                continue
+            zcorn = np.asarray(entry.read_array())
+        yield zcorn_corner_view(zcorn, dims)[:, :, k_start:k_stop]
+
+
+def _read_cells_box(entry, dims: Tuple[int, int, int], box: Box) -> np.ndarray:
+    """Reads the values in the given box from a per cell entry such as ACTNUM."""
+    nx, ny, _ = dims
+    (i0, i1), (j0, j1), (k0, k1) = box
+    layer = nx * ny
+    values = _read_ranges(
+        entry, [(k * layer + j0 * nx, k * layer + j1 * nx) for k in range(k0, k1)]
+    )
+    if values is None:
+        return cells_box(entry.read_array(), dims, box)
+    values = values.reshape((k1 - k0, j1 - j0, nx))
+    return values[:, :, i0:i1].astype(np.int32).reshape(-1)
+
+
+class _KeywordEntry:
+    """An already read keyword, array pair with the interface of a file entry."""
+
+    def __init__(self, keyword: str, array):
+        self.keyword = keyword
+        self.array = array
+
+    def read_keyword(self) -> str:
+        return self.keyword
+
+    def read_array(self):
+        return self.array
+
+
 class EGridReader:
     """
     The EGridReader reads an egrid file through the `read` method.
@@ -623,12 +1449,119 @@ class EGridReader:
         filelike (str, Path, stream): The egrid file to read from.
         file_format (None or ecl_data_io.Format): The format of the file,
             None means guess.
+        box (None or Box): Only read the given box,
+            ((i0,i1),(j0,j1),(k0,k1)) of cells of the global grid. For
+            unformatted files, only the part of ZCORN and ACTNUM in the box is
+            read from the file. LGR and NNC sections are not read as these
+            refer to the entire global grid.
+        keywords (None or Iterable[Tuple[str, array]]): Already read
+            keyword, array pairs, or entries with read_keyword and read_array
+            methods, to read the egrid from instead of filelike, which is then
+            only used in error messages.
+        on_keyword (None or Callable[[eclio.profiling.KeywordEvent], None]):
+            Called after each keyword is read with its size and the time
+            spent reading it, see :class:`eclio.profiling.ReadProfile`.
+        progress (None or Callable[[eclio.progress.Progress], None]): Called
+            between keywords, and between chunks of
+            :data:`eclio.geometry.CHUNK_CELLS` items of COORD, ZCORN and
+            ACTNUM, with the bytes and sections read so far. For files,
+            bytes are positions in the file, otherwise they are bytes of
+            array data.
+        cancel (None or eclio.progress.CancellationToken): Checked at the
+            same points as progress is reported, raising
+            :class:`eclio.progress.Cancelled` when cancelled.
 
     """
 
-    def __init__(self, filelike, file_format: Format = None):
+    def __init__(
+        self,
+        filelike,
+        file_format: Format = None,
+        box: Box = None,
+        keywords: Optional[Iterable[Tuple[str, Any]]] = None,
+        on_keyword: Optional[Callable[[KeywordEvent], None]] = None,
+        progress: Optional[Callable[[Progress], None]] = None,
+        cancel: Optional[CancellationToken] = None,
+    ):
         self.filelike = filelike
-        self.keyword_generator = lazy_read(filelike, file_format)
+        if keywords is None:
+            self.keyword_generator = lazy_read(filelike, file_format)
+        else:
+            self.keyword_generator = (
+                _KeywordEntry(*keyword) if isinstance(keyword, tuple) else keyword
+                for keyword in keywords
+            )
+        self.box = box
+        self.on_keyword = on_keyword
+        self._tracker = None
+        if progress is not None or cancel is not None:
+            self._tracker = ProgressTracker(
+                progress, cancel, file_size(filelike) if keywords is None else None
+            )
+            self.keyword_generator = self._tracked(self.keyword_generator)
+
+    def _tracked(self, entries):
+        origin = None
+        for entry in entries:
+            start = getattr(entry, "start", None)
+            if start is None:
+                self._tracker.advance(0)
+            else:
+                if origin is None:
+                    origin = start
+                self._tracker.update(start - origin)
+            yield entry
+
+    def _read_chunked(self, entry, dtype) -> np.ndarray:
+        """
+        Reads the array of entry in ranges of :data:`CHUNK_CELLS` items,
+        checking for cancellation and reporting progress after each range,
+        or all at once if the entry does not support reading ranges.
+        """
+        if not hasattr(entry, "read_length"):
+            return np.asarray(entry.read_array(), dtype=dtype)
+        length = entry.read_length()
+        result = np.empty(length, dtype=dtype)
+        for start in range(0, length, CHUNK_CELLS):
+            stop = min(start + CHUNK_CELLS, length)
+            values = _read_ranges(entry, [(start, stop)])
+            if values is None:
+                return np.asarray(entry.read_array(), dtype=dtype)
+            result[start:stop] = values
+            if hasattr(entry, "start"):
+                self._tracker.advance(values.nbytes)
+            else:
+                # bytes of entries without a file position are counted
+                # once the whole array is read, see read_section
+                self._tracker.advance(0)
+        return result
+
+    def _end_section(self):
+        if self._tracker is not None:
+            self._tracker.end_section()
+
+    def _read_keyword(self, kw, entry, keyword_factories, entry_factories):
+        if self.on_keyword is None:
+            if kw in entry_factories:
+                return entry_factories[kw](entry)
+            return keyword_factories[kw](entry.read_array())
+        start = time.perf_counter()
+        if kw in entry_factories:
+            # entry factories read the array themselves, so only the
+            # size of the resulting value is known
+            value = entry_factories[kw](entry)
+            decoded = time.perf_counter()
+            length, nbytes = array_size(value)
+        else:
+            array = entry.read_array()
+            decoded = time.perf_counter()
+            value = keyword_factories[kw](array)
+            length, nbytes = array_size(array)
+        end = time.perf_counter()
+        self.on_keyword(
+            KeywordEvent(kw, length, nbytes, decoded - start, end - decoded)
+        )
+        return value
 
     def read_section(
         self,
@@ -637,6 +1570,7 @@ class EGridReader:
         stop_keywords: Iterable[str],
         skip_keywords: Iterable[str] = [],
         keyword_visitors: Iterable[Callable] = [],
+        entry_factories: Dict[str, Callable] = {},
     ):
         """
         Read a general egrid file section.
@@ -654,6 +1588,9 @@ class EGridReader:
                 "visit" each keyword. Each of these functions are called
                 for each keyword, value pair and can be used to
                 preprocess the data.
+            entry_factories (dict[str, func]): Overrides keyword_factories
+                with functions that are given the array entry itself instead of
+                the array, and so can decide how much of the array to read.
 
         Returns:
             dictionary of parameters for the constructor of the given section.
@@ -677,15 +1614,22 @@ class EGridReader:
                 break
             if kw in results:
                 raise EGridFileFormatError(f"Duplicate keyword {kw} in {self.filelike}")
+            if kw not in keyword_factories:
+                raise EGridFileFormatError(f"Unknown egrid keyword {kw}")
             try:
-                factory = keyword_factories[kw]
-            except KeyError as err:
-                raise EGridFileFormatError(f"Unknown egrid keyword {kw}") from err
-            try:
-                value = factory(entry.read_array())
+                value = self._read_keyword(
+                    kw, entry, keyword_factories, entry_factories
+                )
                 results[kw] = value
             except (ValueError, IndexError, TypeError) as err:
                 raise EGridFileFormatError(f"Incorrect values in keyword {kw}") from err
+            if (
+                self._tracker is not None
+                and not hasattr(entry, "start")
+                and isinstance(value, np.ndarray)
+            ):
+                # Entries without a file position count bytes of arrays read
+                self._tracker.bytes_done += value.nbytes
             for visit in keyword_visitors:
                 visit(kw, value)
             i += 1
@@ -722,25 +1666,60 @@ class EGridReader:
         keyword encountered.
         """
 
+        grid_heads = []
+
         def check_gridhead(kw: str, value):
             if kw == "GRIDHEAD" and value.type_of_grid != TypeOfGrid.CORNER_POINT:
                 raise NotImplementedError(
                     "XTGeo does not support unstructured or mixed grids."
                 )
+            if kw == "GRIDHEAD":
+                grid_heads.append(value)
+
+        def in_box(read_box):
+            def entry_factory(entry):
+                if not grid_heads:
+                    raise EGridFileFormatError(
+                        f"GRIDHEAD must come before {entry.read_keyword()}"
+                    )
+                dims = grid_heads[0].dimensions
+                return read_box(entry, dims, check_box(self.box, dims))
+
+            return entry_factory
+
+        entry_factories = {}
+        if self.box is not None:
+            entry_factories = {
+                "COORD   ": in_box(
+                    lambda entry, dims, box: coord_box(
+                        np.array(entry.read_array(), dtype=np.float32), dims, box
+                    )
+                ),
+                "ZCORN   ": in_box(_read_zcorn_box),
+                "ACTNUM  ": in_box(_read_cells_box),
+                "CORSNUM ": in_box(_read_cells_box),
+            }
+        elif self._tracker is not None:
+            entry_factories = {
+                "COORD   ": lambda entry: self._read_chunked(entry, np.float32),
+                "ZCORN   ": lambda entry: self._read_chunked(entry, np.float32),
+                "ACTNUM  ": lambda entry: self._read_chunked(entry, np.int32),
+            }
 
         params = self.read_section(
             keyword_factories={
                 "GRIDHEAD": GridHead.from_ecl,
                 "BOXORIG ": tuple,
                 "COORDSYS": MapAxes.from_ecl,
-                "COORD   ": lambda x: np.array(x, dtype=np.float32),
-                "ZCORN   ": lambda x: np.array(x, dtype=np.float32),
-                "ACTNUM  ": lambda x: np.array(x, dtype=np.int32),
-                "CORSNUM ": lambda x: np.array(x, dtype=np.int32),
+                "COORD   ": lambda x: np.asarray(x, dtype=np.float32),
+                "ZCORN   ": lambda x: np.asarray(x, dtype=np.float32),
+                "ACTNUM  ": lambda x: np.asarray(x, dtype=np.int32),
+                "CORSNUM ": lambda x: np.asarray(x, dtype=np.int32),
             },
             required_keywords={"GRIDHEAD", "COORD   ", "ZCORN   "},
             stop_keywords=["ENDGRID "],
             keyword_visitors=[check_gridhead],
+            entry_factories=entry_factories,
         )
         try:
             entry = next(self.keyword_generator)
@@ -750,6 +1729,10 @@ class EGridReader:
             ) from err
         if entry.read_keyword() != "ENDGRID ":
             raise EGridFileFormatError("Did not read ENDGRID after global grid")
+        if self.box is not None:
+            box = check_box(self.box, params["grid_head"].dimensions)
+            params["grid_head"] = _box_grid_head(params["grid_head"], box)
+            params["boxorig"] = _box_boxorig(params.get("boxorig"), box)
         return GlobalGrid(**params)
 
     def read_subsections(self) -> Tuple[List[LGRSection], List[NNCSection]]:
@@ -775,6 +1758,7 @@ class EGridReader:
                 raise EGridFileFormatError(
                     f"egrid subsection started with unexpected keyword {keyword}"
                 )
+            self._end_section()
         return lgr_sections, nnc_sections
 
     def read_lgr_subsection(self) -> LGRSection:
@@ -785,16 +1769,16 @@ class EGridReader:
         """
         params = self.read_section(
             keyword_factories={
-                "LGR     ": lambda x: x[0].decode("ascii"),
-                "LGRPARNT": lambda x: x[0].decode("ascii"),
-                "LGRSGRID": lambda x: x[0].decode("ascii"),
+                "LGR     ": lambda x: _decode_string(x[0]),
+                "LGRPARNT": lambda x: _decode_string(x[0]),
+                "LGRSGRID": lambda x: _decode_string(x[0]),
                 "GRIDHEAD": GridHead.from_ecl,
                 "BOXORIG ": tuple,
                 "COORDSYS": MapAxes.from_ecl,
-                "COORD   ": lambda x: np.array(x, dtype=np.float32),
-                "ZCORN   ": lambda x: np.array(x, dtype=np.float32),
-                "ACTNUM  ": lambda x: np.array(x, dtype=np.int32),
-                "HOSTNUM ": lambda x: np.array(x, dtype=np.int32),
+                "COORD   ": lambda x: np.asarray(x, dtype=np.float32),
+                "ZCORN   ": lambda x: np.asarray(x, dtype=np.float32),
+                "ACTNUM  ": lambda x: np.asarray(x, dtype=np.int32),
+                "HOSTNUM ": lambda x: np.asarray(x, dtype=np.int32),
             },
             required_keywords={
                 "LGR     ",
@@ -823,10 +1807,10 @@ class EGridReader:
         params = self.read_section(
             keyword_factories={
                 "NNCHEAD ": NNCHead.from_ecl,
-                "NNC1    ": lambda x: np.array(x, dtype=np.int32),
-                "NNC2    ": lambda x: np.array(x, dtype=np.int32),
-                "NNCL    ": lambda x: np.array(x, dtype=np.int32),
-                "NNCG    ": lambda x: np.array(x, dtype=np.int32),
+                "NNC1    ": lambda x: np.asarray(x, dtype=np.int32),
+                "NNC2    ": lambda x: np.asarray(x, dtype=np.int32),
+                "NNCL    ": lambda x: np.asarray(x, dtype=np.int32),
+                "NNCG    ": lambda x: np.asarray(x, dtype=np.int32),
             },
             required_keywords={"NNCHEAD ", "NNC1    ", "NNC2    "},
             stop_keywords=["NNCHEAD ", "LGR     ", "NNCHEADA"],
@@ -842,20 +1826,101 @@ class EGridReader:
         params = self.read_section(
             keyword_factories={
                 "NNCHEADA": lambda x: tuple(x[0:2]),
-                "NNA1    ": lambda x: np.array(x, dtype=np.int32),
-                "NNA2    ": lambda x: np.array(x, dtype=np.int32),
+                "NNA1    ": lambda x: np.asarray(x, dtype=np.int32),
+                "NNA2    ": lambda x: np.asarray(x, dtype=np.int32),
             },
             required_keywords={"NNCHEADA", "NNA1    ", "NNA2    "},
             stop_keywords=["NNCHEAD ", "LGR     ", "NNCHEADA"],
         )
         return AmalgamationSection(**params)
 
+    def probe(self) -> EGridProbe:
+        """
+        Reads the EGrid header and the GRIDHEAD of the global grid, then
+        counts the remaining section keywords without reading their arrays.
+        """
+        header = self.read_header()
+        try:
+            entry = next(self.keyword_generator)
+        except StopIteration as err:
+            raise EGridFileFormatError("Did not read GRIDHEAD after header") from err
+        if entry.read_keyword() != "GRIDHEAD":
+            raise EGridFileFormatError("Did not read GRIDHEAD after header")
+        try:
+            grid_head = GridHead.from_ecl(entry.read_array())
+        except (ValueError, IndexError, TypeError) as err:
+            raise EGridFileFormatError("Incorrect values in keyword GRIDHEAD") from err
+        counts = Counter(entry.read_keyword() for entry in self.keyword_generator)
+        return EGridProbe(
+            header,
+            grid_head,
+            counts["LGR     "],
+            counts["NNCHEAD "],
+            counts["NNCHEADA"],
+        )
+
+    def global_grid_statistics(
+        self, layers_per_chunk: int = None
+    ) -> GlobalGridStatistics:
+        """
+        Reads the GRIDHEAD, COORD and ACTNUM of the global grid, and ZCORN a
+        chunk of layers at a time, up to the first ENDGRID, see
+        :func:`global_grid_statistics`.
+        """
+        header = self.read_header()
+        if header.file_head.type_of_grid != TypeOfGrid.CORNER_POINT:
+            raise NotImplementedError(
+                "XTGeo does not support unstructured or mixed grids."
+            )
+        grid_head = None
+        coord = None
+        num_active = None
+        pillar_depths = None
+        for entry in self.keyword_generator:
+            keyword = entry.read_keyword()
+            if keyword == "ENDGRID ":
+                break
+            if keyword == "GRIDHEAD":
+                grid_head = GridHead.from_ecl(entry.read_array())
+                if grid_head.type_of_grid != TypeOfGrid.CORNER_POINT:
+                    raise NotImplementedError(
+                        "XTGeo does not support unstructured or mixed grids."
+                    )
+            elif grid_head is None:
+                raise EGridFileFormatError(f"GRIDHEAD must come before {keyword}")
+            elif keyword == "COORD   ":
+                coord = np.asarray(entry.read_array(), dtype=np.float32)
+            elif keyword == "ACTNUM  ":
+                num_active = int(np.count_nonzero(entry.read_array()))
+            elif keyword == "ZCORN   ":
+                pillar_depths = pillar_depth_range(
+                    _zcorn_layer_corners(entry, grid_head.dimensions, layers_per_chunk),
+                    grid_head.dimensions,
+                )
+        else:
+            raise EGridFileFormatError("Did not read ENDGRID after global grid")
+        if coord is None or pillar_depths is None:
+            raise EGridFileFormatError("Global grid is missing COORD or ZCORN")
+        dims = grid_head.dimensions
+        if num_active is None:
+            num_active = int(np.prod(dims))
+        return GlobalGridStatistics(
+            grid_head, num_active, pillar_bounds(coord, dims, *pillar_depths)
+        )
+
     def read(self) -> EGrid:
         header = self.read_header()
         if header.file_head.type_of_grid != TypeOfGrid.CORNER_POINT:
             raise NotImplementedError(
                 "XTGeo does not support unstructured or mixed grids."
             )
+        self._end_section()
         global_grid = self.read_global_grid()
-        lgr_sections, nnc_sections = self.read_subsections()
+        self._end_section()
+        if self.box is not None:
+            lgr_sections, nnc_sections = [], []
+        else:
+            lgr_sections, nnc_sections = self.read_subsections()
+        if self._tracker is not None:
+            self._tracker.finish()
         return EGrid(header, global_grid, lgr_sections, nnc_sections)
@@ -0,0 +1,335 @@
+"""
+The egridz format: the keywords of an egrid file stored as independently
+compressed chunks.
+
+An egridz file consists of
+
+* the 8 byte magic ``b"EGRIDZ\\x00\\x01"``,
+* the compressed chunks of each keyword, one after the other,
+* a json index giving for each keyword its name, dtype, length and the
+  offset and compressed size of each of its chunks,
+* the size of the json index as a little-endian uint64 followed by the 8
+  byte magic again.
+
+Each chunk holds up to ``chunk_items`` items of the keyword in little-endian
+byte order, so a range of items, such as the part of ZCORN in a box of
+cells, can be read by decompressing only the chunks overlapping that range.
+
+The "zlib" compression is always available, "zstd" requires the zstandard
+package and "lz4" requires the lz4 package.
+"""
+import io
+import json
+import os
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from ecl_data_io import MESS
+
+from .progress import ProgressTracker
+
+MAGIC = b"EGRIDZ\x00\x01"
+
+#: Default number of items in each compressed chunk.
+CHUNK_ITEMS = 2**20
+
+_FOOTER = struct.Struct("<Q8s")
+
+
+class EGridzFormatError(ValueError):
+    pass
+
+
+def _zlib_codec():
+    import zlib
+
+    return (lambda data: zlib.compress(data, 6)), zlib.decompress
+
+
+def _zstd_codec():
+    import zstandard
+
+    # zstandard (de)compressor objects are not thread safe
+    return (
+        lambda data: zstandard.ZstdCompressor().compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+def _lz4_codec():
+    import lz4.frame
+
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+_CODECS: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "zlib": _zlib_codec,
+    "zstd": _zstd_codec,
+    "lz4": _lz4_codec,
+}
+
+
+def _codec(compression: str) -> Tuple[Callable, Callable]:
+    if compression not in _CODECS:
+        raise ValueError(
+            f"Unknown egridz compression {compression}, expected one of {list(_CODECS)}"
+        )
+    try:
+        return _CODECS[compression]()
+    except ImportError as err:
+        raise ImportError(
+            f"egridz compression {compression} requires an optional dependency"
+        ) from err
+
+
+def is_egridz(filelike) -> bool:
+    """Whether the given path or seekable binary stream is an egridz file."""
+    if isinstance(filelike, io.TextIOBase):
+        return False
+    if hasattr(filelike, "read"):
+        position = filelike.tell()
+        magic = filelike.read(len(MAGIC))
+        filelike.seek(position)
+        return magic == MAGIC
+    try:
+        with open(filelike, "rb") as stream:
+            return stream.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _as_array(value) -> Optional[np.ndarray]:
+    """The keyword value as a little-endian array, or None for MESS."""
+    if value is MESS:
+        return None
+    array = np.asarray(value)
+    if array.dtype.kind == "U":
+        array = np.char.encode(array, "ascii")
+    if array.dtype.kind not in "Sbiuf":
+        raise ValueError(f"Unsupported egridz array type {array.dtype}")
+    return array.astype(array.dtype.newbyteorder("<"), copy=False).reshape(-1)
+
+
+def encoded_value(value):
+    """
+    The keyword value as written to egridz files, MESS or a flat
+    little-endian array with strings encoded as ascii bytes.
+    """
+    if value is MESS:
+        return MESS
+    return _as_array(value)
+
+
+def write_egridz(
+    filelike,
+    contents: Iterable[Tuple[str, Any]],
+    compression: str = "zlib",
+    chunk_items: int = CHUNK_ITEMS,
+    workers: Optional[int] = None,
+    tracker: Optional[ProgressTracker] = None,
+):
+    """
+    Write keyword, array pairs to an egridz file.
+
+    Args:
+        filelike: Path or binary stream to write to.
+        contents: The keyword, array pairs such as produced by the to_ecl
+            methods of the egrid sections. Iterated once, as the chunks are
+            written, so that a generator reading one array at a time only
+            keeps the arrays of the chunks waiting to be written in memory.
+        compression: "zlib", "zstd" or "lz4".
+        chunk_items: Number of items in each compressed chunk.
+        workers: Number of threads compressing chunks, defaults to the
+            number of cpus.
+        tracker: Advanced by the uncompressed size of each chunk written,
+            which also checks for cancellation between chunks.
+    """
+    if hasattr(filelike, "write"):
+        _write_stream(filelike, contents, compression, chunk_items, workers, tracker)
+    else:
+        with open(filelike, "wb") as stream:
+            _write_stream(stream, contents, compression, chunk_items, workers, tracker)
+
+
+def _chunks(contents, keywords: List[Dict[str, Any]], chunk_items: int):
+    """
+    The chunks of the arrays in contents, with the keyword index each chunk
+    belongs to. The index of each keyword is appended to keywords when the
+    keyword is reached, so contents is only read as far as the chunks are.
+    """
+    for keyword, value in contents:
+        array = _as_array(value)
+        if array is None:
+            keywords.append({"keyword": keyword, "dtype": "MESS", "length": 0})
+            continue
+        index = {
+            "keyword": keyword,
+            "dtype": array.dtype.str,
+            "length": len(array),
+            "chunks": [],
+        }
+        keywords.append(index)
+        for i in range(0, len(array), chunk_items):
+            yield index, memoryview(array[i : i + chunk_items]).cast("B")
+
+
+def _write_stream(stream, contents, compression, chunk_items, workers, tracker):
+    compress, _ = _codec(compression)
+    keywords: List[Dict[str, Any]] = []
+    stream.write(MAGIC)
+    offset = len(MAGIC)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(workers) as executor:
+        # Only a few chunks are submitted ahead of the one being written, so
+        # that a cancelled write does not wait for all chunks to compress,
+        # and only the arrays of those chunks are kept in memory
+        pending = deque()
+
+        def write_next():
+            nonlocal offset
+            index, chunk, future = pending.popleft()
+            compressed = future.result()
+            stream.write(compressed)
+            index["chunks"].append((offset, len(compressed)))
+            offset += len(compressed)
+            if tracker is not None:
+                tracker.advance(len(chunk))
+
+        for index, chunk in _chunks(contents, keywords, chunk_items):
+            pending.append((index, chunk, executor.submit(compress, chunk)))
+            if len(pending) > 2 * workers:
+                write_next()
+        while pending:
+            write_next()
+    index = json.dumps(
+        {"compression": compression, "chunk_items": chunk_items, "keywords": keywords}
+    ).encode("utf-8")
+    stream.write(index)
+    stream.write(_FOOTER.pack(len(index), MAGIC))
+
+
+class EGridzEntry:
+    """
+    One keyword of an egridz file, with the same read_keyword and read_array
+    methods as the entries of ecl_data_io.lazy_read, and read_ranges for
+    reading parts of the array.
+    """
+
+    def __init__(self, archive: "EGridzArchive", index: Dict[str, Any]):
+        self.archive = archive
+        self.keyword = index["keyword"]
+        self.dtype = None if index["dtype"] == "MESS" else np.dtype(index["dtype"])
+        self.length = index["length"]
+        self.chunks = index.get("chunks", [])
+
+    def read_keyword(self) -> str:
+        return self.keyword
+
+    def read_length(self) -> int:
+        return self.length
+
+    def _read_chunk(self, number: int) -> np.ndarray:
+        offset, size = self.chunks[number]
+        return np.frombuffer(self.archive.read_chunk(offset, size), dtype=self.dtype)
+
+    def read_array(self):
+        if self.dtype is None:
+            return MESS
+        if not self.chunks:
+            return np.empty(0, dtype=self.dtype)
+        return np.concatenate(
+            [self._read_chunk(number) for number in range(len(self.chunks))]
+        )
+
+    def read_ranges(self, ranges: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """
+        The concatenated items in the given [start, stop) ranges, only
+        decompressing the chunks which overlap the ranges.
+        """
+        chunk_items = self.archive.chunk_items
+        cache: Dict[int, np.ndarray] = {}
+        parts = []
+        for start, stop in ranges:
+            if not 0 <= start <= stop <= self.length:
+                raise ValueError(
+                    f"Range {start}:{stop} outside {self.keyword} of length"
+                    f" {self.length}"
+                )
+            for number in range(start // chunk_items, -(-stop // chunk_items)):
+                if number not in cache:
+                    cache[number] = self._read_chunk(number)
+                chunk_start = number * chunk_items
+                parts.append(
+                    cache[number][
+                        max(start - chunk_start, 0) : min(
+                            stop - chunk_start, chunk_items
+                        )
+                    ]
+                )
+        if not parts:
+            return np.empty(0, dtype=self.dtype)
+        return np.concatenate(parts)
+
+
+class EGridzArchive:
+    """
+    Reads the index of an egridz file, giving access to its keywords
+    through :meth:`entries`.
+
+    Can be used as a context manager, closing the file if it was opened
+    from a path.
+
+    Args:
+        filelike: Path or seekable binary stream of the egridz file.
+    """
+
+    def __init__(self, filelike):
+        self.owns_stream = not hasattr(filelike, "read")
+        if self.owns_stream:
+            self.stream = open(filelike, "rb")
+        else:
+            self.stream = filelike
+        try:
+            self._read_index(filelike)
+        except BaseException:
+            self.close()
+            raise
+
+    def _read_index(self, filelike):
+        self.start = self.stream.tell()
+        if self.stream.read(len(MAGIC)) != MAGIC:
+            raise EGridzFormatError(f"{filelike} is not an egridz file")
+        self.stream.seek(-_FOOTER.size, io.SEEK_END)
+        index_size, magic = _FOOTER.unpack(self.stream.read(_FOOTER.size))
+        if magic != MAGIC:
+            raise EGridzFormatError(f"{filelike} is a truncated egridz file")
+        self.stream.seek(-_FOOTER.size - index_size, io.SEEK_END)
+        index = json.loads(self.stream.read(index_size).decode("utf-8"))
+        self.compression = index["compression"]
+        self.chunk_items = index["chunk_items"]
+        _, self._decompress = _codec(self.compression)
+        self._index = index["keywords"]
+
+    def read_chunk(self, offset: int, size: int) -> bytes:
+        self.stream.seek(self.start + offset)
+        data = self.stream.read(size)
+        if len(data) != size:
+            raise EGridzFormatError("Unexpected end of egridz file")
+        return self._decompress(data)
+
+    def entries(self) -> List[EGridzEntry]:
+        return [EGridzEntry(self, index) for index in self._index]
+
+    def close(self):
+        if self.owns_stream:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,298 @@
+"""
+Delta encoding of ensembles of grids.
+
+Realisations of an ensemble typically share most of their geometry and
+differ only in ACTNUM, a few layers of ZCORN or the nncs.
+:class:`GridEnsemble` stores one base :class:`eclio.egrid.EGrid` and, for
+each member, only the keywords that differ from the base, as runs of
+changed values::
+
+    ensemble = GridEnsemble(EGrid.from_file("REAL0/CASE.EGRID"))
+    for path in paths:
+        ensemble.add(EGrid.from_file(path))
+    ensemble.save("ensemble.npz")
+    member = GridEnsemble.load("ensemble.npz")[10]
+
+"""
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .egrid import EGrid, EGridReader
+
+# Changed values closer than this many items are stored as one run, as
+# each run has an overhead of two indices.
+_RUN_GAP = 4
+
+
+def _as_array(value) -> np.ndarray:
+    array = np.asarray(value).reshape(-1)
+    if array.dtype.kind == "U":
+        array = np.char.encode(array, "ascii")
+    return array
+
+
+def _sections(grid: EGrid) -> List[Any]:
+    return [grid.egrid_head, grid.global_grid] + grid.lgr_sections + grid.nnc_sections
+
+
+def _changed(base: np.ndarray, member: np.ndarray) -> np.ndarray:
+    """Mask of the items of member that differ from base, nan equals nan."""
+    changed = base != member
+    if member.dtype.kind == "f":
+        changed &= ~(np.isnan(base) & np.isnan(member))
+    return changed
+
+
+def _runs(changed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """The [start, stop) ranges of runs of True in changed, merging close runs."""
+    edges = np.flatnonzero(np.diff(changed.astype(np.int8), prepend=0, append=0))
+    starts, stops = edges[0::2], edges[1::2]
+    if len(starts) > 1:
+        keep = np.ones(len(starts), dtype=bool)
+        keep[1:] = starts[1:] - stops[:-1] > _RUN_GAP
+        stops = np.append(stops[np.flatnonzero(keep)[1:] - 1], stops[-1])
+        starts = starts[keep]
+    return starts, stops
+
+
+def _run_indices(starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """The indices of all items in the given runs."""
+    lengths = stops - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(lengths.sum())
+
+
+@dataclass
+class KeywordDelta:
+    """
+    A keyword of a member of a :class:`GridEnsemble`.
+
+    Args:
+        keyword: The name of the keyword.
+        base_index: The index of the keyword in the base which the keyword
+            is a patch of, or None if values contains the entire array.
+        starts: Start of each run of changed values.
+        stops: End (exclusive) of each run of changed values.
+        values: The changed values of all runs, concatenated, or the entire
+            array if base_index is None.
+    """
+
+    keyword: str
+    base_index: Optional[int]
+    starts: np.ndarray
+    stops: np.ndarray
+    values: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.stops.nbytes + self.values.nbytes
+
+    def apply(self, base: List[Tuple[str, np.ndarray]]) -> np.ndarray:
+        """The member array, given the keywords of the base."""
+        if self.base_index is None:
+            return self.values
+        array = base[self.base_index][1]
+        if len(self.values) == 0:
+            return array
+        array = array.copy()
+        array[_run_indices(self.starts, self.stops)] = self.values
+        return array
+
+
+SectionKeywords = List[Tuple[Any, List[Tuple[str, np.ndarray]]]]
+
+
+def section_keywords(grid: EGrid) -> SectionKeywords:
+    """
+    Each section of the grid in file order, with its keyword, array pairs.
+    The arrays are read-only as they are shared by the decoded members.
+    """
+    result = []
+    for section in _sections(grid):
+        keywords = [(kw, _as_array(value)) for kw, value in section.to_ecl()]
+        for _, array in keywords:
+            array.flags.writeable = False
+        result.append((section, keywords))
+    return result
+
+
+def _flatten(sections: SectionKeywords) -> List[Tuple[str, np.ndarray]]:
+    return [keyword for _, keywords in sections for keyword in keywords]
+
+
+def encode_delta(
+    base: Union[EGrid, SectionKeywords], member: EGrid
+) -> List[KeywordDelta]:
+    """
+    The keywords of member as patches of the keywords of base.
+
+    Sections of member equal to the corresponding section of base (compared
+    with section equality, which is fast for sections with cached
+    fingerprints) are stored as references to the base keywords. Otherwise
+    each keyword with the same name, size and type as the keyword at the same
+    position of the corresponding base section is stored as runs of changed
+    values, and remaining keywords are stored in full.
+
+    Args:
+        base: The base grid, or its :func:`section_keywords` to avoid
+            recomputing them for each member.
+        member: The grid to encode.
+    """
+    if isinstance(base, EGrid):
+        base = section_keywords(base)
+    empty = np.zeros(0, dtype=np.int64)
+    result = []
+    base_start = 0
+    for number, section in enumerate(_sections(member)):
+        base_section, base_keywords = base[number] if number < len(base) else (None, [])
+        if base_section is not None and section == base_section:
+            for offset, (keyword, base_array) in enumerate(base_keywords):
+                result.append(
+                    KeywordDelta(
+                        keyword, base_start + offset, empty, empty, base_array[:0]
+                    )
+                )
+            base_start += len(base_keywords)
+            continue
+        for offset, (keyword, value) in enumerate(section.to_ecl()):
+            array = _as_array(value)
+            base_array = None
+            if offset < len(base_keywords):
+                base_keyword, base_array = base_keywords[offset]
+                if (
+                    base_keyword != keyword
+                    or base_array.shape != array.shape
+                    or base_array.dtype != array.dtype
+                ):
+                    base_array = None
+            base_index = base_start + offset
+            if base_array is None:
+                result.append(KeywordDelta(keyword, None, empty, empty, array))
+            else:
+                starts, stops = _runs(_changed(base_array, array))
+                values = array[_run_indices(starts, stops)]
+                result.append(KeywordDelta(keyword, base_index, starts, stops, values))
+        base_start += len(base_keywords)
+    return result
+
+
+def decode_delta(
+    base_keywords: List[Tuple[str, np.ndarray]], delta: List[KeywordDelta]
+) -> EGrid:
+    """
+    The inverse of :func:`encode_delta`.
+
+    Args:
+        base_keywords: The keyword, array pairs of the base in file order.
+        delta: The delta of the member from the base.
+    """
+    return EGridReader(
+        "ensemble member",
+        keywords=[(kw.keyword, kw.apply(base_keywords)) for kw in delta],
+    ).read()
+
+
+class GridEnsemble:
+    """
+    A base grid and the deltas of each member of an ensemble from the base.
+
+    Members share the arrays which are equal to the base, so the arrays of
+    members returned by indexing may be read-only.
+
+    Args:
+        base: The grid which members are stored as deltas of, typically the
+            first realisation.
+    """
+
+    def __init__(self, base: EGrid):
+        self.base = base
+        self._base_sections = section_keywords(base)
+        self.base_keywords = _flatten(self._base_sections)
+        self.deltas: List[List[KeywordDelta]] = []
+
+    def add(self, member: EGrid) -> int:
+        """Add a member to the ensemble, returning its index."""
+        self.deltas.append(encode_delta(self._base_sections, member))
+        return len(self.deltas) - 1
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    def __getitem__(self, index: int) -> EGrid:
+        return decode_delta(self.base_keywords, self.deltas[index])
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the arrays of the base and the deltas."""
+        return sum(array.nbytes for _, array in self.base_keywords) + sum(
+            keyword.nbytes for delta in self.deltas for keyword in delta
+        )
+
+    def save(self, path, compressed: bool = False):
+        """
+        Save the ensemble to a .npz file.
+
+        Args:
+            path: The file to write to.
+            compressed: Whether to compress the arrays with
+                numpy.savez_compressed.
+        """
+        arrays = {}
+        index = {"base": [], "members": []}
+        for number, (keyword, array) in enumerate(self.base_keywords):
+            arrays[f"base_{number}"] = array
+            index["base"].append(keyword)
+        for member, delta in enumerate(self.deltas):
+            keywords = []
+            for number, keyword in enumerate(delta):
+                # Unchanged keywords are only stored in the index
+                stored = keyword.base_index is None or len(keyword.values) > 0
+                if stored:
+                    name = f"member_{member}_{number}"
+                    arrays[f"{name}_starts"] = keyword.starts
+                    arrays[f"{name}_stops"] = keyword.stops
+                    arrays[f"{name}_values"] = keyword.values
+                keywords.append([keyword.keyword, keyword.base_index, stored])
+            index["members"].append(keywords)
+        arrays["index"] = np.array(json.dumps(index))
+        if compressed:
+            np.savez_compressed(path, **arrays)
+        else:
+            np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path) -> "GridEnsemble":
+        """Load an ensemble saved with :meth:`save`."""
+        empty = np.zeros(0, dtype=np.int64)
+        with np.load(path, allow_pickle=False) as arrays:
+            index = json.loads(str(arrays["index"]))
+            base_keywords = [
+                (keyword, arrays[f"base_{number}"])
+                for number, keyword in enumerate(index["base"])
+            ]
+            deltas = []
+            for member, keywords in enumerate(index["members"]):
+                delta = []
+                for number, (keyword, base_index, stored) in enumerate(keywords):
+                    if not stored:
+                        delta.append(
+                            KeywordDelta(keyword, base_index, empty, empty, empty)
+                        )
+                        continue
+                    name = f"member_{member}_{number}"
+                    delta.append(
+                        KeywordDelta(
+                            keyword,
+                            base_index,
+                            arrays[f"{name}_starts"],
+                            arrays[f"{name}_stops"],
+                            arrays[f"{name}_values"],
+                        )
+                    )
+                deltas.append(delta)
+        ensemble = cls(EGridReader("ensemble base", keywords=base_keywords).read())
+        ensemble.deltas = deltas
+        return ensemble
@@ -0,0 +1,113 @@
+"""
+Stable, non-cryptographic content hashes of the sections of an egrid.
+
+The hash is consistent with the equality of the sections: arrays are hashed
+by shape and value, not by dtype or byte order, so that e.g. an int32 actnum
+and an int64 actnum with the same values get the same hash, just as they
+compare equal with ``np.array_equal``.
+"""
+import zlib
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+#: Number of array elements hashed at a time.
+HASH_CHUNK = 2**20
+
+
+def _hash_update(checksums, data: bytes):
+    crc, adler = checksums
+    return zlib.crc32(data, crc), zlib.adler32(data, adler)
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Convert value so that values which compare equal have equal repr, e.g.
+    numpy scalars and python numbers.
+    """
+    if isinstance(value, Enum):
+        return value
+    if is_dataclass(value):
+        return (type(value).__name__,) + tuple(
+            _canonical(getattr(value, f.name)) for f in fields(value)
+        )
+    if isinstance(value, (tuple, list)):
+        return tuple(_canonical(v) for v in value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value) + 0.0
+    return value
+
+
+def content_hash(values: Iterable[Any]) -> int:
+    """A 64 bit hash of the given values.
+
+    Arrays are hashed by shape and value, with values converted to
+    little-endian float64 (with -0.0 normalized to 0.0) in chunks of
+    :data:`HASH_CHUNK` elements. Other values are hashed by their repr, with
+    numbers, tuples and dataclasses normalized in the same way.
+
+    Args:
+        values: The values to hash, typically the fields of a section.
+    Returns:
+        The hash, stable between processes and platforms.
+    """
+    checksums = (0, 1)
+    for value in values:
+        if isinstance(value, np.ndarray):
+            checksums = _hash_update(checksums, f"array{value.shape}".encode())
+            flat = value.reshape(-1)
+            for start in range(0, flat.size, HASH_CHUNK):
+                chunk = flat[start : start + HASH_CHUNK].astype("<f8") + 0.0
+                checksums = _hash_update(checksums, chunk.tobytes())
+        else:
+            checksums = _hash_update(checksums, repr(_canonical(value)).encode())
+    crc, adler = checksums
+    return (crc << 32) | adler
+
+
+class Fingerprinted:
+    """
+    Mixin for the dataclass sections of an egrid giving a cached
+    :func:`content_hash` of all the fields.
+
+    The fingerprint is cached for as long as the fields refer to the same
+    objects, modifying arrays in place after calling fingerprint() requires
+    calling fingerprint(refresh=True).
+    """
+
+    def _field_values(self):
+        return [type(self).__name__] + [getattr(self, f.name) for f in fields(self)]
+
+    def fingerprint(self, refresh: bool = False) -> int:
+        """
+        The content hash of the section. Equal sections have equal
+        fingerprints.
+
+        Args:
+            refresh: Whether to recompute a cached fingerprint.
+        """
+        values = self._field_values()
+        cached = self._cached_fingerprint(values)
+        if refresh or cached is None:
+            cached = content_hash(values)
+            # Keeps the hashed values alive so that they are not replaced by
+            # new objects reusing their ids
+            self._fingerprint_cache = (values, cached)
+        return cached
+
+    def _cached_fingerprint(self, values: Optional[list] = None) -> Optional[int]:
+        cached = getattr(self, "_fingerprint_cache", None)
+        if cached is None:
+            return None
+        if values is None:
+            values = self._field_values()
+        hashed_values, fingerprint = cached
+        if len(hashed_values) != len(values) or any(
+            hashed is not value for hashed, value in zip(hashed_values, values)
+        ):
+            return None
+        return fingerprint
@@ -0,0 +1,641 @@
+"""
+Vectorised computations on the corner point geometry arrays (COORD, ZCORN
+and ACTNUM) of egrid files.
+
+The functions in this module work directly on the flat arrays as they are
+stored in the file (see :mod:`eclio.egrid` for a description of the layout)
+and avoid python level loops over pillars or cells.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+from .ecl_output_file import MapAxes
+
+
+def map_axes_transform(mapaxes: MapAxes) -> Tuple[np.ndarray, np.ndarray]:
+    """The affine transform from local grid coordinates to map coordinates.
+
+    The x and y axis of the local coordinate system are the unit vectors from
+    the mapaxes origin towards the x_line and y_line points respectively.
+
+    Args:
+        mapaxes: The map axes describing the local coordinate system.
+    Returns:
+        Tuple (origin, matrix) such that ``origin + matrix @ (x, y)`` is the map
+        coordinate of the local coordinate (x, y).
+    """
+    origin = np.array(mapaxes.origin, dtype=np.float64)
+    x_axis = np.array(mapaxes.x_line, dtype=np.float64) - origin
+    y_axis = np.array(mapaxes.y_line, dtype=np.float64) - origin
+    x_norm = np.linalg.norm(x_axis)
+    y_norm = np.linalg.norm(y_axis)
+    if x_norm == 0.0 or y_norm == 0.0:
+        raise ValueError(f"Degenerate map axes {mapaxes}")
+    matrix = np.column_stack([x_axis / x_norm, y_axis / y_norm])
+    return origin, matrix
+
+
+def to_map_coordinates(points: np.ndarray, mapaxes: MapAxes) -> np.ndarray:
+    """Transform local (x,y[,...]) points to map coordinates.
+
+    Args:
+        points: Array with shape (..., n) where n >= 2. The two first values of
+            the last axis are taken as x and y, remaining values (such as z) are
+            left unchanged.
+        mapaxes: The map axes describing the local coordinate system.
+    Returns:
+        float64 array with the same shape as points with x and y transformed.
+    """
+    origin, matrix = map_axes_transform(mapaxes)
+    result = np.array(points, dtype=np.float64)
+    result[..., 0:2] = result[..., 0:2] @ matrix.T + origin
+    return result
+
+
+def to_local_coordinates(points: np.ndarray, mapaxes: MapAxes) -> np.ndarray:
+    """The inverse of :func:`to_map_coordinates`.
+
+    Args:
+        points: Array with shape (..., n) where n >= 2 of map coordinates.
+        mapaxes: The map axes describing the local coordinate system.
+    Returns:
+        float64 array with the same shape as points with x and y transformed.
+    """
+    origin, matrix = map_axes_transform(mapaxes)
+    result = np.array(points, dtype=np.float64)
+    result[..., 0:2] = (result[..., 0:2] - origin) @ np.linalg.inv(matrix).T
+    return result
+
+
+def coord_to_map_coordinates(coord: np.ndarray, mapaxes: MapAxes) -> np.ndarray:
+    """Transform the pillars of a COORD array to map coordinates.
+
+    Args:
+        coord: The flat COORD array, containing 6 values (x1,y1,z1,x2,y2,z2)
+            for each pillar.
+        mapaxes: The map axes describing the local coordinate system.
+    Returns:
+        Flat float64 array with the same layout as coord.
+    """
+    pillar_points = np.asarray(coord).reshape((-1, 2, 3))
+    return to_map_coordinates(pillar_points, mapaxes).reshape(-1)
+
+
+Box = Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]
+
+
+def check_box(box: Box, dims: Tuple[int, int, int]) -> Box:
+    """Validates a box of cells in a grid with the given dimensions.
+
+    Args:
+        box: ((i0,i1),(j0,j1),(k0,k1)), zero based and end exclusive, ie. the
+            box contains the cells with i0 <= i < i1, j0 <= j < j1 and
+            k0 <= k < k1.
+        dims: The (nx,ny,nz) dimensions of the grid.
+    Returns:
+        The box as a tuple of int tuples.
+    """
+    if len(box) != 3:
+        raise ValueError(f"Box must have three dimensions, got {box}")
+    result = tuple((int(lower), int(upper)) for lower, upper in box)
+    for (lower, upper), size in zip(result, dims):
+        if not 0 <= lower < upper <= size:
+            raise ValueError(f"Box {box} is empty or outside grid of size {dims}")
+    return result
+
+
+def coord_box(coord: np.ndarray, dims: Tuple[int, int, int], box: Box) -> np.ndarray:
+    """The COORD values of the pillars of the given box of cells."""
+    nx, ny, _ = dims
+    (i0, i1), (j0, j1), _ = box
+    pillars = np.asarray(coord).reshape((ny + 1, nx + 1, 6))
+    return pillars[j0 : j1 + 1, i0 : i1 + 1].reshape(-1)
+
+
+def zcorn_box(zcorn: np.ndarray, dims: Tuple[int, int, int], box: Box) -> np.ndarray:
+    """The ZCORN values of the given box of cells."""
+    nx, ny, nz = dims
+    (i0, i1), (j0, j1), (k0, k1) = box
+    corners = np.asarray(zcorn).reshape((2 * nx, 2 * ny, 2 * nz), order="F")
+    return corners[2 * i0 : 2 * i1, 2 * j0 : 2 * j1, 2 * k0 : 2 * k1].reshape(
+        -1, order="F"
+    )
+
+
+def cells_box(values: np.ndarray, dims: Tuple[int, int, int], box: Box) -> np.ndarray:
+    """The values of a per cell array (such as ACTNUM) in the given box."""
+    (i0, i1), (j0, j1), (k0, k1) = box
+    cells = np.asarray(values).reshape(dims, order="F")
+    return cells[i0:i1, j0:j1, k0:k1].reshape(-1, order="F")
+
+
+def zcorn_corner_view(zcorn: np.ndarray, dims: Tuple[int, int, int]) -> np.ndarray:
+    """A view of ZCORN indexed by cell and corner.
+
+    The flat ZCORN array has F-order shape (2,nx,2,ny,2,nz), this is
+    transposed (without copying) to shape (nx,ny,nz,2,2,2) so that
+    ``view[i,j,k,dk,dj,di]`` is the z value of the corner of cell (i,j,k)
+    which is lower if dk == 1, far if dj == 1 and right if di == 1.
+
+    Args:
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+    Returns:
+        A view of zcorn, writing to the view writes to zcorn.
+    """
+    nx, ny, nz = dims
+    return (
+        np.asarray(zcorn)
+        .reshape((2, nx, 2, ny, 2, nz), order="F")
+        .transpose((1, 3, 5, 4, 2, 0))
+    )
+
+
+def zcorn_to_corners(zcorn: np.ndarray, dims: Tuple[int, int, int]) -> np.ndarray:
+    """ZCORN values per cell.
+
+    Args:
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+    Returns:
+        Array of shape (nx,ny,nz,8) where corner number ``di + 2*dj + 4*dk``
+        has the same meaning as ``[dk,dj,di]`` in :func:`zcorn_corner_view`,
+        ie. the four upper corners come first, "left" before "right" and "near"
+        before "far". The corner axis is not contiguous in the file, so this
+        is a copy.
+    """
+    nx, ny, nz = dims
+    return zcorn_corner_view(zcorn, dims).reshape((nx, ny, nz, 8))
+
+
+def corners_to_zcorn(corners: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """The inverse of :func:`zcorn_to_corners`.
+
+    Args:
+        corners: Array with shape (nx,ny,nz,8) or (nx,ny,nz,2,2,2) of corner
+            values.
+        out: Optional flat array of size 8*nx*ny*nz to write the result to.
+    Returns:
+        The flat ZCORN array.
+    """
+    corners = np.asarray(corners)
+    dims = corners.shape[0:3]
+    if out is None:
+        out = np.empty(corners.size, dtype=corners.dtype)
+    elif out.size != corners.size:
+        raise ValueError(f"Size of zcorn {out.size} does not match {corners.shape}")
+    zcorn_corner_view(out, dims)[...] = corners.reshape(dims + (2, 2, 2))
+    return out
+
+
+# Default number of cells processed at once by the chunked functions in this
+# module, bounds the size of temporary arrays.
+CHUNK_CELLS = 2**20
+
+
+def layer_chunks(
+    dims: Tuple[int, int, int], layers_per_chunk: int = None, num_layers: int = None
+) -> Iterator[Tuple[int, int]]:
+    """Split the layers of a grid into chunks.
+
+    Args:
+        dims: The (nx,ny,nz) dimensions of the grid.
+        layers_per_chunk: Number of layers in each chunk, defaults to as many
+            layers as fits in CHUNK_CELLS cells.
+        num_layers: The number of layers to split, defaults to nz.
+    Returns:
+        Iterator of (k_start, k_stop) ranges of layers.
+    """
+    nx, ny, nz = dims
+    if num_layers is None:
+        num_layers = nz
+    if layers_per_chunk is None:
+        layers_per_chunk = max(1, CHUNK_CELLS // max(1, nx * ny))
+    for k_start in range(0, num_layers, layers_per_chunk):
+        yield k_start, min(k_start + layers_per_chunk, num_layers)
+
+
+def find_pinchouts(
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    tol: float = 0.0,
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """Find cells with zero thickness.
+
+    Args:
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        tol: A cell is pinched out when the difference between the upper and
+            lower z value is at most tol at each of its four pillars.
+        layers_per_chunk: The number of layers processed at once, see
+            :func:`layer_chunks`.
+    Returns:
+        Sorted array of the indices (``i + nx * (j + ny * k)``) of the pinched
+        out cells.
+    """
+    nx, ny, _ = dims
+    corners = zcorn_corner_view(zcorn, dims)
+    result = [np.zeros((0,), dtype=np.int64)]
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        chunk = corners[:, :, k_start:k_stop]
+        thickness = np.abs(chunk[..., 1, :, :] - chunk[..., 0, :, :])
+        pinched = np.all(thickness <= tol, axis=(-2, -1))
+        result.append(np.flatnonzero(pinched.T) + k_start * nx * ny)
+    return np.concatenate(result)
+
+
+def find_layer_gaps(
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    tol: float = 0.0,
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """Find cells which are not connected to the cell below.
+
+    Compares the lower corners of each cell (i,j,k) with the upper corners
+    of cell (i,j,k+1), and so finds both gaps and overlaps between layers.
+
+    Args:
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        tol: The largest allowed difference between the lower z value of a
+            cell and the upper z value of the cell below at any pillar.
+        layers_per_chunk: The number of layers processed at once, see
+            :func:`layer_chunks`.
+    Returns:
+        Sorted array of the indices (``i + nx * (j + ny * k)``) of cells
+        (i,j,k) which has a gap or overlap with cell (i,j,k+1).
+    """
+    nx, ny, nz = dims
+    corners = zcorn_corner_view(zcorn, dims)
+    result = [np.zeros((0,), dtype=np.int64)]
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk, nz - 1):
+        lower = corners[:, :, k_start:k_stop, 1]
+        upper = corners[:, :, k_start + 1 : k_stop + 1, 0]
+        gap = np.any(np.abs(upper - lower) > tol, axis=(-2, -1))
+        result.append(np.flatnonzero(gap.T) + k_start * nx * ny)
+    return np.concatenate(result)
+
+
+def pillars(coord: np.ndarray, dims: Tuple[int, int, int]) -> np.ndarray:
+    """The pillars of COORD as an array of shape (nx+1, ny+1, 6).
+
+    ``pillars(coord, dims)[i,j]`` is (x1,y1,z1,x2,y2,z2) of the pillar at the
+    upper near left corner of cell (i,j,k).
+    """
+    nx, ny, _ = dims
+    return np.asarray(coord).reshape((ny + 1, nx + 1, 6)).transpose((1, 0, 2))
+
+
+def _pillar_points(pillar_coords: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """
+    The (x,y,z) points at the given z values on the pillars, given as
+    (x1,y1,z1,x2,y2,z2) in the last axis and broadcast against z.
+    """
+    top = pillar_coords[..., 0:3]
+    bottom = pillar_coords[..., 3:6]
+    height = bottom[..., 2] - top[..., 2]
+    fraction = np.divide(
+        z - top[..., 2], height, out=np.zeros(z.shape), where=height != 0
+    )
+    result = np.empty(z.shape + (3,))
+    result[..., 0:2] = top[..., 0:2] + fraction[..., None] * (
+        bottom[..., 0:2] - top[..., 0:2]
+    )
+    result[..., 2] = z
+    return result
+
+
+def corner_points(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    k_start: int = 0,
+    k_stop: int = None,
+) -> np.ndarray:
+    """The (x,y,z) position of the corners of the cells in the given layers.
+
+    The x and y values are found by interpolating the pillar of each corner
+    at the z value of the corner.
+
+    Args:
+        coord: The flat COORD array.
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        k_start: The first layer to compute corners for.
+        k_stop: One past the last layer to compute corners for, defaults to nz.
+    Returns:
+        float64 array with shape (nx,ny,k_stop-k_start,2,2,2,3) indexed
+        as [i,j,k-k_start,dk,dj,di,xyz] (see :func:`zcorn_corner_view`).
+    """
+    nx, ny, nz = dims
+    if k_stop is None:
+        k_stop = nz
+    grid_pillars = pillars(coord, dims).astype(np.float64)
+    # the pillar of each corner as (nx, ny, 1, 1, dj, di, 6)
+    corner_pillars = np.empty((nx, ny, 1, 1, 2, 2, 6))
+    for dj in range(2):
+        for di in range(2):
+            corner_pillars[:, :, 0, 0, dj, di] = grid_pillars[
+                di : di + nx, dj : dj + ny
+            ]
+    z = zcorn_corner_view(zcorn, dims)[:, :, k_start:k_stop].astype(np.float64)
+    return _pillar_points(corner_pillars, z)
+
+
+def cell_centres(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """The centre of each cell, as the mean of its eight corners.
+
+    Returns:
+        float64 array of shape (nx,ny,nz,3).
+    """
+    result = np.empty(tuple(dims) + (3,))
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        points = corner_points(coord, zcorn, dims, k_start, k_stop)
+        result[:, :, k_start:k_stop] = points.mean(axis=(3, 4, 5))
+    return result
+
+
+# Two point Gauss-Legendre quadrature on [0, 1]. The jacobian determinant
+# of the trilinear map of a cell is at most quadratic in each coordinate so
+# 2x2x2 points integrate it exactly.
+_GAUSS_POINTS = (0.5 - 0.5 / np.sqrt(3), 0.5 + 0.5 / np.sqrt(3))
+
+
+def hexahedron_volumes(points: np.ndarray) -> np.ndarray:
+    """The volumes of trilinear hexahedra.
+
+    Args:
+        points: Array of shape (...,2,2,2,3) of corners indexed as
+            [..., dk, dj, di, xyz], such as returned by :func:`corner_points`.
+    Returns:
+        float64 array of shape points.shape[:-4].
+    """
+    derivative = np.array([-1.0, 1.0])
+    volume = np.zeros(points.shape[:-4])
+    for u in _GAUSS_POINTS:
+        for v in _GAUSS_POINTS:
+            for w in _GAUSS_POINTS:
+                lu, lv, lw = ([1 - t, t] for t in (u, v, w))
+                du = np.einsum("...kjix,k,j,i->...x", points, lw, lv, derivative)
+                dv = np.einsum("...kjix,k,j,i->...x", points, lw, derivative, lu)
+                dw = np.einsum("...kjix,k,j,i->...x", points, derivative, lv, lu)
+                volume += np.einsum("...x,...x->...", du, np.cross(dv, dw))
+    return np.abs(volume) / 8
+
+
+def cell_volumes(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """The volume of each cell, see :func:`hexahedron_volumes`.
+
+    Returns:
+        float64 array of shape (nx,ny,nz).
+    """
+    result = np.empty(tuple(dims))
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        points = corner_points(coord, zcorn, dims, k_start, k_stop)
+        result[:, :, k_start:k_stop] = hexahedron_volumes(points)
+    return result
+
+
+def pillar_depth_range(
+    layer_corners: Iterable[np.ndarray], dims: Tuple[int, int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The minimum and maximum z of the corners on each pillar.
+
+    Args:
+        layer_corners: The corners, as given by :func:`zcorn_corner_view`, of
+            consecutive chunks of layers covering the grid, eg. as read from
+            a file one chunk at a time.
+        dims: The (nx,ny,nz) dimensions of the grid.
+    Returns:
+        Tuple of float64 arrays of shape (nx+1,ny+1), the lowest and
+        highest z on each pillar.
+    """
+    nx, ny, _ = dims
+    lowest = np.full((nx + 1, ny + 1), np.inf)
+    highest = np.full((nx + 1, ny + 1), -np.inf)
+    for chunk in layer_corners:
+        # (nx, ny, dj, di)
+        chunk_min = chunk.min(axis=(2, 3))
+        chunk_max = chunk.max(axis=(2, 3))
+        for dj in range(2):
+            for di in range(2):
+                part = (slice(di, di + nx), slice(dj, dj + ny))
+                np.minimum(lowest[part], chunk_min[:, :, dj, di], out=lowest[part])
+                np.maximum(highest[part], chunk_max[:, :, dj, di], out=highest[part])
+    return lowest, highest
+
+
+def pillar_bounds(
+    coord: np.ndarray,
+    dims: Tuple[int, int, int],
+    lowest: np.ndarray,
+    highest: np.ndarray,
+) -> np.ndarray:
+    """The bounding box of the pillars between the given depths.
+
+    Args:
+        coord: The flat COORD array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        lowest: The lowest z on each pillar, see :func:`pillar_depth_range`.
+        highest: The highest z on each pillar.
+    Returns:
+        float64 array of shape (2,3), the minimum and maximum (x,y,z).
+    """
+    grid_pillars = pillars(coord, dims).astype(np.float64)
+    points = np.stack(
+        [_pillar_points(grid_pillars, lowest), _pillar_points(grid_pillars, highest)]
+    ).reshape((-1, 3))
+    return np.stack([points.min(axis=0), points.max(axis=0)])
+
+
+def grid_bounds(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """The bounding box of the corners of the grid.
+
+    As the x and y values of corners are linear in z along each pillar, the
+    bounding box is given by the highest and lowest corner on each pillar,
+    which are found in one pass over the layers of ZCORN. Only one chunk of
+    layers is read at a time, so zcorn can be a memory mapped array.
+
+    Args:
+        coord: The flat COORD array.
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        layers_per_chunk: The number of layers processed at once, see
+            :func:`layer_chunks`.
+    Returns:
+        float64 array of shape (2,3), the minimum and maximum (x,y,z).
+    """
+    corners = zcorn_corner_view(zcorn, dims)
+    lowest, highest = pillar_depth_range(
+        (
+            corners[:, :, k_start:k_stop]
+            for k_start, k_stop in layer_chunks(dims, layers_per_chunk)
+        ),
+        dims,
+    )
+    return pillar_bounds(coord, dims, lowest, highest)
+
+
+def layer_depth_stats(
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    actnum: np.ndarray = None,
+    layers_per_chunk: int = None,
+) -> np.ndarray:
+    """The minimum, mean and maximum depth of the corners in each layer.
+
+    Args:
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        actnum: Only include the corners of cells where actnum is non-zero.
+        layers_per_chunk: The number of layers processed at once, see
+            :func:`layer_chunks`.
+    Returns:
+        float64 array of shape (nz,3) with the minimum, mean and maximum z
+        value of the corners of the cells of each layer, nan for layers
+        without active cells.
+    """
+    nx, ny, nz = dims
+    corners = zcorn_corner_view(zcorn, dims)
+    result = np.full((nz, 3), np.nan)
+    for k_start, k_stop in layer_chunks(dims, layers_per_chunk):
+        # (nk, ny, nx, 8)
+        z = corners[:, :, k_start:k_stop].transpose((2, 1, 0, 3, 4, 5))
+        z = z.reshape((k_stop - k_start, ny, nx, 8)).astype(np.float64)
+        if actnum is None:
+            mask = np.ones(z.shape, dtype=bool)
+        else:
+            active = np.asarray(actnum[k_start * nx * ny : k_stop * nx * ny]) != 0
+            mask = np.broadcast_to(
+                active.reshape((k_stop - k_start, ny, nx, 1)), z.shape
+            )
+        axes = (1, 2, 3)
+        count = mask.sum(axis=axes)
+        layers = result[k_start:k_stop]
+        layers[:, 0] = np.min(z, axis=axes, where=mask, initial=np.inf)
+        layers[:, 1] = np.sum(z, axis=axes, where=mask) / np.maximum(count, 1)
+        layers[:, 2] = np.max(z, axis=axes, where=mask, initial=-np.inf)
+        layers[count == 0] = np.nan
+    return result
+
+
+@dataclass
+class FaceGeometry:
+    """The geometry of the faces between neighbouring cells.
+
+    Each array is indexed by [i,j,k,direction,xyz], where direction is 0, 1
+    and 2 for the face between cell (i,j,k) and its neighbour in the I, J and K
+    direction, ie. cell (i+1,j,k), (i,j+1,k) and (i,j,k+1) respectively. The
+    face is taken to be the face of cell (i,j,k), so neighbours which do not
+    share the face completely (such as across faults) are not accounted for.
+
+    Args:
+        area: The vector area of the face, the normal of the face scaled by its
+            area and oriented towards the neighbour.
+        centre_to_face: The vector from the centre of cell (i,j,k) to the
+            centre of the face.
+        neighbour_to_face: The vector from the centre of the neighbour to the
+            centre of the face, nan for cells on the boundary of the grid which
+            have no neighbour in that direction.
+    """
+
+    area: np.ndarray
+    centre_to_face: np.ndarray
+    neighbour_to_face: np.ndarray
+
+
+# The corners of the faces towards the I, J and K neighbours as
+# [dk,dj,di] indices into the corners of a cell, ordered so that the
+# face normal points towards the neighbour.
+_FACE_CORNERS = [
+    [(0, 0, 1), (0, 1, 1), (1, 1, 1), (1, 0, 1)],
+    [(0, 1, 0), (1, 1, 0), (1, 1, 1), (0, 1, 1)],
+    [(1, 0, 0), (1, 0, 1), (1, 1, 1), (1, 1, 0)],
+]
+
+
+def _face_geometry_chunk(coord, zcorn, dims, k_start, k_stop, result):
+    """Computes the face geometry of the given layers into result."""
+    nx, ny, nz = dims
+    # Include the layer below so that the centres of the K neighbours are known
+    points = corner_points(coord, zcorn, dims, k_start, min(k_stop + 1, nz))
+    centres = points.mean(axis=(3, 4, 5))
+    num_layers = k_stop - k_start
+    own_centres = centres[:, :, 0:num_layers]
+    for direction, face in enumerate(_FACE_CORNERS):
+        a, b, c, d = (points[:, :, 0:num_layers, dk, dj, di] for dk, dj, di in face)
+        face_centre = (a + b + c + d) / 4
+        result.area[:, :, k_start:k_stop, direction] = 0.5 * np.cross(c - a, d - b)
+        result.centre_to_face[:, :, k_start:k_stop, direction] = (
+            face_centre - own_centres
+        )
+        neighbour_to_face = result.neighbour_to_face[:, :, k_start:k_stop, direction]
+        if direction == 0:
+            neighbour_to_face[:-1] = face_centre[:-1] - own_centres[1:]
+        elif direction == 1:
+            neighbour_to_face[:, :-1] = face_centre[:, :-1] - own_centres[:, 1:]
+        else:
+            below = centres[:, :, 1:]
+            neighbour_to_face[:, :, 0 : below.shape[2]] = (
+                face_centre[:, :, 0 : below.shape[2]] - below
+            )
+
+
+def face_geometry(
+    coord: np.ndarray,
+    zcorn: np.ndarray,
+    dims: Tuple[int, int, int],
+    layers_per_chunk: int = None,
+    workers: int = None,
+) -> FaceGeometry:
+    """The face areas and distances used for computing transmissibilities.
+
+    Args:
+        coord: The flat COORD array.
+        zcorn: The flat ZCORN array.
+        dims: The (nx,ny,nz) dimensions of the grid.
+        layers_per_chunk: The number of layers processed at once, see
+            :func:`layer_chunks`.
+        workers: If given, the chunks are processed by a pool of that many
+            threads.
+    Returns:
+        The FaceGeometry of the grid.
+    """
+    shape = tuple(dims) + (3, 3)
+    result = FaceGeometry(
+        area=np.empty(shape),
+        centre_to_face=np.empty(shape),
+        neighbour_to_face=np.full(shape, np.nan),
+    )
+    chunks = list(layer_chunks(dims, layers_per_chunk))
+
+    def compute(chunk):
+        _face_geometry_chunk(coord, zcorn, dims, chunk[0], chunk[1], result)
+
+    if workers is None or workers <= 1:
+        for chunk in chunks:
+            compute(chunk)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(compute, chunks))
+    return result
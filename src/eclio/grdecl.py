@@ -0,0 +1,104 @@
+"""
+Writing of the global grid of an egrid as a grdecl file.
+
+The grdecl file contains the keywords MAPUNITS, MAPAXES and GRIDUNIT (when
+given in the egrid), SPECGRID, COORD, ZCORN and ACTNUM. COORD and ZCORN have
+the same order in grdecl files as in egrid files, so the arrays are written
+one chunk at a time without reordering, and an egrid file can be converted
+one keyword at a time with :func:`write_grdecl_keywords`.
+"""
+from typing import Any, Iterable, TextIO, Tuple
+
+import numpy as np
+
+from .ecl_output_file import GridUnit, MapAxes, TypeOfGrid, Units
+from .egrid import EGrid, GridHead
+from .geometry import CHUNK_CELLS
+
+_VALUES_PER_LINE = 6
+
+
+def _write_values(stream: TextIO, values: np.ndarray, value_format: str):
+    values = np.asarray(values).reshape(-1)
+    for start in range(0, len(values), CHUNK_CELLS):
+        strings = np.char.mod(value_format, values[start : start + CHUNK_CELLS])
+        for line in range(0, len(strings), _VALUES_PER_LINE):
+            stream.write(" ".join(strings[line : line + _VALUES_PER_LINE]))
+            stream.write("\n")
+
+
+def _write_keyword(stream: TextIO, keyword: str, values, value_format: str = "%s"):
+    stream.write(f"{keyword}\n")
+    _write_values(stream, values, value_format)
+    stream.write("/\n\n")
+
+
+def write_grdecl(grid: EGrid, filelike):
+    """
+    Write the global grid of the egrid to a grdecl file.
+
+    Args:
+        grid: The egrid to write.
+        filelike: Path or text stream to write to.
+    """
+    global_grid = grid.global_grid
+    keywords = grid.egrid_head.to_ecl() + [
+        ("GRIDHEAD", global_grid.grid_head.to_ecl()),
+        ("COORD   ", global_grid.coord),
+        ("ZCORN   ", global_grid.zcorn),
+    ]
+    if global_grid.actnum is not None:
+        keywords.append(("ACTNUM  ", global_grid.actnum))
+    write_grdecl_keywords(keywords, filelike)
+
+
+def write_grdecl_keywords(keywords: Iterable[Tuple[str, Any]], filelike):
+    """
+    Write the global grid in the keyword, array pairs of an egrid to a grdecl
+    file, one keyword at a time. Stops at the first ENDGRID, so when the
+    pairs are read lazily from an egrid file the lgr and nnc sections are
+    not read.
+
+    Args:
+        keywords: The keyword, array pairs of the egrid header and global
+            grid, as in an egrid file.
+        filelike: Path or text stream to write to.
+    """
+    if hasattr(filelike, "write"):
+        _write_grdecl(keywords, filelike)
+    else:
+        with open(filelike, "w", encoding="ascii") as stream:
+            _write_grdecl(keywords, stream)
+
+
+def _write_grdecl(keywords: Iterable[Tuple[str, Any]], stream: TextIO):
+    for keyword, value in keywords:
+        keyword = keyword.rstrip()
+        if keyword == "ENDGRID":
+            break
+        if keyword == "MAPUNITS":
+            mapunits = Units.from_ecl(value[0])
+            stream.write(f"MAPUNITS\n'{mapunits.to_ecl()}' /\n\n")
+        elif keyword == "MAPAXES":
+            _write_keyword(stream, "MAPAXES", MapAxes.from_ecl(value).to_ecl(), "%.9g")
+        elif keyword == "GRIDUNIT":
+            gridunit = GridUnit.from_ecl(value)
+            unit = gridunit.unit.to_ecl()
+            relative = gridunit.grid_relative.to_ecl()
+            stream.write(f"GRIDUNIT\n'{unit}' '{relative}' /\n\n")
+        elif keyword == "GRIDHEAD":
+            _write_specgrid(stream, GridHead.from_ecl(value))
+        elif keyword in ("COORD", "ZCORN"):
+            _write_keyword(stream, keyword, value, "%.9g")
+        elif keyword == "ACTNUM":
+            _write_keyword(stream, keyword, value, "%d")
+
+
+def _write_specgrid(stream: TextIO, grid_head: GridHead):
+    if grid_head.type_of_grid != TypeOfGrid.CORNER_POINT:
+        raise NotImplementedError("XTGeo does not support unstructured or mixed grids.")
+    nx, ny, nz = grid_head.dimensions
+    # NUMRES is 0 in some egrid files, where grdecl requires at least 1
+    numres = max(int(grid_head.numres), 1)
+    cylindrical = "T" if grid_head.coordinate_type.to_ecl() else "F"
+    stream.write(f"SPECGRID\n{nx} {ny} {nz} {numres} {cylindrical} /\n\n")
@@ -0,0 +1,319 @@
+"""
+Finding the cells containing given points in a corner point grid.
+
+The cells are put into a uniform grid of bins according to their bounding
+boxes. A point is then located by testing only the cells in the bin of the
+point, first against the bounding box of the cell, and then exactly by
+inverting the trilinear mapping from the unit cube to the cell.
+
+>>> locator = GridLocator(egrid.global_grid, egrid.lgr_sections)
+>>> locator.locate(points)  # index of global cell containing each point
+
+Points are given in the same coordinate system as COORD, use
+:meth:`eclio.egrid.EGrid.local_coordinates` to locate map coordinates.
+"""
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .egrid import CornerPointGrid, GlobalGrid, LGRSection, LGRTree
+from .geometry import corner_points, layer_chunks, pillars, zcorn_corner_view
+
+# Number of points located at once, bounds the size of temporary arrays.
+POINTS_PER_BATCH = 2**16
+
+# Tolerance, in the unit cube, for a point to be considered inside a cell.
+_INSIDE_TOLERANCE = 1e-6
+_NEWTON_ITERATIONS = 12
+
+# The (di, dj, dk) offsets of each corner, in the order of
+# eclio.geometry.zcorn_to_corners.
+_CORNER_OFFSETS = np.array(
+    [(di, dj, dk) for dk in range(2) for dj in range(2) for di in range(2)],
+    dtype=np.float64,
+)
+
+
+def _bounding_boxes(grid: CornerPointGrid) -> Tuple[np.ndarray, np.ndarray]:
+    """The lower and upper corner of the bounding box of each cell as arrays
+    of shape (num_cells, 3), cells ordered by natural index."""
+    dims = grid.grid_head.dimensions
+    nx, ny, nz = dims
+    lower = np.empty((nz, ny, nx, 3))
+    upper = np.empty((nz, ny, nx, 3))
+    for k_start, k_stop in layer_chunks(dims):
+        points = corner_points(grid.coord, grid.zcorn, dims, k_start, k_stop)
+        lower[k_start:k_stop] = points.min(axis=(3, 4, 5)).transpose((2, 1, 0, 3))
+        upper[k_start:k_stop] = points.max(axis=(3, 4, 5)).transpose((2, 1, 0, 3))
+    return lower.reshape((-1, 3)), upper.reshape((-1, 3))
+
+
+def _cell_corners(grid: CornerPointGrid, cells: np.ndarray) -> np.ndarray:
+    """The corners of the given cells (by natural index) as an array of shape
+    (len(cells), 8, 3), in the corner order of zcorn_to_corners."""
+    dims = grid.grid_head.dimensions
+    nx, ny, _ = dims
+    i = cells % nx
+    j = (cells // nx) % ny
+    k = cells // (nx * ny)
+    z = zcorn_corner_view(grid.zcorn, dims)[i, j, k].reshape((-1, 8))
+    corner_i = i[:, None] + _CORNER_OFFSETS[None, :, 0].astype(np.int64)
+    corner_j = j[:, None] + _CORNER_OFFSETS[None, :, 1].astype(np.int64)
+    pillar = pillars(grid.coord, dims)[corner_i, corner_j].astype(np.float64)
+    top = pillar[..., 0:3]
+    bottom = pillar[..., 3:6]
+    height = bottom[..., 2] - top[..., 2]
+    fraction = np.divide(
+        z - top[..., 2], height, out=np.zeros(z.shape), where=height != 0
+    )
+    result = np.empty(z.shape + (3,))
+    result[..., 0:2] = top[..., 0:2] + fraction[..., None] * (
+        bottom[..., 0:2] - top[..., 0:2]
+    )
+    result[..., 2] = z
+    return result
+
+
+def _trilinear_weights(uvw: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """The trilinear weights of each corner and their derivatives
+    at the given (m, 3) unit cube coordinates."""
+    factors = np.where(
+        _CORNER_OFFSETS[None, :, :] == 1, uvw[:, None, :], 1.0 - uvw[:, None, :]
+    )
+    signs = np.where(_CORNER_OFFSETS == 1, 1.0, -1.0)
+    weights = factors.prod(axis=2)
+    derivatives = np.empty(factors.shape)
+    derivatives[..., 0] = signs[:, 0] * factors[..., 1] * factors[..., 2]
+    derivatives[..., 1] = signs[:, 1] * factors[..., 0] * factors[..., 2]
+    derivatives[..., 2] = signs[:, 2] * factors[..., 0] * factors[..., 1]
+    return weights, derivatives
+
+
+def _inside(corners: np.ndarray, points: np.ndarray, size: np.ndarray) -> np.ndarray:
+    """Whether each point is inside the corresponding hexahedral cell.
+
+    Args:
+        corners: (m, 8, 3) array of cell corners.
+        points: (m, 3) array of points.
+        size: (m,) array of the size of each cell.
+    Returns:
+        Boolean array of size m.
+    """
+    uvw = np.full(points.shape, 0.5)
+    valid = np.ones(len(points), dtype=bool)
+    tolerance = _INSIDE_TOLERANCE * (1.0 + size)
+    converged = np.zeros(len(points), dtype=bool)
+    # Newton iteration, only on the points that have not yet converged
+    active = np.arange(len(points))
+    for _ in range(_NEWTON_ITERATIONS):
+        weights, derivatives = _trilinear_weights(uvw[active])
+        residual = points[active] - np.einsum("mc,mcd->md", weights, corners[active])
+        done = np.linalg.norm(residual, axis=1) <= tolerance[active]
+        converged[active[done]] = True
+        active, residual, derivatives = (
+            active[~done],
+            residual[~done],
+            derivatives[~done],
+        )
+        if len(active) == 0:
+            break
+        # columns of the jacobian are the derivatives wrt. u, v and w
+        jacobian = np.einsum("mce,mcd->mde", derivatives, corners[active])
+        a, b, c = jacobian[:, :, 0], jacobian[:, :, 1], jacobian[:, :, 2]
+        rows = np.stack([np.cross(b, c), np.cross(c, a), np.cross(a, b)], axis=1)
+        determinant = np.einsum("md,md->m", a, rows[:, 0])
+        singular = np.abs(determinant) < 1e-12
+        valid[active[singular]] = False
+        determinant[singular] = 1.0
+        step = np.einsum("med,md->me", rows, residual) / determinant[:, None]
+        # keep iterates close to the cell so that the iteration is stable
+        uvw[active] = np.clip(uvw[active] + step, -1.0, 2.0)
+    in_cube = np.all(
+        (uvw >= -_INSIDE_TOLERANCE) & (uvw <= 1.0 + _INSIDE_TOLERANCE), axis=1
+    )
+    return valid & converged & in_cube
+
+
+class _CellBins:
+    """The cells of one grid sorted into a uniform grid of bins by bounding
+    box, for finding the cells containing points."""
+
+    def __init__(self, grid: CornerPointGrid):
+        self.grid = grid
+        self.lower, self.upper = _bounding_boxes(grid)
+        self.size = (self.upper - self.lower).max(axis=1)
+        num_cells = len(self.lower)
+
+        self.origin = self.lower.min(axis=0)
+        extent = np.maximum(self.upper.max(axis=0) - self.origin, 1e-12)
+        # Bins of the size of a typical cell, but no more than a few bins
+        # per cell in total.
+        bin_size = np.maximum(np.median(self.upper - self.lower, axis=0), 1e-12)
+        self.num_bins = np.minimum(np.ceil(extent / bin_size), 2**20).astype(np.int64)
+        while np.prod(self.num_bins) > 4 * num_cells + 64:
+            self.num_bins = np.maximum(1, (self.num_bins + 1) // 2)
+        self.bin_size = extent / self.num_bins
+
+        first = self._bin_coordinates(self.lower)
+        last = self._bin_coordinates(self.upper)
+        span = last - first + 1
+        counts = span.prod(axis=1)
+        cells = np.repeat(np.arange(num_cells), counts)
+        # position of each (cell, bin) pair within the bins of its cell
+        offset = np.arange(len(cells)) - np.repeat(np.cumsum(counts) - counts, counts)
+        span_x = span[cells, 0]
+        span_y = span[cells, 1]
+        bin_coordinates = first[cells] + np.stack(
+            [
+                offset % span_x,
+                (offset // span_x) % span_y,
+                offset // (span_x * span_y),
+            ],
+            axis=1,
+        )
+        bins = self._bin_index(bin_coordinates)
+        order = np.argsort(bins, kind="stable")
+        self.bin_cells = cells[order]
+        self.bin_start = np.searchsorted(
+            bins[order], np.arange(np.prod(self.num_bins) + 1)
+        )
+
+    def _bin_coordinates(self, points: np.ndarray) -> np.ndarray:
+        coordinates = np.floor((points - self.origin) / self.bin_size)
+        return np.clip(coordinates, 0, self.num_bins - 1).astype(np.int64)
+
+    def _bin_index(self, bin_coordinates: np.ndarray) -> np.ndarray:
+        return bin_coordinates[:, 0] + self.num_bins[0] * (
+            bin_coordinates[:, 1] + self.num_bins[1] * bin_coordinates[:, 2]
+        )
+
+    def locate(self, points: np.ndarray) -> np.ndarray:
+        """The index of the cell containing each point, -1 if outside."""
+        result = np.full(len(points), -1, dtype=np.int64)
+        for batch_start in range(0, len(points), POINTS_PER_BATCH):
+            batch = points[batch_start : batch_start + POINTS_PER_BATCH]
+            result[batch_start : batch_start + len(batch)] = self._locate_batch(batch)
+        return result
+
+    def _locate_batch(self, points: np.ndarray) -> np.ndarray:
+        result = np.full(len(points), -1, dtype=np.int64)
+        inside_extent = np.all(
+            (points >= self.origin)
+            & (points <= self.origin + self.bin_size * self.num_bins),
+            axis=1,
+        )
+        point_indices = np.flatnonzero(inside_extent)
+        bins = self._bin_index(self._bin_coordinates(points[point_indices]))
+        starts = self.bin_start[bins]
+        counts = self.bin_start[bins + 1] - starts
+        pair_points = np.repeat(point_indices, counts)
+        offset = np.arange(len(pair_points)) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        pair_cells = self.bin_cells[np.repeat(starts, counts) + offset]
+
+        candidate_points = points[pair_points]
+        in_box = np.all(
+            (candidate_points >= self.lower[pair_cells] - _INSIDE_TOLERANCE)
+            & (candidate_points <= self.upper[pair_cells] + _INSIDE_TOLERANCE),
+            axis=1,
+        )
+        pair_points = pair_points[in_box]
+        pair_cells = pair_cells[in_box]
+        inside = _inside(
+            _cell_corners(self.grid, pair_cells),
+            points[pair_points],
+            self.size[pair_cells],
+        )
+        # Points on shared faces are inside several cells, pick the one
+        # with the lowest index.
+        not_found = np.iinfo(np.int64).max
+        lowest = np.full(len(points), not_found, dtype=np.int64)
+        np.minimum.at(lowest, pair_points[inside], pair_cells[inside])
+        result[lowest != not_found] = lowest[lowest != not_found]
+        return result
+
+
+class GridLocator:
+    """Locates the cells containing points in a grid with optional local
+    grid refinements.
+
+    The search structures are built on first use, for LGRs only when a point
+    falls in one of its host cells.
+
+    Args:
+        global_grid: The global grid.
+        lgr_sections: The LGRs of the grid, the hierarchy and host cells
+            of the LGRs are given by the :class:`eclio.egrid.LGRTree` of these.
+    """
+
+    def __init__(
+        self, global_grid: GlobalGrid, lgr_sections: Sequence[LGRSection] = ()
+    ):
+        self.global_grid = global_grid
+        self.lgr_tree = LGRTree(global_grid, lgr_sections)
+        self._bins: Optional[_CellBins] = None
+        self._lgr_bins: Dict[int, _CellBins] = {}
+
+    @classmethod
+    def from_egrid(cls, egrid) -> "GridLocator":
+        """The GridLocator of the global grid and lgrs of the given EGrid."""
+        return cls(egrid.global_grid, egrid.lgr_sections)
+
+    def _global_bins(self) -> _CellBins:
+        if self._bins is None:
+            self._bins = _CellBins(self.global_grid)
+        return self._bins
+
+    def locate(self, points: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            points: Array of shape (m, 3) of points.
+        Returns:
+            Array of size m of the natural index (``i + nx * (j + ny * k)``)
+            of the global cell containing each point, -1 for points outside
+            the grid.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        return self._global_bins().locate(points)
+
+    def locate_refined(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate points in the finest grid containing them.
+
+        Args:
+            points: Array of shape (m, 3) of points.
+        Returns:
+            Tuple of arrays (lgr_indices, cell_indices) of size m. For points
+            in a refined global cell, lgr_indices is the index of the LGR in
+            lgr_sections and cell_indices the index of the cell in that LGR,
+            otherwise lgr_indices is -1 and cell_indices is the index of
+            the global cell (or -1 if outside the grid).
+        """
+        points = np.asarray(points, dtype=np.float64).reshape((-1, 3))
+        cell_indices = self.locate(points)
+        lgr_indices = np.full(len(points), -1, dtype=np.int64)
+        self._locate_children(points, None, lgr_indices, cell_indices)
+        return lgr_indices, cell_indices
+
+    def _locate_children(self, points, name, lgr_indices, cell_indices):
+        """Moves the points located in cells of the grid with the given name
+        (None for global) into the children LGRs refining those cells."""
+        in_grid = np.flatnonzero(
+            (cell_indices >= 0)
+            & (lgr_indices == (-1 if name is None else self.lgr_tree.index(name)))
+        )
+        if len(in_grid) == 0 or not self.lgr_tree.children(name):
+            return
+        child_indices = self.lgr_tree.host_lgr(name)[cell_indices[in_grid]]
+        for lgr_index in np.unique(child_indices[child_indices >= 0]):
+            lgr = self.lgr_tree.lgr_sections[lgr_index]
+            if lgr_index not in self._lgr_bins:
+                self._lgr_bins[lgr_index] = _CellBins(lgr)
+            refined = in_grid[child_indices == lgr_index]
+            lgr_cells = self._lgr_bins[lgr_index].locate(points[refined])
+            # Points in a host cell but not in the lgr stay in the host cell
+            found = refined[lgr_cells >= 0]
+            cell_indices[found] = lgr_cells[lgr_cells >= 0]
+            lgr_indices[found] = lgr_index
+            self._locate_children(points, lgr.name, lgr_indices, cell_indices)
@@ -0,0 +1,166 @@
+"""
+In place updates of the ACTNUM and MAPAXES of unformatted egrid files.
+
+:func:`patch` changes only the records of the given keywords, so changing
+the active cells of a large grid does not read or write its COORD and
+ZCORN::
+
+    patch("CASE.EGRID", actnum=new_actnum)
+
+A keyword that is in the file is overwritten where it is. A keyword that
+is not in the file is inserted by copying the bytes before and after it to
+a new file, which replaces the old one.
+"""
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, List, Optional, Tuple
+
+import numpy as np
+from ecl_data_io import Format, lazy_read, write
+
+from .ecl_output_file import MapAxes
+from .egrid import EGridFileFormatError, GridHead
+
+# Keywords which come after MAPAXES in the egrid header
+_AFTER_MAPAXES = ("GRIDUNIT", "GDORIENT", "GRIDHEAD")
+
+_ECL_DTYPES = {b"INTE": np.int32, b"REAL": np.float32, b"DOUB": np.float64}
+
+_COPY_CHUNK_BYTES = 1 << 20
+
+
+def _is_unformatted(stream: BinaryIO) -> bool:
+    # Unformatted files start with the 16 byte record marker of FILEHEAD
+    marker = int.from_bytes(stream.read(4), byteorder="big", signed=True)
+    stream.seek(0)
+    return marker == 16
+
+
+def _global_grid_entries(stream: BinaryIO) -> list:
+    """The entries of the header and global grid, up to and with ENDGRID."""
+    entries = []
+    for entry in lazy_read(stream, Format.UNFORMATTED):
+        entries.append(entry)
+        if entry.read_keyword() == "ENDGRID ":
+            return entries
+    raise EGridFileFormatError("Did not read ENDGRID after global grid")
+
+
+def _find(entries: list, keyword: str) -> Optional[int]:
+    for index, entry in enumerate(entries):
+        if entry.read_keyword() == keyword:
+            return index
+    return None
+
+
+def _insert(path, insertions: List[Tuple[int, str, np.ndarray]]):
+    """
+    Rewrite the file at path with the keywords inserted at the given byte
+    offsets, copying the bytes in between without decoding them.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as destination:
+            with open(path, "rb") as source:
+                position = 0
+                for offset, keyword, array in sorted(insertions, key=lambda i: i[0]):
+                    _copy_bytes(source, destination, offset - position)
+                    position = offset
+                    write(destination, [(keyword, array)], Format.UNFORMATTED)
+                shutil.copyfileobj(source, destination)
+        shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+def _copy_bytes(source: BinaryIO, destination: BinaryIO, nbytes: int):
+    while nbytes > 0:
+        chunk = source.read(min(nbytes, _COPY_CHUNK_BYTES))
+        if not chunk:
+            raise EGridFileFormatError("Reached end of file while copying records")
+        destination.write(chunk)
+        nbytes -= len(chunk)
+
+
+def patch(path, actnum=None, mapaxes: Optional[MapAxes] = None):
+    """
+    Replace the ACTNUM of the global grid and/or the MAPAXES of an
+    unformatted egrid file without rewriting the rest of the file.
+
+    Keywords already in the file are overwritten in place. Missing keywords
+    are inserted (ACTNUM after the ZCORN of the global grid and MAPAXES in
+    the header), which copies the rest of the file but does not decode it.
+
+    Args:
+        path: Path to the egrid file.
+        actnum: The new ACTNUM, one value per cell of the global grid.
+        mapaxes: The new MAPAXES.
+    Raises:
+        ValueError: If the file is not an unformatted egrid or actnum does
+            not have one value per cell of the global grid. The file is
+            not changed.
+    """
+    insertions = []
+    with open(path, "r+b") as stream:
+        if not _is_unformatted(stream):
+            raise ValueError(
+                f"Can only patch unformatted egrid files, {path} is formatted"
+            )
+        entries = _global_grid_entries(stream)
+        updates = []
+        if actnum is not None:
+            grid_head_index = _find(entries, "GRIDHEAD")
+            zcorn_index = _find(entries, "ZCORN   ")
+            if grid_head_index is None or zcorn_index is None:
+                raise EGridFileFormatError(f"No global grid in {path}")
+            dims = GridHead.from_ecl(entries[grid_head_index].read_array()).dimensions
+            actnum = np.asarray(actnum, dtype=np.int32)
+            num_cells = int(np.prod(dims))
+            if actnum.shape != (num_cells,):
+                raise ValueError(
+                    f"actnum has shape {actnum.shape}, expected ({num_cells},) for"
+                    f" a grid of dimensions {tuple(dims)}"
+                )
+            index = _find(entries, "ACTNUM  ")
+            if index is None:
+                insertions.append((entries[zcorn_index + 1].start, "ACTNUM  ", actnum))
+            else:
+                updates.append((entries[index], actnum))
+        if mapaxes is not None:
+            index = _find(entries, "MAPAXES ")
+            if index is None:
+                anchors = [_find(entries, k) for k in _AFTER_MAPAXES]
+                anchors = [i for i in anchors if i is not None]
+                if not anchors:
+                    raise EGridFileFormatError(
+                        f"No GRIDUNIT, GDORIENT or GRIDHEAD in {path} to insert"
+                        " MAPAXES before"
+                    )
+                insertions.append(
+                    (
+                        entries[min(anchors)].start,
+                        "MAPAXES ",
+                        np.asarray(mapaxes.to_ecl(), dtype=np.float32),
+                    )
+                )
+            else:
+                entry = entries[index]
+                dtype = _ECL_DTYPES.get(entry.read_type(), np.float32)
+                updates.append((entry, np.asarray(mapaxes.to_ecl(), dtype=dtype)))
+        for entry, array in updates:
+            # Checked before writing anything, so that the file is unchanged
+            dtype = _ECL_DTYPES.get(entry.read_type())
+            if entry.read_length() != array.size or dtype != array.dtype:
+                raise ValueError(
+                    f"Cannot overwrite {entry.read_keyword().strip()} of {path},"
+                    f" it has {entry.read_length()} values of type"
+                    f" {entry.read_type().decode()}"
+                )
+        for entry, array in updates:
+            entry.update(array=array)
+    if insertions:
+        _insert(path, insertions)
@@ -0,0 +1,137 @@
+"""
+Instrumentation of egrid reads.
+
+:class:`eclio.egrid.EGridReader` (and :meth:`eclio.egrid.EGrid.from_file`)
+accept an ``on_keyword`` callback which is called with a
+:class:`KeywordEvent` for each keyword read. :class:`ReadProfile` is such a
+callback which aggregates the events per keyword::
+
+    profile = ReadProfile()
+    EGrid.from_file("CASE.EGRID", on_keyword=profile)
+    profile.print_report()
+
+"""
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from ecl_data_io import MESS
+
+
+@dataclass
+class KeywordEvent:
+    """
+    The reading of one keyword of an egrid file.
+
+    Args:
+        keyword: The name of the keyword.
+        length: The number of elements in the array.
+        nbytes: The size of the array as read from the file.
+        decode_time: Seconds spent reading and decoding the array from the
+            file (ie. in ecl_data_io).
+        factory_time: Seconds spent converting the array to the value of
+            the keyword in the egrid section.
+    """
+
+    keyword: str
+    length: int
+    nbytes: int
+    decode_time: float
+    factory_time: float
+
+    @property
+    def total_time(self) -> float:
+        return self.decode_time + self.factory_time
+
+
+def array_size(array) -> Tuple[int, int]:
+    """The number of elements and bytes of the array as read from a file."""
+    if array is MESS or array is None:
+        return 0, 0
+    if isinstance(array, np.ndarray):
+        return array.size, array.nbytes
+    array = np.asarray(array)
+    return array.size, array.nbytes
+
+
+@dataclass
+class KeywordStatistics:
+    """The accumulated events of one keyword, see :class:`ReadProfile`."""
+
+    keyword: str
+    count: int = 0
+    length: int = 0
+    nbytes: int = 0
+    decode_time: float = 0.0
+    factory_time: float = 0.0
+
+    @property
+    def total_time(self) -> float:
+        return self.decode_time + self.factory_time
+
+    def add(self, event: KeywordEvent):
+        self.count += 1
+        self.length += event.length
+        self.nbytes += event.nbytes
+        self.decode_time += event.decode_time
+        self.factory_time += event.factory_time
+
+
+class ReadProfile:
+    """
+    Aggregates :class:`KeywordEvent` per keyword. Instances are callables
+    which can be given as the on_keyword argument of
+    :meth:`eclio.egrid.EGrid.from_file`, possibly for several reads.
+    """
+
+    def __init__(self):
+        self.keywords: Dict[str, KeywordStatistics] = {}
+
+    def __call__(self, event: KeywordEvent):
+        if event.keyword not in self.keywords:
+            self.keywords[event.keyword] = KeywordStatistics(event.keyword)
+        self.keywords[event.keyword].add(event)
+
+    @property
+    def decode_time(self) -> float:
+        return sum(s.decode_time for s in self.keywords.values())
+
+    @property
+    def factory_time(self) -> float:
+        return sum(s.factory_time for s in self.keywords.values())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(s.nbytes for s in self.keywords.values())
+
+    def statistics(self) -> List[KeywordStatistics]:
+        """The statistics of each keyword, slowest first."""
+        return sorted(self.keywords.values(), key=lambda s: -s.total_time)
+
+    def report(self) -> str:
+        """A table of the time spent on each keyword, slowest first."""
+        lines = [
+            f"{'keyword':<8} {'count':>6} {'elements':>12} {'MB':>10}"
+            f" {'decode s':>10} {'factory s':>10} {'MB/s':>10}"
+        ]
+        total = KeywordStatistics("total")
+        for stats in self.statistics() + [total]:
+            megabytes = stats.nbytes / 2**20
+            rate = megabytes / stats.total_time if stats.total_time > 0 else 0.0
+            lines.append(
+                f"{stats.keyword.strip():<8} {stats.count:>6} {stats.length:>12}"
+                f" {megabytes:>10.2f} {stats.decode_time:>10.4f}"
+                f" {stats.factory_time:>10.4f} {rate:>10.1f}"
+            )
+            if stats is not total:
+                total.count += stats.count
+                total.length += stats.length
+                total.nbytes += stats.nbytes
+                total.decode_time += stats.decode_time
+                total.factory_time += stats.factory_time
+        return "\n".join(lines)
+
+    def print_report(self, file: Optional[object] = None):
+        """Print :meth:`report`, to stdout by default."""
+        print(self.report(), file=sys.stdout if file is None else file)
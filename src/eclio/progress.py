@@ -0,0 +1,152 @@
+"""
+Progress reporting and cancellation of long reads and writes.
+
+:meth:`eclio.egrid.EGrid.from_file` and :meth:`eclio.egrid.EGrid.to_file`
+accept a ``progress`` callback, which is called with a :class:`Progress`
+between keywords (and between chunks of the global grid arrays when reading,
+and compressed chunks of egridz files when writing), and a
+``cancel`` :class:`CancellationToken`, which is checked at the same points::
+
+    token = CancellationToken()
+    # token.cancel() from another thread stops the read with Cancelled
+    grid = EGrid.from_file(
+        "CASE.EGRID",
+        progress=lambda p: print(f"{p.fraction:.0%}"),
+        cancel=token,
+    )
+
+"""
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+
+class Cancelled(Exception):
+    """Raised when an operation is stopped by its :class:`CancellationToken`."""
+
+
+class CancellationToken:
+    """
+    A thread safe flag for stopping a read or write, which raises
+    :class:`Cancelled` at the next point the flag is checked.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """Raise :class:`Cancelled` if :meth:`cancel` has been called."""
+        if self._event.is_set():
+            raise Cancelled()
+
+
+@dataclass
+class Progress:
+    """
+    The progress of a read or write.
+
+    Args:
+        bytes_done: Bytes of the file read, or bytes of array data
+            written, so far.
+        total_bytes: The total number of bytes, if known.
+        sections_done: The number of file sections (header, global grid,
+            lgr and nnc sections) completed.
+    """
+
+    bytes_done: int
+    total_bytes: Optional[int]
+    sections_done: int
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """The fraction of bytes done, or None if the total is unknown."""
+        if self.total_bytes is None:
+            return None
+        if self.total_bytes == 0:
+            return 1.0
+        return min(1.0, self.bytes_done / self.total_bytes)
+
+
+def file_size(filelike) -> Optional[int]:
+    """The size of the file at the given path or seekable stream, if known."""
+    try:
+        if isinstance(filelike, (str, os.PathLike)):
+            return os.path.getsize(filelike)
+        if hasattr(filelike, "fileno"):
+            return os.fstat(filelike.fileno()).st_size
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+class ProgressTracker:
+    """
+    Keeps count of the progress of an operation, reports it to the
+    progress callback and checks the cancellation token.
+
+    Args:
+        callback: Called with the :class:`Progress` on each update.
+        cancel: Checked on each update.
+        total_bytes: The total number of bytes, if known.
+        section_ends: The number of bytes done at the end of each section,
+            if sections are counted from bytes_done instead of with
+            :meth:`end_section`.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[Progress], None]] = None,
+        cancel: Optional[CancellationToken] = None,
+        total_bytes: Optional[int] = None,
+        section_ends: Optional[Sequence[int]] = None,
+    ):
+        self.callback = callback
+        self.cancel = cancel
+        self.total_bytes = total_bytes
+        self.section_ends = section_ends
+        self.bytes_done = 0
+        self.sections_done = 0
+
+    def check(self):
+        if self.cancel is not None:
+            self.cancel.check()
+
+    def report(self):
+        if self.section_ends is not None:
+            while (
+                self.sections_done < len(self.section_ends)
+                and self.section_ends[self.sections_done] <= self.bytes_done
+            ):
+                self.sections_done += 1
+        if self.callback is not None:
+            self.callback(
+                Progress(self.bytes_done, self.total_bytes, self.sections_done)
+            )
+
+    def update(self, bytes_done: int):
+        """Check for cancellation and report that bytes_done bytes are done."""
+        self.check()
+        self.bytes_done = bytes_done
+        self.report()
+
+    def advance(self, nbytes: int):
+        """Check for cancellation and report nbytes more bytes done."""
+        self.update(self.bytes_done + nbytes)
+
+    def end_section(self):
+        self.sections_done += 1
+        self.report()
+
+    def finish(self):
+        """Report the operation as complete."""
+        if self.total_bytes is not None:
+            self.bytes_done = self.total_bytes
+        self.report()
@@ -0,0 +1,242 @@
+"""
+Consistency checks of egrids, see :meth:`eclio.egrid.EGrid.validate`.
+
+The checks are done in increasing levels of cost:
+
+* "sizes": the sizes of the arrays of each grid match the dimensions in its
+  GRIDHEAD, and the nnc arrays match their header and each other,
+* "indices": additionally, the cell indices of nncs, amalgamations and
+  HOSTNUM are within the grids they refer to,
+* "full": additionally, the LGR parents form a tree, COORD and ZCORN are
+  finite and no cell has its lower corners above its upper corners.
+
+Each check is one vectorised operation per array, except for the cell
+thickness check which goes through ZCORN a chunk of layers at a time.
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .egrid import (
+    AmalgamationSection,
+    CornerPointGrid,
+    EGrid,
+    LGRSection,
+    LGRTree,
+)
+from .geometry import layer_chunks, zcorn_corner_view
+
+VALIDATION_LEVELS = ("sizes", "indices", "full")
+
+
+class EGridValidationError(ValueError):
+    """
+    Raised by :meth:`eclio.egrid.EGrid.validate`.
+
+    Args:
+        problems: Description of each inconsistency found.
+    """
+
+    def __init__(self, problems: Sequence[str]):
+        self.problems = list(problems)
+        super().__init__(
+            f"{len(self.problems)} problems in egrid: " + "; ".join(self.problems)
+        )
+
+
+def _num_cells(grid: CornerPointGrid) -> int:
+    nx, ny, nz = grid.grid_head.dimensions
+    return nx * ny * nz
+
+
+def _grid_name(grid: CornerPointGrid) -> str:
+    if isinstance(grid, LGRSection):
+        return f"LGR {grid.name}"
+    return "global grid"
+
+
+def _size_problems(grid: CornerPointGrid) -> List[str]:
+    name = _grid_name(grid)
+    nx, ny, nz = grid.grid_head.dimensions
+    if min(nx, ny, nz) < 0:
+        return [f"{name} has negative dimensions {(nx, ny, nz)}"]
+    num_cells = nx * ny * nz
+    problems = []
+    # COORD has 6 values per pillar for each reservoir (NUMRES in GRIDHEAD)
+    pillar_size = 6 * (nx + 1) * (ny + 1)
+    if np.size(grid.coord) == 0 or np.size(grid.coord) % pillar_size != 0:
+        problems.append(
+            f"{name} COORD has {np.size(grid.coord)} values, expected a"
+            f" multiple of {pillar_size}"
+        )
+    expected = {
+        "ZCORN": (grid.zcorn, 8 * num_cells),
+        "ACTNUM": (grid.actnum, num_cells),
+    }
+    if isinstance(grid, LGRSection):
+        expected["HOSTNUM"] = (grid.hostnum, num_cells)
+    else:
+        expected["CORSNUM"] = (grid.corsnum, num_cells)
+    for keyword, (values, size) in expected.items():
+        if values is not None and np.size(values) != size:
+            problems.append(
+                f"{name} {keyword} has {np.size(values)} values, expected {size}"
+            )
+    return problems
+
+
+def _nnc_size_problems(number: int, section) -> List[str]:
+    name = f"nnc section {number}"
+    if isinstance(section, AmalgamationSection):
+        if np.size(section.nna1) != np.size(section.nna2):
+            return [
+                f"{name} NNA1 has {np.size(section.nna1)} values but NNA2 has"
+                f" {np.size(section.nna2)}"
+            ]
+        return []
+    problems = []
+    num_nnc = section.nnchead.num_nnc
+    for keyword, values in (
+        ("NNC1", section.upstream_nnc),
+        ("NNC2", section.downstream_nnc),
+    ):
+        if np.size(values) != num_nnc:
+            problems.append(
+                f"{name} {keyword} has {np.size(values)} values, NNCHEAD gives"
+                f" {num_nnc}"
+            )
+    if (section.nncl is None) != (section.nncg is None):
+        problems.append(f"{name} has only one of NNCL and NNCG")
+    elif section.nncl is not None and np.size(section.nncl) != np.size(section.nncg):
+        problems.append(
+            f"{name} NNCL has {np.size(section.nncl)} values but NNCG has"
+            f" {np.size(section.nncg)}"
+        )
+    return problems
+
+
+def _index_problem(name: str, values, num_cells: int) -> Optional[str]:
+    """A problem if values are not one based indices of num_cells cells."""
+    if values is None or np.size(values) == 0:
+        return None
+    lowest, highest = np.min(values), np.max(values)
+    if lowest < 1 or highest > num_cells:
+        return f"{name} has indices in [{lowest}, {highest}] outside [1, {num_cells}]"
+    return None
+
+
+def _grid(grid: EGrid, number: int) -> Optional[CornerPointGrid]:
+    """The grid with the given number as in nnc sections, 0 is the global grid."""
+    if number == 0:
+        return grid.global_grid
+    if 1 <= number <= len(grid.lgr_sections):
+        return grid.lgr_sections[number - 1]
+    return None
+
+
+def _nnc_index_problems(grid: EGrid, number: int, section) -> List[str]:
+    name = f"nnc section {number}"
+    if isinstance(section, AmalgamationSection):
+        checks: List[Tuple[str, int, Optional[np.ndarray]]] = [
+            ("NNA1", section.lgr_idxs[0], section.nna1),
+            ("NNA2", section.lgr_idxs[1], section.nna2),
+        ]
+        if 0 in section.lgr_idxs:
+            return [f"{name} amalgamates LGR number 0"]
+    else:
+        identifier = section.nnchead.grid_identifier
+        checks = [
+            ("NNC1", identifier, section.upstream_nnc),
+            ("NNC2", identifier, section.downstream_nnc),
+            ("NNCL", identifier, section.nncl),
+            ("NNCG", 0, section.nncg),
+        ]
+    problems = []
+    for keyword, grid_number, values in checks:
+        target = _grid(grid, grid_number)
+        if target is None:
+            problems.append(f"{name} {keyword} refers to unknown grid {grid_number}")
+            continue
+        problem = _index_problem(f"{name} {keyword}", values, _num_cells(target))
+        if problem is not None:
+            problems.append(problem)
+    return problems
+
+
+def _hostnum_problems(grid: EGrid) -> List[str]:
+    names = {lgr.name: lgr for lgr in grid.lgr_sections}
+    problems = []
+    for lgr in grid.lgr_sections:
+        parent = lgr.parent
+        if parent is None or not parent.strip():
+            host = grid.global_grid
+        elif parent in names:
+            host = names[parent]
+        else:
+            problems.append(f"LGR {lgr.name} has unknown parent {parent}")
+            continue
+        problem = _index_problem(
+            f"LGR {lgr.name} HOSTNUM", lgr.hostnum, _num_cells(host)
+        )
+        if problem is not None:
+            problems.append(problem)
+    return problems
+
+
+def _geometry_problems(grid: CornerPointGrid) -> List[str]:
+    name = _grid_name(grid)
+    problems = []
+    for keyword, values in (("COORD", grid.coord), ("ZCORN", grid.zcorn)):
+        if not np.isfinite(values).all():
+            problems.append(f"{name} {keyword} has values which are not finite")
+    dims = grid.grid_head.dimensions
+    corners = zcorn_corner_view(grid.zcorn, dims)
+    inverted = 0
+    for k_start, k_stop in layer_chunks(dims):
+        chunk = corners[:, :, k_start:k_stop]
+        inverted += np.count_nonzero(
+            (chunk[:, :, :, 1] < chunk[:, :, :, 0]).any(axis=(-2, -1))
+        )
+    if inverted:
+        problems.append(
+            f"{name} has {inverted} cells with lower corners above upper corners"
+        )
+    return problems
+
+
+def validation_problems(grid: EGrid, level: str = "indices") -> List[str]:
+    """
+    The inconsistencies found in the egrid, see :mod:`eclio.validation` for
+    the checks done at each level.
+
+    Args:
+        grid: The egrid to check.
+        level: One of :data:`VALIDATION_LEVELS`.
+    """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"Unknown validation level {level}, expected one of {VALIDATION_LEVELS}"
+        )
+    grids: List[CornerPointGrid] = [grid.global_grid] + list(grid.lgr_sections)
+    problems = []
+    for corner_point_grid in grids:
+        problems += _size_problems(corner_point_grid)
+    for number, section in enumerate(grid.nnc_sections):
+        problems += _nnc_size_problems(number, section)
+    if level == "sizes" or problems:
+        # Index and geometry checks assume consistent sizes
+        return problems
+    for number, section in enumerate(grid.nnc_sections):
+        problems += _nnc_index_problems(grid, number, section)
+    problems += _hostnum_problems(grid)
+    if level == "indices":
+        return problems
+    try:
+        tree = LGRTree(grid.global_grid, grid.lgr_sections)
+        for lgr in grid.lgr_sections:
+            tree.ancestors(lgr.name)
+    except ValueError as err:
+        problems.append(str(err))
+    for corner_point_grid in grids:
+        problems += _geometry_problems(corner_point_grid)
+    return problems
@@ -1,6 +1,16 @@
-from pkg_resources import DistributionNotFound, get_distribution
+try:
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _distribution_version
+except ImportError:
+    # python < 3.8, pkg_resources is much slower to import
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
+    from pkg_resources import get_distribution
+
+    def _distribution_version(name):
+        return get_distribution(name).version
+
 
 try:
-    version = get_distribution(__name__).version
-except DistributionNotFound:
+    version = _distribution_version("eclio")
+except PackageNotFoundError:
     version = "0.0.0"
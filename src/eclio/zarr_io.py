@@ -0,0 +1,181 @@
+"""
+Storage of egrid files in zarr groups.
+
+This module requires zarr 2, which is an optional dependency of eclio
+(``pip install eclio[zarr]``).
+
+The root group has one subgroup per section of the egrid, named "0", "1",
+... in file order. Each subgroup stores the keywords of the section:
+
+* the large arrays (COORD, ZCORN, ACTNUM, CORSNUM, HOSTNUM and the nnc
+  arrays) as datasets named after the :class:`eclio.egrid.EGrid` fields
+  (coord, zcorn, actnum, ...),
+* the remaining keywords, such as GRIDHEAD, MAPAXES and LGR, as attributes,
+* the order of the keywords in the ``keywords`` attribute.
+
+Per cell arrays are stored in file order as two dimensional datasets with
+one row per layer (two rows per layer for ZCORN and one row per row of
+pillars for COORD), chunked along the rows, so that a range of layers can be
+read without reading the rest of the grid.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import zarr
+
+from .egrid import EGrid, EGridReader, GridHead, keyword_translation
+from .geometry import Box, CHUNK_CELLS
+
+#: Version of the layout of egrid zarr groups.
+ZARR_LAYOUT_VERSION = 1
+
+_DATASET_KEYWORDS = {
+    "COORD   ",
+    "ZCORN   ",
+    "ACTNUM  ",
+    "CORSNUM ",
+    "HOSTNUM ",
+    "NNC1    ",
+    "NNC2    ",
+    "NNCL    ",
+    "NNCG    ",
+    "NNA1    ",
+    "NNA2    ",
+}
+
+
+def _section_keywords(grid: EGrid) -> List[List[Tuple[str, Any]]]:
+    sections = [grid.egrid_head.to_ecl(), grid.global_grid.to_ecl()]
+    sections += [lgr.to_ecl() for lgr in grid.lgr_sections]
+    sections += [nnc.to_ecl() for nnc in grid.nnc_sections]
+    return sections
+
+
+def _rows(keyword: str, size: int, grid_head: Optional[GridHead]) -> int:
+    """The number of rows of the dataset of the given keyword."""
+    if grid_head is None:
+        return 1
+    nx, ny, nz = grid_head.dimensions
+    rows = {
+        "COORD   ": ny + 1,
+        "ZCORN   ": 2 * nz,
+        "ACTNUM  ": nz,
+        "CORSNUM ": nz,
+        "HOSTNUM ": nz,
+    }.get(keyword, 1)
+    if size % rows != 0:
+        return 1
+    return rows
+
+
+def _to_attribute(value) -> List[Any]:
+    array = np.asarray(value).reshape(-1)
+    if array.dtype.kind == "S":
+        return [v.decode("ascii") for v in array.tolist()]
+    return array.tolist()
+
+
+def _from_attribute(value: List[Any]) -> np.ndarray:
+    array = np.asarray(value)
+    if array.dtype.kind == "U":
+        return np.char.encode(array, "ascii")
+    return array
+
+
+def to_zarr(grid: EGrid, store, chunk_cells: int = CHUNK_CELLS, **kwargs):
+    """
+    Write the egrid to a zarr group.
+
+    Args:
+        grid: The egrid to store.
+        store: A zarr store or path, passed to zarr.open_group.
+        chunk_cells: Approximate number of items in each chunk.
+        kwargs: Passed on to zarr.open_group.
+    """
+    root = zarr.open_group(store, mode="w", **kwargs)
+    root.attrs["eclio_zarr_layout"] = ZARR_LAYOUT_VERSION
+    for number, keywords in enumerate(_section_keywords(grid)):
+        group = root.create_group(str(number))
+        attributes: Dict[str, Any] = {}
+        grid_head = None
+        for keyword, value in keywords:
+            if keyword == "GRIDHEAD":
+                grid_head = GridHead.from_ecl(value)
+            if keyword not in _DATASET_KEYWORDS:
+                attributes[keyword] = _to_attribute(value)
+                continue
+            array = np.asarray(value).reshape(-1)
+            rows = _rows(keyword, array.size, grid_head)
+            array = array.reshape((rows, -1))
+            chunk_rows = max(1, min(rows, chunk_cells // max(1, array.shape[1])))
+            chunks = (chunk_rows, max(1, min(array.shape[1], chunk_cells)))
+            group.array(keyword_translation[keyword], array, chunks=chunks)
+        group.attrs["keywords"] = [keyword for keyword, _ in keywords]
+        group.attrs["values"] = attributes
+
+
+class ZarrEntry:
+    """
+    A keyword of a section in an egrid zarr group, with the read_keyword and
+    read_array methods of ecl_data_io entries and read_ranges for reading
+    parts of the array.
+    """
+
+    def __init__(self, keyword: str, group, attributes: Dict[str, Any]):
+        self.keyword = keyword
+        self.group = group
+        self.attributes = attributes
+
+    def read_keyword(self) -> str:
+        return self.keyword
+
+    def _dataset(self):
+        return self.group[keyword_translation[self.keyword]]
+
+    def read_array(self):
+        if self.keyword in self.attributes:
+            return _from_attribute(self.attributes[self.keyword])
+        return self._dataset()[...].reshape(-1)
+
+    def read_ranges(self, ranges: Sequence[Tuple[int, int]]) -> np.ndarray:
+        """
+        The concatenated items in the given [start, stop) ranges, only
+        reading the rows of the dataset which overlap the ranges.
+        """
+        if self.keyword in self.attributes:
+            values = self.read_array()
+            return np.concatenate([values[start:stop] for start, stop in ranges])
+        dataset = self._dataset()
+        row_length = dataset.shape[1]
+        first_row = min(start for start, _ in ranges) // row_length
+        last_row = (max(stop for _, stop in ranges) - 1) // row_length
+        values = dataset[first_row : last_row + 1].reshape(-1)
+        offset = first_row * row_length
+        return np.concatenate(
+            [values[start - offset : stop - offset] for start, stop in ranges]
+        )
+
+
+def from_zarr(store, box: Optional[Box] = None, **kwargs) -> EGrid:
+    """
+    Read an egrid from a zarr group written by :func:`to_zarr`.
+
+    Args:
+        store: A zarr store or path, passed to zarr.open_group.
+        box: Only read the given box of cells of the global grid, see
+            :meth:`eclio.egrid.EGrid.from_file`.
+        kwargs: Passed on to zarr.open_group.
+    """
+    root = zarr.open_group(store, mode="r", **kwargs)
+    layout = root.attrs.get("eclio_zarr_layout")
+    if layout != ZARR_LAYOUT_VERSION:
+        raise ValueError(f"Unsupported egrid zarr layout {layout} in {store}")
+
+    def entries():
+        for number in range(len(root)):
+            group = root[str(number)]
+            attributes = group.attrs["values"]
+            for keyword in group.attrs["keywords"]:
+                yield ZarrEntry(keyword, group, attributes)
+
+    return EGridReader(store, box=box, keywords=entries()).read()
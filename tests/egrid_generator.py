@@ -1,4 +1,5 @@
 import eclio.egrid as eio
+import eclio.geometry as geometry
 import hypothesis.strategies as st
 import numpy as np
 from hypothesis.extra.numpy import arrays
@@ -181,3 +182,115 @@ def egrids(
     nncs=st.lists(nnc_sections, max_size=2),
 ):
     return EGrid(draw(head), draw(global_grid), draw(lgrs), draw(nncs))
+
+
+@st.composite
+def consistent_global_grids(draw, header=grid_heads()):
+    """Global grids where array sizes match the dimensions in grid_head."""
+    grid_head = draw(header)
+    num_cells = grid_head.num_x * grid_head.num_y * grid_head.num_z
+    cell_values = arrays(
+        shape=num_cells,
+        dtype=np.int32,
+        elements=st.integers(min_value=0, max_value=3),
+    )
+    return eio.GlobalGrid(
+        grid_head=grid_head,
+        coord=draw(
+            arrays(
+                shape=(grid_head.num_x + 1) * (grid_head.num_y + 1) * 6,
+                dtype=np.float32,
+                elements=finites,
+            )
+        ),
+        zcorn=draw(zcorns(grid_head.dimensions)),
+        actnum=draw(st.one_of(st.just(None), cell_values)),
+        coord_sys=draw(map_axes),
+        corsnum=draw(st.one_of(st.just(None), cell_values)),
+    )
+
+
+@st.composite
+def boxes(draw, dims):
+    box = []
+    for size in dims:
+        lower = draw(st.integers(min_value=0, max_value=size - 1))
+        upper = draw(st.integers(min_value=lower + 1, max_value=size))
+        box.append((lower, upper))
+    return tuple(box)
+
+
+def regular_global_grid(dims, cell_size=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0)):
+    """A GlobalGrid of box shaped cells with the given size."""
+    nx, ny, nz = dims
+    dx, dy, dz = cell_size
+    x0, y0, z0 = origin
+    x, y = np.meshgrid(
+        x0 + dx * np.arange(nx + 1), y0 + dy * np.arange(ny + 1), indexing="xy"
+    )
+    coord = np.stack(
+        [x, y, np.full_like(x, z0), x, y, np.full_like(x, z0 + dz * nz)], axis=-1
+    )
+    corners = np.empty((nx, ny, nz, 2, 2, 2), dtype=np.float32)
+    depths = z0 + dz * np.arange(nz + 1)
+    corners[...] = depths[None, None, :-1, None, None, None]
+    corners[:, :, :, 1] = depths[None, None, 1:, None, None]
+    return eio.GlobalGrid(
+        grid_head=eio.GridHead(
+            eio.TypeOfGrid.CORNER_POINT,
+            nx,
+            ny,
+            nz,
+            0,
+            1,
+            1,
+            eio.CoordinateType.CARTESIAN,
+            (0, 0, 0),
+            (0, 0, 0),
+        ),
+        coord=coord.astype(np.float32).reshape(-1),
+        zcorn=geometry.corners_to_zcorn(corners),
+        actnum=np.ones(nx * ny * nz, dtype=np.int32),
+    )
+
+
+def regular_egrid(dims, cell_size=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0)):
+    """An EGrid with a :func:`regular_global_grid` and no lgrs or nncs."""
+    return eio.EGrid(
+        eio.EGridHead(
+            eio.Filehead(
+                3,
+                2007,
+                0,
+                eio.TypeOfGrid.CORNER_POINT,
+                RockModel.SINGLE_PERMEABILITY_POROSITY,
+                GridFormat.IRREGULAR_CORNER_POINT,
+            )
+        ),
+        regular_global_grid(dims, cell_size, origin),
+        [],
+        [],
+    )
+
+
+def egrid_with_lgrs(
+    dims=(2, 3, 4), hosts=(24,), cell_size=(1.0, 1.0, 1.0), origin=(0.0, 0.0, 0.0)
+):
+    """
+    A :func:`regular_egrid` with one (2,2,2) LGR, named LGR1, LGR2, ..., for
+    each of the given one based indices of host cells in the global grid.
+    """
+    grid = regular_egrid(dims, cell_size, origin)
+    for number, host in enumerate(hosts, start=1):
+        lgr_grid = regular_global_grid((2, 2, 2))
+        grid.lgr_sections.append(
+            eio.LGRSection(
+                name=f"LGR{number}",
+                grid_head=lgr_grid.grid_head,
+                coord=lgr_grid.coord,
+                zcorn=lgr_grid.zcorn,
+                actnum=lgr_grid.actnum,
+                hostnum=np.full(8, host, dtype=np.int32),
+            )
+        )
+    return grid
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from eclio.egrid import AmalgamationSection, NNCHead, NNCSection
+
+from .egrid_generator import egrid_with_lgrs
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def make_egrid(dims=(2, 3, 4)):
+    grid = egrid_with_lgrs(dims, hosts=(3, 4), cell_size=(1.0, 2.0, 3.0))
+    grid.global_grid.actnum[1] = 0
+    grid.nnc_sections += [
+        NNCSection(
+            NNCHead(2, 0),
+            np.array([1, 2], dtype=np.int32),
+            np.array([5, 6], dtype=np.int32),
+        ),
+        # Connections within LGR1 and between LGR1 and the global grid
+        NNCSection(
+            NNCHead(1, 1),
+            np.array([1], dtype=np.int32),
+            np.array([2], dtype=np.int32),
+            nncl=np.array([1], dtype=np.int32),
+            nncg=np.array([3], dtype=np.int32),
+        ),
+        AmalgamationSection(
+            (1, 2), np.array([4], dtype=np.int32), np.array([7], dtype=np.int32)
+        ),
+    ]
+    return grid
+
+
+@pytest.mark.parametrize("layers_per_chunk", [None, 1, 3])
+def test_to_arrow(layers_per_chunk):
+    grid = make_egrid()
+    table = grid.to_arrow(centres=True, volumes=True, layers_per_chunk=layers_per_chunk)
+
+    assert table.num_rows == 24
+    assert table.column("i").to_pylist()[:4] == [0, 1, 0, 1]
+    assert table.column("j").to_pylist()[:4] == [0, 0, 1, 1]
+    assert table.column("k").to_pylist()[::6] == [0, 1, 2, 3]
+    assert table.column("active").to_pylist()[:3] == [True, False, True]
+    assert table.column("lgr").to_pylist()[:5] == [None, None, "LGR1", "LGR2", None]
+    centres = grid.global_grid.cell_centres().transpose((2, 1, 0, 3))
+    assert np.allclose(table.column("x").to_numpy(), centres[..., 0].reshape(-1))
+    assert np.allclose(table.column("z").to_numpy(), centres[..., 2].reshape(-1))
+    assert np.allclose(table.column("volume").to_numpy(), 6.0)
+
+
+def test_to_arrow_without_geometry():
+    table = make_egrid().to_arrow()
+    assert table.column_names == ["i", "j", "k", "active", "lgr"]
+
+
+def test_to_parquet(tmp_path):
+    grid = make_egrid()
+    path = tmp_path / "grid.parquet"
+    grid.to_parquet(path, volumes=True, layers_per_chunk=1)
+
+    assert pq.ParquetFile(path).num_row_groups == 4
+    assert pq.read_table(path).equals(grid.to_arrow(volumes=True))
+
+
+def test_nnc_to_arrow():
+    table = make_egrid().nnc_to_arrow()
+    assert table.to_pydict() == {
+        "kind": ["nnc", "nnc", "nnc", "global_lgr", "amalgamation"],
+        "grid1": [0, 0, 1, 1, 1],
+        "cell1": [1, 2, 1, 1, 4],
+        "grid2": [0, 0, 1, 0, 2],
+        "cell2": [5, 6, 2, 3, 7],
+    }
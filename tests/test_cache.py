@@ -0,0 +1,206 @@
+import io
+import os
+
+import eclio
+import eclio.egrid as egrid
+import numpy as np
+import pytest
+from eclio.cache import DiskGridCache, egrid_arrays
+from eclio.progress import Cancelled, CancellationToken
+
+from .egrid_generator import regular_egrid
+
+
+def write_grid(path, dims=(2, 3, 2), fileformat="egrid"):
+    grid = regular_egrid(dims)
+    grid.to_file(path, fileformat)
+    return egrid.EGrid.from_file(path, fileformat)
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "fegrid", "egridz", None])
+def test_cached_read_equals_read(tmp_path, fileformat):
+    path = tmp_path / f"CASE.{(fileformat or 'egridz').upper()}"
+    expected = write_grid(path, fileformat=fileformat or "egridz")
+    cache = DiskGridCache(tmp_path / "cache")
+
+    first = egrid.EGrid.from_file(path, fileformat, cache=cache)
+    second = egrid.EGrid.from_file(path, fileformat, cache=cache)
+
+    assert first == expected
+    assert second == expected
+    assert len(cache.entries()) == 1
+    assert not second.global_grid.zcorn.flags.writeable
+
+
+def test_cached_read_of_box(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    box = ((0, 1), (1, 3), (1, 2))
+    cache = DiskGridCache(tmp_path / "cache")
+
+    assert egrid.EGrid.from_file(path, cache=cache, box=box) == egrid.EGrid.from_file(
+        path, box=box
+    )
+
+
+def test_modified_file_gets_new_entry(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    cache = DiskGridCache(tmp_path / "cache")
+    key = cache.key(path)
+    cache.load(path)
+
+    expected = write_grid(path, dims=(3, 3, 3))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.key(path) != key
+    assert cache.load(path) == expected
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    paths = [tmp_path / f"CASE{i}.EGRID" for i in range(3)]
+    for path in paths:
+        write_grid(path)
+    cache = DiskGridCache(tmp_path / "cache")
+    cache.load(paths[0])
+    entry_size = sum(f.stat().st_size for f in cache.entries()[0].iterdir())
+    cache.max_bytes = 2 * entry_size
+
+    cache.load(paths[1])
+    cache.load(paths[0])
+    os.utime(cache.directory / cache.key(paths[1]), (0, 0))
+    cache.load(paths[2])
+
+    assert {e.name for e in cache.entries()} == {
+        cache.key(paths[0]),
+        cache.key(paths[2]),
+    }
+
+
+def test_entry_larger_than_max_bytes_is_kept(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    expected = write_grid(path)
+    cache = DiskGridCache(tmp_path / "cache", max_bytes=0)
+
+    assert cache.load(path) == expected
+    cache.clear()
+    assert cache.entries() == []
+
+
+def test_cache_requires_path(tmp_path):
+    with pytest.raises(ValueError, match="path"):
+        DiskGridCache(tmp_path).load(io.BytesIO())
+
+
+def test_unmapped_arrays_are_writeable(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    cache = DiskGridCache(tmp_path / "cache", mmap=False)
+    cache.load(path)
+    grid = cache.load(path)
+    assert grid.global_grid.zcorn.flags.writeable
+    assert np.array_equal(grid.global_grid.actnum, np.ones(12))
+
+
+def test_grid_cache_returns_same_read_only_grid(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    expected = write_grid(path)
+    cache = eclio.GridCache()
+
+    grid = egrid.EGrid.from_file(path, cache=cache)
+
+    assert grid == expected
+    assert cache.load(str(path)) is grid
+    assert len(cache) == 1
+    assert all(not array.flags.writeable for array in egrid_arrays(grid))
+    with pytest.raises(ValueError):
+        grid.global_grid.actnum[0] = 0
+
+
+def test_grid_cache_reloads_modified_file(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    cache = eclio.GridCache()
+    grid = cache.load(path)
+
+    expected = write_grid(path, dims=(3, 3, 3))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.load(path) == expected
+    assert len(cache) == 1
+    assert cache.nbytes == sum(a.nbytes for a in egrid_arrays(expected))
+    assert cache.load(path) is not grid
+
+
+def test_grid_cache_evicts_least_recently_used(tmp_path):
+    paths = [tmp_path / f"CASE{i}.EGRID" for i in range(3)]
+    for path in paths:
+        write_grid(path)
+    grid_size = sum(a.nbytes for a in egrid_arrays(egrid.EGrid.from_file(paths[0])))
+    cache = eclio.GridCache(max_bytes=2 * grid_size)
+
+    first = cache.load(paths[0])
+    second = cache.load(paths[1])
+    assert cache.load(paths[0]) is first
+    cache.load(paths[2])
+
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * grid_size
+    assert cache.load(paths[0]) is first
+    assert cache.load(paths[1]) is not second
+
+
+def test_grid_cache_does_not_keep_too_large_grid(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    expected = write_grid(path)
+    cache = eclio.GridCache(max_bytes=0)
+    assert cache.load(path) == expected
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_grid_cache_through_disk_cache(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    expected = write_grid(path)
+    disk_cache = DiskGridCache(tmp_path / "cache")
+    cache = eclio.GridCache(disk_cache=disk_cache)
+    assert cache.load(path, box=((0, 1), (0, 1), (0, 1))) == egrid.EGrid.from_file(
+        path, box=((0, 1), (0, 1), (0, 1))
+    )
+    assert cache.load(path) == expected
+    assert len(cache) == 2
+    assert len(disk_cache.entries()) == 1
+
+
+@pytest.mark.parametrize("disk_cache", [False, True])
+def test_grid_cache_forwards_reader_options_on_miss(tmp_path, disk_cache):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    cache = eclio.GridCache(
+        disk_cache=DiskGridCache(tmp_path / "cache") if disk_cache else None
+    )
+    events = []
+    reports = []
+
+    egrid.EGrid.from_file(
+        path, cache=cache, on_keyword=events.append, progress=reports.append
+    )
+    assert "ZCORN   " in [event.keyword for event in events]
+    assert reports and reports[-1].sections_done >= 2
+
+    events.clear()
+    egrid.EGrid.from_file(path, cache=cache, on_keyword=events.append)
+    assert events == []
+
+
+def test_cached_read_can_be_cancelled(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write_grid(path)
+    token = CancellationToken()
+    token.cancel()
+    cache = DiskGridCache(tmp_path / "cache")
+
+    with pytest.raises(Cancelled):
+        egrid.EGrid.from_file(path, cache=cache, cancel=token)
@@ -0,0 +1,108 @@
+import json
+import os
+
+import eclio.catalog as catalog
+import numpy as np
+import pytest
+from eclio.catalog import CATALOG_COLUMNS, scan_directory
+from eclio.ecl_output_file import Units
+
+from .egrid_generator import regular_egrid
+
+
+def write_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    regular_egrid((2, 3, 4)).to_file(root / "a" / "CASE.EGRID")
+    regular_egrid((1, 1, 1)).to_file(root / "a" / "b" / "case.fegrid", "fegrid")
+    (root / "a" / "BROKEN.EGRID").write_bytes(b"not an egrid")
+    (root / "a" / "notes.txt").write_text("not a grid")
+
+
+def test_scan_directory(tmp_path):
+    write_tree(tmp_path)
+
+    table = scan_directory(tmp_path, workers=2)
+
+    assert set(table) == set(CATALOG_COLUMNS)
+    assert [os.path.basename(p) for p in table["path"]] == [
+        "BROKEN.EGRID",
+        "CASE.EGRID",
+        "case.fegrid",
+    ]
+    assert table["format"].tolist() == ["egrid", "egrid", "fegrid"]
+    assert table["nx"].tolist() == [-1, 2, 1]
+    assert table["nz"].tolist() == [-1, 4, 1]
+    assert table["type_of_grid"].tolist() == ["", "CORNER_POINT", "CORNER_POINT"]
+    assert table["num_lgrs"].tolist() == [-1, 0, 0]
+    assert table["error"][0] != ""
+    assert table["error"][1] == ""
+    assert table["size"][1] == (tmp_path / "a" / "CASE.EGRID").stat().st_size
+
+
+def test_scan_empty_directory(tmp_path):
+    table = scan_directory(tmp_path)
+    assert all(len(column) == 0 for column in table.values())
+    assert table["nx"].dtype == np.int64
+
+
+def test_scan_directory_units(tmp_path):
+    grid = regular_egrid((1, 1, 1))
+    grid.egrid_head.mapunits = Units.FEET
+    grid.to_file(tmp_path / "CASE.EGRID")
+
+    table = scan_directory(tmp_path)
+
+    assert table["mapunits"].tolist() == ["FEET"]
+    assert table["gridunit"].tolist() == [""]
+
+
+def test_scan_directory_cache(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    write_tree(root)
+    cache_path = tmp_path / "catalog.json"
+    first = scan_directory(root, cache_path=cache_path)
+
+    probed = []
+    probe_row = catalog._probe_row
+
+    def recording_probe_row(path, *args):
+        probed.append(os.path.basename(path))
+        return probe_row(path, *args)
+
+    monkeypatch.setattr(catalog, "_probe_row", recording_probe_row)
+    second = scan_directory(root, cache_path=cache_path)
+    assert probed == []
+    for name in CATALOG_COLUMNS:
+        assert np.array_equal(first[name], second[name])
+
+    path = root / "a" / "CASE.EGRID"
+    regular_egrid((5, 3, 4)).to_file(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    (root / "a" / "BROKEN.EGRID").unlink()
+    third = scan_directory(root, cache_path=cache_path)
+    assert probed == ["CASE.EGRID"]
+    assert third["nx"].tolist() == [5, 1]
+
+
+@pytest.mark.parametrize("save_interval", [1, 1000])
+def test_interrupted_scan_keeps_probed_rows(tmp_path, monkeypatch, save_interval):
+    root = tmp_path / "root"
+    write_tree(root)
+    cache_path = tmp_path / "catalog.json"
+    probe_row = catalog._probe_row
+    probed = []
+
+    def interrupted_probe_row(path, *args):
+        if len(probed) == 2:
+            raise KeyboardInterrupt()
+        probed.append(path)
+        return probe_row(path, *args)
+
+    monkeypatch.setattr(catalog, "CACHE_SAVE_INTERVAL", save_interval)
+    monkeypatch.setattr(catalog, "_probe_row", interrupted_probe_row)
+    with pytest.raises(KeyboardInterrupt):
+        scan_directory(root, workers=1, cache_path=cache_path)
+
+    with open(cache_path) as stream:
+        assert sorted(json.load(stream)["files"]) == sorted(probed)
@@ -0,0 +1,135 @@
+import io
+import json
+
+import eclio.cli as cli
+import eclio.egrid as egrid
+import numpy as np
+import pytest
+from eclio.cli import main
+from eclio.ecl_output_file import TypeOfGrid
+from eclio.egridz import EGridzEntry
+from eclio.grdecl import write_grdecl
+
+from .egrid_generator import egrid_with_lgrs, regular_egrid
+
+
+@pytest.fixture
+def grid_path(tmp_path):
+    grid = regular_egrid((2, 3, 4), cell_size=(1.0, 2.0, 0.5))
+    grid.global_grid.actnum[0] = 0
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+    return path
+
+
+def test_info(grid_path, capsys):
+    assert main(["info", str(grid_path), "--json"]) == 0
+    info = json.loads(capsys.readouterr().out)
+    assert info["dimensions"] == [2, 3, 4]
+    assert info["type_of_grid"] == "CORNER_POINT"
+    assert info["num_lgrs"] == 0
+    assert info["size"] == grid_path.stat().st_size
+
+
+@pytest.mark.parametrize("extension", ["FEGRID", "egridz", "EGRID"])
+def test_convert(grid_path, tmp_path, extension):
+    destination = tmp_path / f"converted.{extension}"
+    assert main(["convert", str(grid_path), str(destination)]) == 0
+    assert egrid.EGrid.from_file(destination) == egrid.EGrid.from_file(grid_path)
+
+
+@pytest.mark.parametrize("source_format", ["fegrid", "egridz"])
+def test_convert_from(grid_path, tmp_path, source_format):
+    source = tmp_path / f"CASE.{source_format}"
+    egrid.EGrid.from_file(grid_path).to_file(source, source_format)
+    destination = tmp_path / "converted.EGRID"
+    assert main(["convert", str(source), str(destination)]) == 0
+    assert egrid.EGrid.from_file(destination) == egrid.EGrid.from_file(grid_path)
+
+
+def test_convert_to_grdecl(grid_path, tmp_path):
+    destination = tmp_path / "CASE.grdecl"
+    assert main(["convert", str(grid_path), str(destination)]) == 0
+    assert "SPECGRID\n2 3 4 1 F /" in destination.read_text()
+
+
+@pytest.mark.parametrize("source_format", ["egrid", "egridz"])
+def test_convert_to_grdecl_only_reads_global_grid(tmp_path, monkeypatch, source_format):
+    grid = egrid_with_lgrs((2, 3, 4), hosts=(1, 2))
+    source = tmp_path / f"CASE.{source_format}"
+    grid.to_file(source, source_format)
+    read_keywords = []
+    read_array = EGridzEntry.read_array
+    lazy_read = cli.lazy_read
+
+    def spy_read_array(entry):
+        read_keywords.append(entry.read_keyword())
+        return read_array(entry)
+
+    class SpyEntry:
+        def __init__(self, entry):
+            self.entry = entry
+
+        def read_keyword(self):
+            return self.entry.read_keyword()
+
+        def read_array(self):
+            read_keywords.append(self.entry.read_keyword())
+            return self.entry.read_array()
+
+    monkeypatch.setattr(EGridzEntry, "read_array", spy_read_array)
+    monkeypatch.setattr(
+        cli, "lazy_read", lambda *args: (SpyEntry(e) for e in lazy_read(*args))
+    )
+    destination = tmp_path / "CASE.grdecl"
+
+    assert main(["convert", str(source), str(destination)]) == 0
+
+    expected = [kw for kw, _ in grid.egrid_head.to_ecl()]
+    expected += [kw for kw, _ in grid.global_grid.to_ecl()]
+    assert read_keywords == expected
+    written = io.StringIO()
+    write_grdecl(grid, written)
+    assert destination.read_text() == written.getvalue()
+
+
+def test_convert_unknown_extension(grid_path, tmp_path, capsys):
+    assert main(["convert", str(grid_path), str(tmp_path / "CASE.txt")]) == 1
+    assert "--to" in capsys.readouterr().err
+
+
+def test_slice(grid_path, tmp_path):
+    destination = tmp_path / "PART.EGRID"
+    assert main(["slice", str(grid_path), str(destination), "--k", "1:3"]) == 0
+    part = egrid.EGrid.from_file(destination)
+    assert part.global_grid == egrid.EGrid.from_file(grid_path).global_grid.subgrid(
+        ((0, 2), (0, 3), (1, 3))
+    )
+
+
+def test_slice_bad_range(grid_path, tmp_path):
+    with pytest.raises(SystemExit):
+        main(["slice", str(grid_path), str(tmp_path / "PART.EGRID"), "--i", "1"])
+
+
+def test_stats(grid_path, capsys):
+    assert main(["stats", str(grid_path), "--json"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["num_cells"] == 24
+    assert stats["num_active"] == 23
+    assert np.allclose(stats["bounds"], [[0, 0, 0], [2, 6, 2]])
+
+
+def test_missing_file(tmp_path, capsys):
+    assert main(["info", str(tmp_path / "MISSING.EGRID")]) == 1
+    assert "MISSING.EGRID" in capsys.readouterr().err
+
+
+def test_stats_of_unstructured_grid(tmp_path, capsys):
+    grid = regular_egrid((2, 3, 4))
+    grid.egrid_head.file_head.type_of_grid = TypeOfGrid.UNSTRUCTURED
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+
+    assert main(["stats", str(path)]) == 1
+    assert "unstructured" in capsys.readouterr().err
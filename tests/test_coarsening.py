@@ -0,0 +1,125 @@
+import dataclasses
+
+import numpy as np
+import pytest
+from eclio.coarsening import coarse_boxes, coarse_natural_index, coarsen_properties
+
+from .egrid_generator import regular_global_grid
+
+
+def block_corsnum(dims, block):
+    """CORSNUM partitioning a grid of dims into boxes of size block."""
+    nx, ny, nz = dims
+    i, j, k = np.meshgrid(np.arange(nx), np.arange(ny), np.arange(nz), indexing="ij")
+    bi, bj, bk = (i // block[0], j // block[1], k // block[2])
+    cnx = -(-nx // block[0])
+    cny = -(-ny // block[1])
+    coarse = 1 + bi + cnx * (bj + cny * bk)
+    return coarse.transpose((2, 1, 0)).reshape(-1).astype(np.int32)
+
+
+def test_coarsen_properties_aggregations():
+    corsnum = np.array([1, 1, 2, 2, 0])
+    actnum = np.array([1, 1, 1, 0, 1])
+    values = np.array([1.0, 3.0, 5.0, 7.0, 9.0])
+    pore_volume = np.array([1.0, 3.0, 1.0, 1.0, 1.0])
+
+    assert np.array_equal(
+        coarsen_properties(values, corsnum, actnum, how="sum"), [4.0, 5.0]
+    )
+    assert np.array_equal(
+        coarsen_properties(values, corsnum, actnum, how="mean"), [2.0, 5.0]
+    )
+    assert np.array_equal(coarsen_properties(values, corsnum, how="mean"), [2.0, 6.0])
+    assert np.array_equal(
+        coarsen_properties(
+            values, corsnum, actnum, how="pv_weighted", pore_volume=pore_volume
+        ),
+        [2.5, 5.0],
+    )
+
+
+def test_coarsen_properties_of_inactive_coarse_cell():
+    corsnum = np.array([1, 2])
+    actnum = np.array([1, 0])
+    assert np.array_equal(
+        coarsen_properties([1.0, 2.0], corsnum, actnum, how="sum"), [1.0, 0.0]
+    )
+    assert np.isnan(coarsen_properties([1.0, 2.0], corsnum, actnum)[1])
+
+
+def test_coarsen_properties_errors():
+    with pytest.raises(ValueError, match="Unknown aggregation"):
+        coarsen_properties([1.0], [1], how="max")
+    with pytest.raises(ValueError, match="pore_volume"):
+        coarsen_properties([1.0], [1], how="pv_weighted")
+    with pytest.raises(ValueError, match="does not match"):
+        coarsen_properties([1.0, 2.0], [1])
+
+
+def test_coarse_boxes():
+    corsnum = block_corsnum((4, 3, 2), (2, 2, 2))
+    boxes = coarse_boxes(corsnum, (4, 3, 2))
+    assert boxes.tolist() == [
+        [[0, 2], [0, 2], [0, 2]],
+        [[2, 4], [0, 2], [0, 2]],
+        [[0, 2], [2, 3], [0, 2]],
+        [[2, 4], [2, 3], [0, 2]],
+    ]
+
+
+def test_coarse_boxes_must_be_boxes():
+    with pytest.raises(ValueError, match="not boxes"):
+        coarse_boxes(np.array([1, 2, 2, 1]), (2, 2, 1))
+    with pytest.raises(ValueError, match="consecutively"):
+        coarse_boxes(np.array([1, 1, 3, 3]), (2, 2, 1))
+
+
+def test_coarsened_grid_of_regular_grid():
+    grid = dataclasses.replace(
+        regular_global_grid((4, 6, 3), cell_size=(1.0, 2.0, 3.0), origin=(1, 2, 3)),
+        corsnum=block_corsnum((4, 6, 3), (2, 3, 1)),
+    )
+    grid.actnum[: 4 * 6] = 0
+    expected = regular_global_grid(
+        (2, 2, 3), cell_size=(2.0, 6.0, 3.0), origin=(1, 2, 3)
+    )
+    expected.actnum[:4] = 0
+
+    coarse = grid.coarsened_grid()
+
+    assert coarse.grid_head.dimensions == (2, 2, 3)
+    assert np.array_equal(coarse.coord, expected.coord)
+    assert np.array_equal(coarse.zcorn, expected.zcorn)
+    assert np.array_equal(coarse.actnum, expected.actnum)
+
+
+def test_coarsened_grid_with_corsnum_not_in_natural_order():
+    grid = dataclasses.replace(regular_global_grid((2, 1, 1)), corsnum=np.array([2, 1]))
+    grid.actnum[0] = 0
+    values = np.array([10.0, 20.0])
+
+    coarse = grid.coarsened_grid()
+
+    assert coarse_natural_index(grid.corsnum, (2, 1, 1)).tolist() == [1, 0]
+    assert coarse.actnum.tolist() == [0, 1]
+    assert grid.coarsen_properties(values, how="sum").tolist() == [20.0, 0.0]
+    assert grid.coarsen_properties(values, how="sum", natural_order=True).tolist() == [
+        0.0,
+        20.0,
+    ]
+
+
+def test_coarsened_grid_requires_tensor_partition():
+    grid = regular_global_grid((2, 2, 1))
+    with pytest.raises(ValueError, match="no CORSNUM"):
+        grid.coarsened_grid()
+    grid = dataclasses.replace(grid, corsnum=np.array([1, 2, 3, 3]))
+    with pytest.raises(ValueError, match="partition"):
+        grid.coarsened_grid()
+
+
+def test_global_grid_coarsen_properties_uses_actnum():
+    grid = dataclasses.replace(regular_global_grid((2, 1, 1)), corsnum=np.array([1, 1]))
+    grid.actnum[1] = 0
+    assert np.array_equal(grid.coarsen_properties([1.0, 2.0], how="sum"), [1.0])
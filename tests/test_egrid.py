@@ -1,3 +1,4 @@
+import dataclasses
 import io
 
 import ecl_data_io as eclio
@@ -7,7 +8,16 @@ import numpy as np
 import pytest
 from hypothesis import given
 
-from .egrid_generator import egrids, grid_heads
+from .egrid_generator import (
+    boxes,
+    consistent_global_grids,
+    egrid_heads,
+    egrid_with_lgrs,
+    egrids,
+    grid_heads,
+    regular_egrid,
+    regular_global_grid,
+)
 
 
 @given(grid_heads())
@@ -341,3 +351,388 @@ def test_read_multiple_amalgamations():
     reader = egrid.EGridReader(buf)
     grid = reader.read()
     assert len(grid.nnc_sections) == 2
+
+
+@given(egrids())
+def test_world_coord_is_cached(grid):
+    world_coord = grid.world_coord()
+    assert world_coord.shape == grid.global_grid.coord.shape
+    assert world_coord is grid.world_coord()
+    assert not world_coord.flags.writeable
+
+
+def test_world_coord_map_relative():
+    grid = egrid.EGrid(
+        egrid.EGridHead(
+            egrid.Filehead(
+                3,
+                2007,
+                2,
+                egrid.TypeOfGrid.CORNER_POINT,
+                egrid.RockModel.SINGLE_PERMEABILITY_POROSITY,
+                egrid.GridFormat.IRREGULAR_CORNER_POINT,
+            ),
+            mapaxes=egrid.MapAxes((1.0, 2.0), (1.0, 1.0), (2.0, 1.0)),
+            gridunit=egrid.GridUnit(grid_relative=egrid.GridRelative.MAP),
+        ),
+        egrid.GlobalGrid(
+            egrid.GridHead.from_ecl([1] * 33),
+            coord=np.arange(6, dtype=np.float32),
+            zcorn=np.zeros(8, dtype=np.float32),
+        ),
+        [],
+        [],
+    )
+    assert grid.world_coord().tolist() == list(range(6))
+    grid.egrid_head.gridunit = None
+    assert grid.world_coord().tolist() == [1.0, 2.0, 2.0, 4.0, 5.0, 5.0]
+    local = grid.local_coordinates(grid.world_coord().reshape((2, 3)))
+    assert local.reshape(-1).tolist() == list(range(6))
+
+
+@given(consistent_global_grids())
+def test_subgrid_of_everything_is_identity(global_grid):
+    dims = global_grid.grid_head.dimensions
+    assert global_grid.subgrid(tuple((0, size) for size in dims)) == global_grid
+
+
+@given(consistent_global_grids(), st.data())
+def test_subgrid_has_box_dimensions(global_grid, data):
+    box = data.draw(boxes(global_grid.grid_head.dimensions))
+    subgrid = global_grid.subgrid(box)
+    nx, ny, nz = subgrid.grid_head.dimensions
+    assert (nx, ny, nz) == tuple(upper - lower for lower, upper in box)
+    assert subgrid.coord.size == (nx + 1) * (ny + 1) * 6
+    assert subgrid.zcorn.size == 8 * nx * ny * nz
+
+
+def test_subgrid_values():
+    global_grid = egrid.GlobalGrid(
+        grid_head=egrid.GridHead.from_ecl([1, 2, 1, 2] + [0] * 29),
+        coord=np.arange(36, dtype=np.float32),
+        zcorn=np.arange(32, dtype=np.float32),
+        actnum=np.arange(4, dtype=np.int32),
+    )
+    subgrid = global_grid.subgrid(((1, 2), (0, 1), (1, 2)))
+    assert subgrid.coord.tolist() == list(range(6, 18)) + list(range(24, 36))
+    assert subgrid.zcorn.tolist() == [18, 19, 22, 23, 26, 27, 30, 31]
+    assert subgrid.actnum.tolist() == [3]
+    assert subgrid.boxorig == (2, 1, 2)
+
+
+def test_subgrid_offsets_boxorig():
+    global_grid = egrid.GlobalGrid(
+        grid_head=egrid.GridHead.from_ecl([1, 2, 1, 2] + [0] * 29),
+        coord=np.arange(36, dtype=np.float32),
+        zcorn=np.arange(32, dtype=np.float32),
+        boxorig=(3, 4, 5),
+    )
+    assert global_grid.subgrid(((1, 2), (0, 1), (1, 2))).boxorig == (4, 4, 6)
+    assert global_grid.subgrid(((0, 2), (0, 1), (0, 2))).boxorig == (3, 4, 5)
+
+
+def test_subgrid_outside_raises():
+    global_grid = egrid.GlobalGrid(
+        grid_head=egrid.GridHead.from_ecl([1, 2, 1, 2] + [0] * 29),
+        coord=np.arange(36, dtype=np.float32),
+        zcorn=np.arange(32, dtype=np.float32),
+    )
+    with pytest.raises(ValueError, match="outside grid"):
+        global_grid.subgrid(((1, 3), (0, 1), (0, 1)))
+
+
+@given(egrid_heads(), consistent_global_grids(), st.data())
+def test_read_box_is_subgrid(head, global_grid, data):
+    box = data.draw(boxes(global_grid.grid_head.dimensions))
+    grid = egrid.EGrid(head, global_grid, [], [])
+    buff = io.BytesIO()
+    grid.to_file(buff)
+    buff.seek(0)
+
+    boxed = egrid.EGrid.from_file(buff, box=box)
+
+    assert boxed.egrid_head == head
+    assert boxed.global_grid == global_grid.subgrid(box)
+    assert boxed.lgr_sections == []
+
+
+def test_read_box_formatted(tmp_path):
+    grid = egrid.EGrid(
+        egrid.EGridHead(
+            egrid.Filehead(
+                3,
+                2007,
+                2,
+                egrid.TypeOfGrid.CORNER_POINT,
+                egrid.RockModel.SINGLE_PERMEABILITY_POROSITY,
+                egrid.GridFormat.IRREGULAR_CORNER_POINT,
+            )
+        ),
+        egrid.GlobalGrid(
+            grid_head=egrid.GridHead.from_ecl([1, 5, 6, 7] + [0] * 29),
+            coord=np.arange(6 * 7 * 6, dtype=np.float32),
+            zcorn=np.arange(8 * 5 * 6 * 7, dtype=np.float32),
+            actnum=np.arange(5 * 6 * 7, dtype=np.int32),
+        ),
+        [],
+        [],
+    )
+    box = ((1, 4), (2, 5), (3, 7))
+    grid.to_file(tmp_path / "grid.fegrid", "fegrid")
+
+    boxed = egrid.EGrid.from_file(tmp_path / "grid.fegrid", "fegrid", box=box)
+
+    assert boxed.global_grid == grid.global_grid.subgrid(box)
+
+
+@given(consistent_global_grids())
+def test_set_zcorn_corners_inverts_zcorn_corners(global_grid):
+    zcorn = global_grid.zcorn.copy()
+    global_grid.set_zcorn_corners(global_grid.zcorn_corners())
+    assert np.array_equal(global_grid.zcorn, zcorn)
+
+
+def test_set_zcorn_corners_wrong_shape():
+    global_grid = egrid.GlobalGrid(
+        grid_head=egrid.GridHead.from_ecl([1, 2, 1, 2] + [0] * 29),
+        coord=np.arange(36, dtype=np.float32),
+        zcorn=np.arange(32, dtype=np.float32),
+    )
+    with pytest.raises(ValueError, match="does not match"):
+        global_grid.set_zcorn_corners(np.zeros((2, 2, 1, 8)))
+
+
+def lgr(name, dims, hostnum, parent=None):
+    refined = regular_global_grid(dims)
+    return egrid.LGRSection(
+        grid_head=refined.grid_head,
+        coord=refined.coord,
+        zcorn=refined.zcorn,
+        name=name,
+        parent=parent,
+        hostnum=np.asarray(hostnum, dtype=np.int32),
+    )
+
+
+def test_lgr_tree():
+    global_grid = regular_global_grid((2, 2, 1))
+    grid = egrid.EGrid(
+        egrid.EGridHead(
+            egrid.Filehead(
+                3,
+                2007,
+                2,
+                egrid.TypeOfGrid.CORNER_POINT,
+                egrid.RockModel.SINGLE_PERMEABILITY_POROSITY,
+                egrid.GridFormat.IRREGULAR_CORNER_POINT,
+            )
+        ),
+        global_grid,
+        [
+            lgr("A", (2, 2, 1), [2, 2, 2, 2]),
+            lgr("B", (2, 1, 1), [4, 4]),
+            lgr("C", (1, 1, 1), [3], parent="A"),
+        ],
+        [],
+    )
+    tree = grid.lgr_tree
+    assert tree is grid.lgr_tree
+    assert len(tree) == 3
+    assert "C" in tree
+    assert tree["B"] is grid.lgr_sections[1]
+    assert tree.index("C") == 2
+    assert tree.children() == ["A", "B"]
+    assert tree.children("A") == ["C"]
+    assert tree.parent("C") == "A"
+    assert tree.parent("A") is None
+    assert tree.ancestors("C") == ["A"]
+    assert tree.host_lgr().tolist() == [-1, 0, -1, 1]
+    assert tree.host_lgr("A").tolist() == [-1, -1, 2, -1]
+    assert tree.host_lgr("C").tolist() == [-1]
+
+    grid.lgr_sections.pop()
+    assert grid.lgr_tree.children("A") == []
+
+
+def test_lgr_tree_errors():
+    global_grid = regular_global_grid((2, 2, 1))
+    with pytest.raises(ValueError, match="Duplicate"):
+        egrid.LGRTree(global_grid, [lgr("A", (1, 1, 1), [1])] * 2)
+    with pytest.raises(ValueError, match="unknown parent"):
+        egrid.LGRTree(global_grid, [lgr("A", (1, 1, 1), [1], parent="B")])
+
+
+@given(egrids())
+def test_fingerprint_of_file_roundtrip_is_equal(grid):
+    buff = io.BytesIO()
+    grid.to_file(buff)
+    buff.seek(0)
+    assert egrid.EGrid.from_file(buff).fingerprint() == grid.fingerprint()
+
+
+def test_fingerprint_ignores_dtype():
+    grid = regular_global_grid((2, 2, 2))
+    other = dataclasses.replace(
+        grid,
+        coord=grid.coord.astype(np.float64),
+        actnum=grid.actnum.astype(np.int64),
+        boxorig=(np.int32(1), 1, 1),
+    )
+    grid = dataclasses.replace(grid, boxorig=(1, 1, 1))
+    assert grid == other
+    assert grid.fingerprint() == other.fingerprint()
+
+
+def test_fingerprint_differs_on_content():
+    grid = regular_global_grid((2, 2, 2))
+    other = dataclasses.replace(grid, actnum=grid.actnum.copy())
+    other.actnum[0] = 0
+    assert grid.fingerprint() != other.fingerprint()
+    assert grid != other
+
+
+def test_fingerprint_is_cached_until_refresh():
+    grid = regular_global_grid((2, 2, 2))
+    other = dataclasses.replace(grid, actnum=grid.actnum.copy())
+    fingerprint = other.fingerprint()
+    other.actnum[0] = 0
+    assert other.fingerprint() == fingerprint
+    assert other.fingerprint(refresh=True) != fingerprint
+
+    other.actnum = grid.actnum.copy()
+    assert other.fingerprint() == grid.fingerprint()
+
+
+def test_fingerprint_cache_is_not_fooled_by_reused_ids():
+    grid = regular_global_grid((2, 2, 2))
+    other = dataclasses.replace(grid, actnum=grid.actnum.copy())
+    other.actnum[0] = 0
+    grid.fingerprint()
+    other.fingerprint()
+    for _ in range(100):
+        # The freed array's id is likely to be reused by the new copy
+        other.actnum = None
+        other.actnum = grid.actnum.copy()
+        assert other == grid
+
+
+def test_eq_after_modifying_and_restoring_fingerprinted_arrays():
+    grid = regular_egrid((2, 2, 2))
+    other = regular_egrid((2, 2, 2))
+    grid.global_grid.fingerprint()
+    other.global_grid.fingerprint()
+    grid.global_grid.zcorn[0] += 1.0
+    grid.global_grid.fingerprint()
+    grid.global_grid.zcorn[0] -= 1.0
+    assert grid.global_grid == other.global_grid
+    assert grid == other
+
+
+def test_read_fegrid_with_lgr(tmp_path):
+    grid = egrid_with_lgrs((2, 2, 2), hosts=(1,))
+    grid.lgr_sections[0].parent = "LGR0"
+    path = tmp_path / "grid.fegrid"
+    grid.to_file(path, "fegrid")
+
+    (lgr,) = egrid.EGrid.from_file(path, "fegrid").lgr_sections
+    assert lgr.name == "LGR1"
+    assert lgr.parent == "LGR0"
+
+
+@given(egrids(), st.sampled_from(["egrid", "egridz"]))
+def test_probe_matches_read(grid, fileformat):
+    buff = io.BytesIO()
+    grid.to_file(buff, fileformat)
+    buff.seek(0)
+
+    probe = egrid.probe(buff, fileformat)
+
+    assert probe.egrid_head == grid.egrid_head
+    assert probe.grid_head == grid.global_grid.grid_head
+    assert probe.num_lgrs == len(grid.lgr_sections)
+    assert probe.num_nncs == sum(
+        isinstance(nnc, egrid.NNCSection) for nnc in grid.nnc_sections
+    )
+    assert probe.num_amalgamations == sum(
+        isinstance(nnc, egrid.AmalgamationSection) for nnc in grid.nnc_sections
+    )
+
+
+def test_probe_does_not_read_arrays(tmp_path, monkeypatch):
+    path = tmp_path / "grid.EGRID"
+    regular_egrid((3, 3, 3)).to_file(path)
+    read_keywords = []
+    read_array = eclio._unformatted.read.UnformattedEclArray.read_array
+
+    def recording_read_array(entry):
+        read_keywords.append(entry.read_keyword())
+        return read_array(entry)
+
+    monkeypatch.setattr(
+        eclio._unformatted.read.UnformattedEclArray, "read_array", recording_read_array
+    )
+
+    probe = egrid.probe(path)
+
+    assert probe.grid_head.dimensions == (3, 3, 3)
+    assert read_keywords == ["FILEHEAD", "GRIDHEAD"]
+
+
+def test_probe_fegrid(tmp_path):
+    path = tmp_path / "grid.FEGRID"
+    regular_egrid((2, 3, 4)).to_file(path, "fegrid")
+
+    probe = egrid.probe(path)
+
+    assert probe.grid_head.dimensions == (2, 3, 4)
+    assert probe.num_lgrs == 0
+
+
+def test_probe_without_gridhead():
+    buff = io.BytesIO()
+    eclio.write(buff, regular_egrid((1, 1, 1)).egrid_head.to_ecl())
+    buff.seek(0)
+    with pytest.raises(egrid.EGridFileFormatError, match="GRIDHEAD"):
+        egrid.probe(buff)
+
+
+def test_global_grid_bounds_and_layer_depth_stats():
+    grid = regular_global_grid((2, 3, 4), cell_size=(1.0, 2.0, 3.0))
+    grid.actnum[:6] = 0
+
+    assert grid.bounds().tolist() == [[0.0, 0.0, 0.0], [2.0, 6.0, 12.0]]
+    assert grid.layer_depth_stats()[:, 1].tolist() == [1.5, 4.5, 7.5, 10.5]
+    assert np.isnan(grid.layer_depth_stats(active_only=True)[0]).all()
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "fegrid", "egridz"])
+@pytest.mark.parametrize("layers_per_chunk", [None, 1, 3])
+def test_global_grid_statistics(tmp_path, fileformat, layers_per_chunk):
+    grid = egrid_with_lgrs((2, 3, 4), hosts=(1,))
+    grid.global_grid.coord.reshape((-1, 6))[:, 3] += 1.0
+    grid.global_grid.zcorn[:8] -= 0.5
+    grid.global_grid.actnum[:5] = 0
+    path = tmp_path / f"grid.{fileformat}"
+    grid.to_file(path, fileformat)
+
+    statistics = egrid.global_grid_statistics(
+        path, fileformat, layers_per_chunk=layers_per_chunk
+    )
+
+    assert statistics.grid_head == grid.global_grid.grid_head
+    assert statistics.num_active == 19
+    assert np.allclose(statistics.bounds, grid.global_grid.bounds())
+
+
+def test_global_grid_statistics_stops_at_endgrid(tmp_path):
+    path = tmp_path / "grid.EGRID"
+    egrid_with_lgrs((2, 3, 4)).to_file(path)
+    with open(path, "ab") as stream:
+        stream.write(b"not a keyword")
+    with pytest.raises(ValueError):
+        egrid.EGrid.from_file(path)
+
+    statistics = egrid.global_grid_statistics(path)
+
+    assert statistics.num_active == 24
+    assert statistics.bounds.tolist() == [[0.0, 0.0, 0.0], [2.0, 3.0, 4.0]]
@@ -0,0 +1,105 @@
+import io
+
+import eclio.egrid as egrid
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from eclio.egridz import EGridzArchive, EGridzFormatError, is_egridz, write_egridz
+from ecl_data_io import MESS
+from hypothesis import given
+
+from .egrid_generator import egrids, regular_egrid
+
+
+@given(egrids(), st.sampled_from(["egridz", None]))
+def test_to_from_egridz_are_inverse(grid, fileformat):
+    buff = io.BytesIO()
+    grid.to_file(buff, "egridz")
+
+    buff.seek(0)
+    assert grid == egrid.EGrid.from_file(buff, fileformat)
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd", "lz4"])
+def test_compressions(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    if compression == "lz4":
+        pytest.importorskip("lz4")
+    path = tmp_path / "grid.egridz"
+    zcorn = np.repeat(np.arange(1000, dtype=np.float32), 8)
+    write_egridz(path, [("ZCORN   ", zcorn)], compression, chunk_items=3000)
+
+    assert is_egridz(path)
+    assert path.stat().st_size < zcorn.nbytes / 4
+    with EGridzArchive(path) as archive:
+        (entry,) = archive.entries()
+        assert entry.read_keyword() == "ZCORN   "
+        assert np.array_equal(entry.read_array(), zcorn)
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError, match="Unknown egridz compression"):
+        write_egridz(io.BytesIO(), [], "snappy")
+
+
+def test_keyword_types_are_kept():
+    buff = io.BytesIO()
+    write_egridz(
+        buff,
+        [
+            ("LGR     ", ["LGR1"]),
+            ("MAPAXES ", [0.0, 1.0, 0.0, 0.0, 1.0, 0.0]),
+            ("ENDGRID ", MESS),
+            ("ACTNUM  ", np.array([0, 1], dtype=">i4")),
+        ],
+    )
+    buff.seek(0)
+    entries = EGridzArchive(buff).entries()
+    values = [entry.read_array() for entry in entries]
+    assert values[0].tolist() == [b"LGR1"]
+    assert values[1].tolist() == [0.0, 1.0, 0.0, 0.0, 1.0, 0.0]
+    assert values[2] is MESS
+    assert values[3].dtype == np.dtype("<i4")
+
+
+def test_read_ranges_only_decompresses_overlapping_chunks():
+    buff = io.BytesIO()
+    values = np.arange(100, dtype=np.int32)
+    write_egridz(buff, [("ACTNUM  ", values)], chunk_items=10)
+    buff.seek(0)
+    archive = EGridzArchive(buff)
+    read_chunks = []
+    read_chunk = archive.read_chunk
+
+    def counting_read_chunk(offset, size):
+        read_chunks.append(offset)
+        return read_chunk(offset, size)
+
+    archive.read_chunk = counting_read_chunk
+    (entry,) = archive.entries()
+
+    result = entry.read_ranges([(5, 12), (15, 18), (95, 100)])
+
+    assert result.tolist() == list(range(5, 12)) + [15, 16, 17] + list(range(95, 100))
+    assert len(read_chunks) == 3
+    with pytest.raises(ValueError, match="outside"):
+        entry.read_ranges([(95, 101)])
+
+
+def test_read_box_from_egridz(tmp_path):
+    grid = regular_egrid((3, 2, 4))
+    path = tmp_path / "grid.egridz"
+    grid.to_file(path, "egridz")
+    box = ((1, 2), (0, 2), (1, 3))
+    assert egrid.EGrid.from_file(path, box=box).global_grid == (
+        grid.global_grid.subgrid(box)
+    )
+
+
+def test_not_egridz():
+    assert not is_egridz(io.BytesIO(b"not an egridz file"))
+    with pytest.raises(EGridzFormatError, match="not an egridz"):
+        EGridzArchive(io.BytesIO(b"not an egridz file"))
+    with pytest.raises(EGridzFormatError, match="truncated"):
+        EGridzArchive(io.BytesIO(b"EGRIDZ\x00\x01" + bytes(20)))
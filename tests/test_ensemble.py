@@ -0,0 +1,95 @@
+import dataclasses
+
+import numpy as np
+from eclio.egrid import NNCHead, NNCSection
+from eclio.ensemble import GridEnsemble, encode_delta
+from hypothesis import given
+
+from .egrid_generator import egrids, regular_egrid
+
+
+def members():
+    base = regular_egrid((4, 3, 5))
+    same = regular_egrid((4, 3, 5))
+
+    actnum_changed = regular_egrid((4, 3, 5))
+    actnum_changed.global_grid.actnum[[3, 17, 18]] = 0
+
+    layer_changed = regular_egrid((4, 3, 5))
+    layer_changed.global_grid.zcorn[-8 * 12 :] += 1.0
+
+    with_nnc = regular_egrid((4, 3, 5))
+    with_nnc.nnc_sections.append(
+        NNCSection(NNCHead(1, 0), np.array([1], np.int32), np.array([5], np.int32))
+    )
+
+    resized = regular_egrid((2, 2, 2))
+    return base, [same, actnum_changed, layer_changed, with_nnc, resized]
+
+
+def test_ensemble_members_roundtrip():
+    base, grids = members()
+    ensemble = GridEnsemble(base)
+    for grid in grids:
+        ensemble.add(grid)
+
+    assert len(ensemble) == len(grids)
+    for number, grid in enumerate(grids):
+        assert ensemble[number] == grid
+
+
+def test_ensemble_save_load(tmp_path):
+    base, grids = members()
+    ensemble = GridEnsemble(base)
+    for grid in grids:
+        ensemble.add(grid)
+    path = tmp_path / "ensemble.npz"
+    ensemble.save(path, compressed=True)
+
+    loaded = GridEnsemble.load(path)
+
+    assert loaded.base == base
+    assert [loaded[i] for i in range(len(grids))] == grids
+
+
+def test_delta_only_stores_changes():
+    base, (same, actnum_changed, layer_changed, *_) = members()
+
+    assert all(len(kw.values) == 0 for kw in encode_delta(base, same))
+
+    (actnum,) = [
+        kw for kw in encode_delta(base, actnum_changed) if kw.keyword == "ACTNUM  "
+    ]
+    assert actnum.starts.tolist() == [3, 17]
+    assert actnum.stops.tolist() == [4, 19]
+    assert actnum.values.tolist() == [0, 0, 0]
+
+    delta = encode_delta(base, layer_changed)
+    changed = {kw.keyword: len(kw.values) for kw in delta if len(kw.values) > 0}
+    assert changed == {"ZCORN   ": 8 * 12}
+
+
+def test_ensemble_nbytes_is_smaller_than_members():
+    base, grids = members()
+    ensemble = GridEnsemble(base)
+    base_size = ensemble.nbytes
+    for _ in range(10):
+        ensemble.add(grids[1])
+    # two runs of changes in actnum per member
+    assert ensemble.nbytes - base_size == 10 * (4 * 8 + 3 * 4)
+
+
+def test_ensemble_members_share_base_arrays():
+    base, (same, *_) = members()
+    ensemble = GridEnsemble(base)
+    ensemble.add(same)
+    assert not ensemble[0].global_grid.zcorn.flags.writeable
+
+
+@given(egrids(), egrids())
+def test_encode_decode_arbitrary_grids(base, member):
+    ensemble = GridEnsemble(base)
+    ensemble.add(member)
+    ensemble.add(dataclasses.replace(base))
+    assert ensemble[0] == member
+    assert ensemble[1] == base
@@ -0,0 +1,267 @@
+import eclio.geometry as geometry
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+from eclio.ecl_output_file import MapAxes
+from hypothesis import given
+from hypothesis.extra.numpy import arrays
+
+from .ecl_output_generator import finites, map_axes
+from .egrid_generator import regular_global_grid
+
+
+@given(map_axes, arrays(shape=(5, 3), dtype=np.float64, elements=finites))
+def test_to_map_to_local_are_inverse(mapaxes, points):
+    origin, matrix = geometry.map_axes_transform(mapaxes)
+    if abs(np.linalg.det(matrix)) < 1e-3:
+        return
+    roundtrip = geometry.to_local_coordinates(
+        geometry.to_map_coordinates(points, mapaxes), mapaxes
+    )
+    assert np.allclose(roundtrip, points, atol=1e-3)
+
+
+@given(
+    arrays(
+        shape=st.integers(1, 5).map(lambda n: 6 * n), dtype=np.float32, elements=finites
+    )
+)
+def test_identity_mapaxes_is_identity(coord):
+    assert np.array_equal(
+        geometry.coord_to_map_coordinates(coord, MapAxes()),
+        coord.astype(np.float64),
+    )
+
+
+def test_coord_to_map_coordinates():
+    mapaxes = MapAxes(y_line=(10.0, 2.0), origin=(10.0, 1.0), x_line=(9.0, 1.0))
+    coord = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], dtype=np.float32)
+    assert geometry.coord_to_map_coordinates(coord, mapaxes).tolist() == [
+        9.0,
+        3.0,
+        3.0,
+        6.0,
+        6.0,
+        6.0,
+    ]
+
+
+@given(st.tuples(st.integers(1, 4), st.integers(1, 4), st.integers(1, 4)), st.data())
+def test_zcorn_to_corners_corners_to_zcorn_are_inverse(dims, data):
+    zcorn = data.draw(arrays(shape=8 * dims[0] * dims[1] * dims[2], dtype=np.float32))
+    corners = geometry.zcorn_to_corners(zcorn, dims)
+    assert corners.shape == dims + (8,)
+    assert np.array_equal(geometry.corners_to_zcorn(corners), zcorn, equal_nan=True)
+
+
+def test_zcorn_corner_view_is_view():
+    zcorn = np.zeros(8 * 2 * 3 * 4, dtype=np.float32)
+    view = geometry.zcorn_corner_view(zcorn, (2, 3, 4))
+    view[1, 2, 3, 1, 1, 1] = 1.0
+    assert zcorn[-1] == 1.0
+    assert np.shares_memory(view, zcorn)
+
+
+def test_zcorn_to_corners_order():
+    # One cell where each corner has its own z value
+    zcorn = np.arange(8, dtype=np.float32)
+    corners = geometry.zcorn_to_corners(zcorn, (1, 1, 1))
+    assert corners.tolist() == [[[[0, 1, 2, 3, 4, 5, 6, 7]]]]
+
+    # Two cells in the i direction, the values of the first row in zcorn
+    # are left-right of the first cell followed by left-right of the second,
+    # so 0, 1 belong to the first cell and 2, 3 to the second.
+    zcorn = np.arange(16, dtype=np.float32)
+    corners = geometry.zcorn_to_corners(zcorn, (2, 1, 1))
+    assert corners[0, 0, 0].tolist() == [0, 1, 4, 5, 8, 9, 12, 13]
+    assert corners[1, 0, 0].tolist() == [2, 3, 6, 7, 10, 11, 14, 15]
+
+
+def layered_zcorn(dims):
+    """zcorn where layer k lies between depth k and k+1."""
+    corners = np.zeros(dims + (2, 2, 2), dtype=np.float32)
+    corners += np.arange(dims[2], dtype=np.float32)[None, None, :, None, None, None]
+    corners[..., 1, :, :] += 1.0
+    return geometry.corners_to_zcorn(corners)
+
+
+def brute_force_pinchouts(zcorn, dims, tol):
+    nx, ny, nz = dims
+    corners = geometry.zcorn_corner_view(zcorn, dims)
+    result = []
+    for k in range(nz):
+        for j in range(ny):
+            for i in range(nx):
+                cell = corners[i, j, k]
+                if np.all(np.abs(cell[1] - cell[0]) <= tol):
+                    result.append(i + nx * (j + ny * k))
+    return result
+
+
+def brute_force_layer_gaps(zcorn, dims, tol):
+    nx, ny, nz = dims
+    corners = geometry.zcorn_corner_view(zcorn, dims)
+    result = []
+    for k in range(nz - 1):
+        for j in range(ny):
+            for i in range(nx):
+                difference = corners[i, j, k + 1, 0] - corners[i, j, k, 1]
+                if np.any(np.abs(difference) > tol):
+                    result.append(i + nx * (j + ny * k))
+    return result
+
+
+def test_layered_zcorn_has_no_defects():
+    dims = (3, 4, 5)
+    zcorn = layered_zcorn(dims)
+    assert geometry.find_pinchouts(zcorn, dims).tolist() == []
+    assert geometry.find_layer_gaps(zcorn, dims).tolist() == []
+
+
+def test_find_pinchouts_and_gaps():
+    dims = (3, 4, 5)
+    corners = geometry.zcorn_to_corners(layered_zcorn(dims), dims)
+    # pinch out cell (1,2,3)
+    corners[1, 2, 3, 4:] = corners[1, 2, 3, :4]
+    # gap below cell (2,0,1) at one corner
+    corners[2, 0, 2, 1] += 0.5
+    zcorn = geometry.corners_to_zcorn(corners)
+
+    assert geometry.find_pinchouts(zcorn, dims).tolist() == [1 + 3 * (2 + 4 * 3)]
+    assert geometry.find_layer_gaps(zcorn, dims).tolist() == [
+        2 + 3 * 4 * 1,
+        1 + 3 * (2 + 4 * 3),
+    ]
+    assert geometry.find_layer_gaps(zcorn, dims, tol=0.5).tolist() == [
+        1 + 3 * (2 + 4 * 3)
+    ]
+
+
+@given(
+    st.tuples(st.integers(1, 4), st.integers(1, 4), st.integers(1, 4)),
+    st.integers(1, 3),
+    st.data(),
+)
+def test_chunked_defect_search_matches_brute_force(dims, layers_per_chunk, data):
+    zcorn = data.draw(
+        arrays(
+            shape=8 * dims[0] * dims[1] * dims[2],
+            dtype=np.float32,
+            elements=st.sampled_from([0.0, 0.5, 1.0]),
+        )
+    )
+    assert geometry.find_pinchouts(
+        zcorn, dims, 0.1, layers_per_chunk
+    ).tolist() == brute_force_pinchouts(zcorn, dims, 0.1)
+    assert geometry.find_layer_gaps(
+        zcorn, dims, 0.1, layers_per_chunk
+    ).tolist() == brute_force_layer_gaps(zcorn, dims, 0.1)
+
+
+def test_corner_points_of_regular_grid():
+    grid = regular_global_grid((2, 3, 4), cell_size=(1.0, 2.0, 3.0))
+    points = geometry.corner_points(grid.coord, grid.zcorn, (2, 3, 4), 1, 3)
+    assert points.shape == (2, 3, 2, 2, 2, 2, 3)
+    assert points[1, 2, 0, 1, 1, 1].tolist() == [2.0, 6.0, 6.0]
+    assert points[1, 2, 1, 0, 0, 0].tolist() == [1.0, 4.0, 6.0]
+
+
+def test_corner_points_interpolates_pillars():
+    grid = regular_global_grid((1, 1, 1))
+    # tilt all pillars to be at x+1 at depth 1
+    coord = grid.coord.reshape((-1, 6))
+    coord[:, 3] += 1.0
+    points = geometry.corner_points(grid.coord, grid.zcorn, (1, 1, 1))
+    assert points[0, 0, 0, 1, 0, 0].tolist() == [1.0, 0.0, 1.0]
+    assert points[0, 0, 0, 0, 0, 0].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_cell_centres_of_regular_grid():
+    grid = regular_global_grid((2, 3, 4), cell_size=(1.0, 2.0, 3.0))
+    centres = geometry.cell_centres(grid.coord, grid.zcorn, (2, 3, 4))
+    assert centres[1, 2, 3].tolist() == [1.5, 5.0, 10.5]
+
+
+@pytest.mark.parametrize("layers_per_chunk", [None, 1, 3])
+def test_cell_volumes_of_regular_grid(layers_per_chunk):
+    grid = regular_global_grid((2, 3, 4), cell_size=(1.0, 2.0, 3.0))
+    volumes = geometry.cell_volumes(grid.coord, grid.zcorn, (2, 3, 4), layers_per_chunk)
+    assert np.allclose(volumes, 6.0)
+
+
+def test_cell_volumes_of_sheared_cell():
+    grid = regular_global_grid((1, 1, 1))
+    coord = grid.coord.reshape((-1, 6))
+    coord[:, 3] += 1.0
+    assert np.allclose(geometry.cell_volumes(grid.coord, grid.zcorn, (1, 1, 1)), 1.0)
+
+
+def test_cell_volumes_of_cell_with_moved_corner():
+    grid = regular_global_grid((1, 1, 1))
+    geometry.zcorn_corner_view(grid.zcorn, (1, 1, 1))[0, 0, 0, 1, 1, 1] += 2.0
+    assert np.allclose(geometry.cell_volumes(grid.coord, grid.zcorn, (1, 1, 1)), 1.5)
+
+
+@pytest.mark.parametrize("layers_per_chunk", [None, 1, 3])
+def test_grid_bounds_matches_corner_points(layers_per_chunk):
+    dims = (2, 3, 4)
+    grid = regular_global_grid(dims, cell_size=(1.0, 2.0, 3.0))
+    coord = grid.coord.reshape((-1, 6))
+    coord[:, 3] += np.arange(len(coord))
+    coord[:, 5] = 20.0
+    rng = np.random.default_rng(0)
+    grid.zcorn += rng.uniform(-1.0, 1.0, grid.zcorn.shape).astype(np.float32)
+    points = geometry.corner_points(grid.coord, grid.zcorn, dims).reshape((-1, 3))
+
+    bounds = geometry.grid_bounds(grid.coord, grid.zcorn, dims, layers_per_chunk)
+
+    assert np.allclose(bounds, [points.min(axis=0), points.max(axis=0)])
+
+
+def test_grid_bounds_of_memory_mapped_zcorn(tmp_path):
+    dims = (2, 3, 4)
+    grid = regular_global_grid(dims, cell_size=(1.0, 2.0, 3.0))
+    np.save(tmp_path / "zcorn.npy", grid.zcorn)
+    zcorn = np.load(tmp_path / "zcorn.npy", mmap_mode="r")
+    assert geometry.grid_bounds(grid.coord, zcorn, dims).tolist() == [
+        [0.0, 0.0, 0.0],
+        [2.0, 6.0, 12.0],
+    ]
+
+
+@pytest.mark.parametrize("layers_per_chunk", [None, 1, 3])
+def test_layer_depth_stats(layers_per_chunk):
+    dims = (2, 3, 4)
+    grid = regular_global_grid(dims, cell_size=(1.0, 2.0, 3.0))
+    geometry.zcorn_corner_view(grid.zcorn, dims)[0, 0, 1, 1] += 1.5
+    actnum = np.ones(24, dtype=np.int32)
+    actnum[12:18] = 0
+
+    stats = geometry.layer_depth_stats(grid.zcorn, dims, None, layers_per_chunk)
+    active_stats = geometry.layer_depth_stats(
+        grid.zcorn, dims, actnum, layers_per_chunk
+    )
+
+    assert stats[:, 0].tolist() == [0.0, 3.0, 6.0, 9.0]
+    assert stats[:, 2].tolist() == [3.0, 7.5, 9.0, 12.0]
+    assert np.allclose(stats[:, 1], [1.5, 4.5 + 6.0 / 48, 7.5, 10.5])
+    assert np.isnan(active_stats[2]).all()
+    assert np.array_equal(active_stats[[0, 1, 3]], stats[[0, 1, 3]])
+
+
+@pytest.mark.parametrize("layers_per_chunk, workers", [(None, None), (1, 3), (3, 2)])
+def test_face_geometry_of_regular_grid(layers_per_chunk, workers):
+    dims = (2, 3, 4)
+    grid = regular_global_grid(dims, cell_size=(1.0, 2.0, 3.0))
+    faces = geometry.face_geometry(
+        grid.coord, grid.zcorn, dims, layers_per_chunk, workers
+    )
+    expected_area = np.diag([6.0, 3.0, 2.0])
+    expected_distance = np.diag([0.5, 1.0, 1.5])
+    assert np.allclose(faces.area, expected_area)
+    assert np.allclose(faces.centre_to_face, expected_distance)
+    assert np.allclose(faces.neighbour_to_face[0, 0, 0], -expected_distance)
+    assert np.isnan(faces.neighbour_to_face[1, :, :, 0]).all()
+    assert np.isnan(faces.neighbour_to_face[:, 2, :, 1]).all()
+    assert np.isnan(faces.neighbour_to_face[:, :, 3, 2]).all()
+    assert np.allclose(faces.neighbour_to_face[0, :2, :3], -expected_distance)
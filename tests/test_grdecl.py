@@ -0,0 +1,51 @@
+import io
+
+import numpy as np
+from eclio.ecl_output_file import CoordinateType, GridUnit, MapAxes, Units
+from eclio.grdecl import write_grdecl
+
+from .egrid_generator import regular_egrid
+
+
+def keyword_values(text, keyword):
+    """The values of the keyword in the grdecl text."""
+    start = text.index(f"{keyword}\n") + len(keyword) + 1
+    return text[start : text.index("/", start)].split()
+
+
+def test_write_grdecl():
+    grid = regular_egrid((2, 3, 4))
+    grid.egrid_head.mapunits = Units.METRES
+    grid.egrid_head.mapaxes = MapAxes((0.0, 1.5), (0.0, 0.0), (1.0, 0.0))
+    grid.egrid_head.gridunit = GridUnit()
+    stream = io.StringIO()
+
+    write_grdecl(grid, stream)
+
+    text = stream.getvalue()
+    assert keyword_values(text, "SPECGRID") == ["2", "3", "4", "1", "F"]
+    assert keyword_values(text, "MAPUNITS") == ["'METRES'"]
+    assert keyword_values(text, "MAPAXES") == ["0", "1.5", "0", "0", "1", "0"]
+    assert np.array_equal(
+        np.array(keyword_values(text, "COORD"), dtype=np.float32),
+        grid.global_grid.coord,
+    )
+    assert np.array_equal(
+        np.array(keyword_values(text, "ZCORN"), dtype=np.float32),
+        grid.global_grid.zcorn,
+    )
+    assert np.array_equal(
+        np.array(keyword_values(text, "ACTNUM"), dtype=np.int32),
+        grid.global_grid.actnum,
+    )
+
+
+def test_specgrid_from_grid_head():
+    grid = regular_egrid((2, 3, 4))
+    grid.global_grid.grid_head.numres = 2
+    grid.global_grid.grid_head.coordinate_type = CoordinateType.CYLINDRICAL
+    stream = io.StringIO()
+
+    write_grdecl(grid, stream)
+
+    assert keyword_values(stream.getvalue(), "SPECGRID") == ["2", "3", "4", "2", "T"]
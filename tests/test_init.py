@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import eclio
+import pytest
+
+
+def imported_modules(statement):
+    """The top level modules imported by running statement in a new python."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    output = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        check=True,
+        stdout=subprocess.PIPE,
+        env=env,
+        universal_newlines=True,
+    ).stdout
+    return {name.split(".")[0] for name in output.split()}
+
+
+@pytest.mark.parametrize(
+    "statement", ["import eclio", "from eclio.ecl_output_file import Units"]
+)
+def test_import_does_not_import_heavy_dependencies(statement):
+    modules = imported_modules(statement)
+    assert "numpy" not in modules
+    assert "ecl_data_io" not in modules
+    assert "pkg_resources" not in modules
+
+
+def test_lazy_attributes():
+    from eclio.cache import GridCache
+    from eclio.egrid import probe
+
+    assert eclio.GridCache is GridCache
+    assert eclio.probe is probe
+    assert isinstance(eclio.__version__, str)
+    assert "scan_directory" in dir(eclio)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        eclio.no_such_name
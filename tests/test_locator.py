@@ -0,0 +1,109 @@
+import hypothesis.strategies as st
+import numpy as np
+from eclio.egrid import LGRSection
+from eclio.locator import GridLocator
+from hypothesis import given
+from hypothesis.extra.numpy import arrays
+
+from .egrid_generator import regular_global_grid
+
+
+def natural_index(dims, i, j, k):
+    return i + dims[0] * (j + dims[1] * k)
+
+
+def test_locate_cell_centres():
+    dims = (3, 4, 5)
+    grid = regular_global_grid(dims, cell_size=(1.0, 2.0, 3.0), origin=(10, 20, 30))
+    centres = grid.cell_centres().transpose((2, 1, 0, 3)).reshape((-1, 3))
+    assert GridLocator(grid).locate(centres).tolist() == list(range(3 * 4 * 5))
+
+
+def test_locate_outside():
+    grid = regular_global_grid((2, 2, 2))
+    points = [[-1.0, 0.5, 0.5], [0.5, 0.5, 2.5], [3.0, 3.0, 3.0]]
+    assert GridLocator(grid).locate(points).tolist() == [-1, -1, -1]
+
+
+@given(
+    arrays(
+        shape=(20, 3),
+        dtype=np.float64,
+        elements=st.floats(min_value=0.01, max_value=3.99),
+    )
+)
+def test_locate_matches_regular_grid_index(points):
+    dims = (4, 4, 4)
+    grid = regular_global_grid(dims)
+    cells = np.floor(points).astype(int)
+    expected = natural_index(dims, cells[:, 0], cells[:, 1], cells[:, 2])
+    on_face = np.any(np.abs(points - np.round(points)) < 1e-5, axis=1)
+    located = GridLocator(grid).locate(points)
+    assert np.array_equal(located[~on_face], expected[~on_face])
+
+
+def test_locate_shared_corner_gives_lowest_index():
+    grid = regular_global_grid((2, 2, 2))
+    points = [[1.0, 1.0, 1.0], [1.0, 0.5, 0.5], [0.5, 1.5, 2.0]]
+    assert GridLocator(grid).locate(points).tolist() == [0, 0, 6]
+
+
+def test_locate_skewed_cells():
+    dims = (2, 1, 1)
+    grid = regular_global_grid(dims)
+    # shear the grid so that x increases by 1 from top to bottom
+    grid.coord.reshape((-1, 6))[:, 3] += 1.0
+    locator = GridLocator(grid)
+    assert locator.locate([[1.2, 0.5, 0.1], [1.2, 0.5, 0.9]]).tolist() == [1, 0]
+
+
+def test_locate_refined():
+    dims = (2, 1, 1)
+    grid = regular_global_grid(dims)
+    refined = regular_global_grid(
+        (2, 2, 2), cell_size=(0.5, 0.5, 0.5), origin=(1, 0, 0)
+    )
+    lgr = LGRSection(
+        grid_head=refined.grid_head,
+        coord=refined.coord,
+        zcorn=refined.zcorn,
+        name="LGR1",
+        hostnum=np.full(8, 2, dtype=np.int32),
+    )
+    locator = GridLocator(grid, [lgr])
+    lgr_indices, cell_indices = locator.locate_refined(
+        [[0.5, 0.5, 0.5], [1.75, 0.25, 0.75], [5.0, 0.0, 0.0]]
+    )
+    assert lgr_indices.tolist() == [-1, 0, -1]
+    assert cell_indices.tolist() == [0, 1 + 2 * 2, -1]
+    assert locator.lgr_tree.host_lgr().tolist() == [-1, 0]
+
+
+def test_locate_nested_refined():
+    grid = regular_global_grid((1, 1, 1))
+    refined = regular_global_grid((2, 1, 1), cell_size=(0.5, 1.0, 1.0))
+    nested = regular_global_grid(
+        (1, 1, 2), cell_size=(0.5, 1.0, 0.5), origin=(0.5, 0, 0)
+    )
+    lgrs = [
+        LGRSection(
+            grid_head=refined.grid_head,
+            coord=refined.coord,
+            zcorn=refined.zcorn,
+            name="OUTER",
+            hostnum=np.array([1, 1], dtype=np.int32),
+        ),
+        LGRSection(
+            grid_head=nested.grid_head,
+            coord=nested.coord,
+            zcorn=nested.zcorn,
+            name="INNER",
+            parent="OUTER",
+            hostnum=np.array([2, 2], dtype=np.int32),
+        ),
+    ]
+    lgr_indices, cell_indices = GridLocator(grid, lgrs).locate_refined(
+        [[0.25, 0.5, 0.5], [0.75, 0.5, 0.75]]
+    )
+    assert lgr_indices.tolist() == [0, 1]
+    assert cell_indices.tolist() == [0, 1]
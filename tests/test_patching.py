@@ -0,0 +1,108 @@
+import eclio.egrid as egrid
+import numpy as np
+import pytest
+from ecl_data_io import lazy_read, write
+from eclio.ecl_output_file import MapAxes
+from eclio.patching import patch
+
+from .egrid_generator import egrid_with_lgrs
+
+NEW_MAPAXES = MapAxes((0.0, 10.0), (5.0, 5.0), (10.0, 5.0))
+
+
+@pytest.fixture
+def grid():
+    grid = egrid_with_lgrs((2, 3, 4), hosts=(24,))
+    grid.egrid_head.mapaxes = MapAxes()
+    return grid
+
+
+def test_patch_in_place(tmp_path, grid):
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+    size = path.stat().st_size
+    actnum = np.arange(24, dtype=np.int32) % 2
+
+    patch(path, actnum=actnum, mapaxes=NEW_MAPAXES)
+
+    assert path.stat().st_size == size
+    patched = egrid.EGrid.from_file(path)
+    np.testing.assert_array_equal(patched.global_grid.actnum, actnum)
+    assert patched.egrid_head.mapaxes == NEW_MAPAXES
+    np.testing.assert_array_equal(patched.global_grid.zcorn, grid.global_grid.zcorn)
+    np.testing.assert_array_equal(
+        patched.lgr_sections[0].actnum, grid.lgr_sections[0].actnum
+    )
+
+
+def test_patch_only_changes_patched_records(tmp_path, grid):
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+    before = path.read_bytes()
+
+    patch(path, actnum=np.zeros(24, dtype=np.int32))
+
+    after = path.read_bytes()
+    changed = np.flatnonzero(
+        np.frombuffer(before, dtype=np.uint8) != np.frombuffer(after, dtype=np.uint8)
+    )
+    actnum_start = before.index(b"ACTNUM  ")
+    assert changed.min() > actnum_start
+    assert changed.max() < actnum_start + 24 * 4 + 32
+
+
+def test_patch_inserts_missing_keywords(tmp_path, grid):
+    grid.egrid_head.mapaxes = None
+    grid.global_grid.actnum = None
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+    actnum = np.ones(24, dtype=np.int32)
+    actnum[0] = 0
+
+    patch(path, actnum=actnum, mapaxes=NEW_MAPAXES)
+
+    patched = egrid.EGrid.from_file(path)
+    np.testing.assert_array_equal(patched.global_grid.actnum, actnum)
+    assert patched.egrid_head.mapaxes == NEW_MAPAXES
+    assert patched.lgr_sections[0].name == "LGR1"
+    mapaxes_type = next(
+        entry.read_type()
+        for entry in lazy_read(path)
+        if entry.read_keyword() == "MAPAXES "
+    )
+    assert mapaxes_type == b"REAL"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_patch_wrong_actnum_size(tmp_path, grid):
+    path = tmp_path / "CASE.EGRID"
+    grid.to_file(path)
+    before = path.read_bytes()
+
+    with pytest.raises(ValueError, match="actnum has shape"):
+        patch(path, actnum=np.ones(23, dtype=np.int32), mapaxes=NEW_MAPAXES)
+
+    assert path.read_bytes() == before
+
+
+def test_patch_formatted_file(tmp_path, grid):
+    path = tmp_path / "CASE.FEGRID"
+    grid.to_file(path, "fegrid")
+
+    with pytest.raises(ValueError, match="unformatted"):
+        patch(path, mapaxes=NEW_MAPAXES)
+
+
+def test_patch_without_header_anchor(tmp_path):
+    path = tmp_path / "CASE.EGRID"
+    write(path, [("FILEHEAD", np.zeros(100, dtype=np.int32)), ("ENDGRID ", [])])
+
+    with pytest.raises(ValueError, match="insert MAPAXES"):
+        patch(path, mapaxes=NEW_MAPAXES)
+
+
+def test_patch_is_a_function_after_importing_module():
+    import eclio
+    import eclio.patching
+
+    assert eclio.patch is eclio.patching.patch
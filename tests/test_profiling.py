@@ -0,0 +1,60 @@
+import io
+
+import eclio.egrid as egrid
+from eclio.profiling import KeywordEvent, ReadProfile
+
+from .egrid_generator import regular_egrid
+
+
+def test_keyword_events(tmp_path):
+    path = tmp_path / "grid.EGRID"
+    regular_egrid((2, 3, 4)).to_file(path)
+    events = []
+
+    grid = egrid.EGrid.from_file(path, on_keyword=events.append)
+
+    assert grid == regular_egrid((2, 3, 4))
+    by_keyword = {event.keyword: event for event in events}
+    assert set(by_keyword) == {
+        kw
+        for section in [grid.egrid_head, grid.global_grid]
+        for kw, _ in section.to_ecl()
+    } - {"ENDGRID "}
+    zcorn = by_keyword["ZCORN   "]
+    assert zcorn.length == 8 * 2 * 3 * 4
+    assert zcorn.nbytes == 4 * zcorn.length
+    assert zcorn.decode_time >= 0.0
+    assert zcorn.factory_time >= 0.0
+
+
+def test_keyword_events_of_box(tmp_path):
+    path = tmp_path / "grid.EGRID"
+    regular_egrid((2, 3, 4)).to_file(path)
+    events = []
+
+    egrid.EGrid.from_file(path, box=((0, 1), (0, 3), (1, 3)), on_keyword=events.append)
+
+    (zcorn,) = [event for event in events if event.keyword == "ZCORN   "]
+    assert zcorn.length == 8 * 1 * 3 * 2
+
+
+def test_read_profile():
+    profile = ReadProfile()
+    profile(KeywordEvent("ZCORN   ", 8, 32, 1.0, 0.5))
+    profile(KeywordEvent("ZCORN   ", 8, 32, 2.0, 0.5))
+    profile(KeywordEvent("COORD   ", 6, 24, 0.5, 0.0))
+
+    zcorn, coord = profile.statistics()
+    assert zcorn.keyword == "ZCORN   "
+    assert (zcorn.count, zcorn.length, zcorn.nbytes) == (2, 16, 64)
+    assert zcorn.total_time == 4.0
+    assert coord.keyword == "COORD   "
+    assert profile.decode_time == 3.5
+    assert profile.factory_time == 1.0
+    assert profile.nbytes == 88
+
+    stream = io.StringIO()
+    profile.print_report(stream)
+    lines = stream.getvalue().splitlines()
+    assert lines[1].split()[:3] == ["ZCORN", "2", "16"]
+    assert lines[-1].split()[:4] == ["total", "3", "22", "0.00"]
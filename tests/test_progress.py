@@ -0,0 +1,129 @@
+import io
+
+import eclio.egrid as egrid
+import numpy as np
+import pytest
+from eclio.ecl_output_file import Units
+from eclio.egridz import write_egridz
+from eclio.progress import Cancelled, CancellationToken, Progress, ProgressTracker
+
+from .egrid_generator import egrid_with_lgrs, regular_egrid
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "fegrid", "egridz"])
+def test_read_progress(tmp_path, fileformat):
+    path = tmp_path / f"grid.{fileformat}"
+    grid = regular_egrid((2, 3, 4))
+    grid.to_file(path, fileformat)
+    reports = []
+
+    assert egrid.EGrid.from_file(path, fileformat, progress=reports.append) == grid
+
+    done = [report.bytes_done for report in reports]
+    assert done == sorted(done)
+    assert [report.sections_done for report in reports][-1] == 2
+    if fileformat != "egridz":
+        assert reports[-1].bytes_done == path.stat().st_size
+        assert reports[-1].fraction == 1.0
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "fegrid", "egridz"])
+def test_write_progress(tmp_path, fileformat):
+    grid = egrid_with_lgrs((2, 3, 4), hosts=(1, 2))
+    grid.egrid_head.mapunits = Units.METRES
+    reports = []
+
+    grid.to_file(tmp_path / "grid", fileformat, progress=reports.append)
+
+    total = reports[-1].total_bytes
+    assert total >= grid.global_grid.zcorn.nbytes + grid.global_grid.coord.nbytes
+    # All bytes and sections are counted before the final report of finish()
+    assert reports[-2] == Progress(total, total, 4)
+    assert reports[-1] == Progress(total, total, 4)
+    assert [r.bytes_done for r in reports] == sorted(r.bytes_done for r in reports)
+
+
+def test_write_egridz_progress_per_chunk():
+    reports = []
+    zcorn = np.zeros(1000, dtype=np.float32)
+    tracker = ProgressTracker(reports.append, total_bytes=zcorn.nbytes)
+
+    write_egridz(io.BytesIO(), [("ZCORN   ", zcorn)], chunk_items=100, tracker=tracker)
+
+    assert [r.bytes_done for r in reports] == list(range(400, 4001, 400))
+
+
+def test_cancelled_token():
+    token = CancellationToken()
+    token.check()
+    token.cancel()
+    assert token.cancelled
+    with pytest.raises(Cancelled):
+        token.check()
+
+
+def test_cancel_read(tmp_path):
+    path = tmp_path / "grid.EGRID"
+    regular_egrid((2, 3, 4)).to_file(path)
+    token = CancellationToken()
+
+    def cancel_in_global_grid(progress):
+        if progress.sections_done == 1:
+            token.cancel()
+
+    with pytest.raises(Cancelled):
+        egrid.EGrid.from_file(path, progress=cancel_in_global_grid, cancel=token)
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "egridz"])
+def test_cancel_write_removes_file(tmp_path, fileformat):
+    path = tmp_path / "grid"
+    token = CancellationToken()
+
+    def cancel_halfway(progress):
+        if progress.fraction >= 0.5:
+            token.cancel()
+
+    with pytest.raises(Cancelled):
+        regular_egrid((20, 20, 20)).to_file(
+            path, fileformat, progress=cancel_halfway, cancel=token
+        )
+    assert not path.exists()
+
+
+def test_cancel_write_to_stream():
+    token = CancellationToken()
+    token.cancel()
+    buff = io.BytesIO()
+    with pytest.raises(Cancelled):
+        regular_egrid((2, 3, 4)).to_file(buff, cancel=token)
+    assert len(buff.getvalue()) == 0
+
+
+def test_progress_fraction():
+    assert Progress(5, None, 0).fraction is None
+    assert Progress(0, 0, 0).fraction == 1.0
+    assert np.isclose(Progress(1, 4, 0).fraction, 0.25)
+
+
+@pytest.mark.parametrize("fileformat", ["egrid", "egridz"])
+def test_cancel_read_within_zcorn(tmp_path, monkeypatch, fileformat):
+    monkeypatch.setattr(egrid, "CHUNK_CELLS", 100)
+    path = tmp_path / "grid"
+    regular_egrid((10, 10, 10)).to_file(path, fileformat)
+    token = CancellationToken()
+    range_reads = []
+
+    def read_ranges(entry, ranges):
+        range_reads.append(entry.read_keyword())
+        if range_reads.count("ZCORN   ") == 3:
+            token.cancel()
+        return original_read_ranges(entry, ranges)
+
+    original_read_ranges = egrid._read_ranges
+    monkeypatch.setattr(egrid, "_read_ranges", read_ranges)
+
+    with pytest.raises(Cancelled):
+        egrid.EGrid.from_file(path, fileformat, cancel=token)
+    assert range_reads[-1] == "ZCORN   "
+    assert range_reads.count("ZCORN   ") == 3
@@ -0,0 +1,91 @@
+import eclio.egrid as egrid
+import numpy as np
+import pytest
+from eclio.validation import EGridValidationError, validation_problems
+
+from .egrid_generator import egrid_with_lgrs
+
+
+@pytest.fixture
+def grid():
+    grid = egrid_with_lgrs((2, 3, 4), hosts=(24,))
+    grid.nnc_sections += [
+        egrid.NNCSection(
+            egrid.NNCHead(2, 0),
+            np.array([1, 2], dtype=np.int32),
+            np.array([23, 24], dtype=np.int32),
+        ),
+        egrid.NNCSection(
+            egrid.NNCHead(1, 1),
+            np.array([1], dtype=np.int32),
+            np.array([2], dtype=np.int32),
+            np.array([1, 8], dtype=np.int32),
+            np.array([23, 24], dtype=np.int32),
+        ),
+        egrid.AmalgamationSection(
+            (1, 1), np.array([1], dtype=np.int32), np.array([8], dtype=np.int32)
+        ),
+    ]
+    return grid
+
+
+@pytest.mark.parametrize("level", ["sizes", "indices", "full"])
+def test_consistent_grid_is_valid(grid, level):
+    grid.validate(level)
+    assert validation_problems(grid, level) == []
+
+
+def test_unknown_level(grid):
+    with pytest.raises(ValueError, match="level"):
+        grid.validate("thorough")
+
+
+def test_size_problems(grid):
+    grid.global_grid.zcorn = grid.global_grid.zcorn[:-8]
+    grid.lgr_sections[0].hostnum = np.ones(7, dtype=np.int32)
+    grid.nnc_sections[0].nnchead = egrid.NNCHead(3, 0)
+
+    with pytest.raises(EGridValidationError) as error:
+        grid.validate("sizes")
+
+    assert len(error.value.problems) == 4
+    assert "global grid ZCORN has 184 values, expected 192" in error.value.problems
+    assert "LGR LGR1 HOSTNUM has 7 values, expected 8" in error.value.problems
+
+
+def test_index_problems(grid):
+    grid.nnc_sections[0].downstream_nnc[1] = 25
+    grid.nnc_sections[1].nncl[0] = 0
+    grid.lgr_sections[0].hostnum[0] = 30
+
+    assert validation_problems(grid, "sizes") == []
+    problems = validation_problems(grid, "indices")
+    assert problems == [
+        "nnc section 0 NNC2 has indices in [23, 25] outside [1, 24]",
+        "nnc section 1 NNCL has indices in [0, 8] outside [1, 8]",
+        "LGR LGR1 HOSTNUM has indices in [24, 30] outside [1, 24]",
+    ]
+
+
+def test_unknown_grid(grid):
+    grid.nnc_sections[0].nnchead = egrid.NNCHead(2, 2)
+    grid.nnc_sections[2].lgr_idxs = (1, 3)
+
+    problems = validation_problems(grid)
+
+    assert "nnc section 0 NNC1 refers to unknown grid 2" in problems
+    assert "nnc section 2 NNA2 refers to unknown grid 3" in problems
+
+
+def test_geometry_problems(grid):
+    grid.global_grid.coord[0] = np.nan
+    egrid.zcorn_corner_view(grid.global_grid.zcorn, (2, 3, 4))[1, 1, 1, 1] -= 2.0
+    grid.lgr_sections[0].parent = "LGR1"
+    grid.lgr_sections[0].hostnum[:] = 1
+
+    assert validation_problems(grid, "indices") == []
+    assert validation_problems(grid, "full") == [
+        "Cycle in LGR parents of LGR1",
+        "global grid COORD has values which are not finite",
+        "global grid has 1 cells with lower corners above upper corners",
+    ]
@@ -0,0 +1,46 @@
+import pytest
+from eclio.egrid import EGrid
+from hypothesis import HealthCheck, given, settings
+
+from .egrid_generator import egrids, regular_egrid
+
+zarr = pytest.importorskip("zarr")
+
+
+@settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+@given(egrids())
+def test_to_from_zarr_are_inverse(tmp_path, grid):
+    store = str(tmp_path / "grid.zarr")
+    grid.to_zarr(store)
+    assert EGrid.from_zarr(store) == grid
+
+
+def test_zarr_datasets_are_chunked_along_layers():
+    grid = regular_egrid((3, 4, 5))
+    store = zarr.MemoryStore()
+    grid.to_zarr(store, chunk_cells=24)
+
+    group = zarr.open_group(store, mode="r")["1"]
+    assert group["zcorn"].shape == (10, 48)
+    assert group["zcorn"].chunks == (1, 24)
+    assert group["actnum"].shape == (5, 12)
+    assert group["actnum"].chunks == (2, 12)
+    assert group["coord"].shape == (5, 24)
+    assert group.attrs["values"]["GRIDHEAD"][1:4] == [3, 4, 5]
+
+
+def test_read_box_from_zarr():
+    grid = regular_egrid((3, 4, 5))
+    global_grid = grid.global_grid
+    global_grid.actnum[::3] = 0
+    store = zarr.MemoryStore()
+    grid.to_zarr(store, chunk_cells=12)
+    box = ((1, 3), (1, 2), (2, 4))
+    assert EGrid.from_zarr(store, box=box).global_grid == global_grid.subgrid(box)
+
+
+def test_from_zarr_requires_egrid_layout():
+    store = zarr.MemoryStore()
+    zarr.open_group(store, mode="w")
+    with pytest.raises(ValueError, match="layout"):
+        EGrid.from_zarr(store)